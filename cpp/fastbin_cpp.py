@@ -1,12 +1,140 @@
-import json
+import filecmp
+import hashlib
 import os
+import re
 import sys
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from string import Template
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+try:
+    # optional, considerably faster for large schemas
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
 
 prefix = "_"  # prefix for internally generated functions
 
+# stores the digest of schema and generator used for the generated files
+CACHE_FILE_NAME = ".fastbin.cache"
+
+# schemas with fewer enums/structs are generated serially, process startup would dominate
+PARALLEL_MIN_TYPES = 64
+
+_CONTAINER_RE = re.compile(r"^(vector)<(.+)>$")  # vector<T>
+
+_MEMBER_NAME = "\x00member\x00"  # placeholder for member names in cached code templates
+
+# includes required by every generated struct header
+_STRUCT_SYS_INCLUDES = (
+    "#include <cstddef>",
+    "#include <cassert>",
+    "#include <cstdint>",
+    "#include <cstring>",
+    "#include <ostream>",
+    "#include <span>",
+)
+
+# closing part of every struct's doc comment
+_STRUCT_DOCSTRING_FOOTER = """\
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+"""
+
+# member access helper, identical for all structs
+_ALIGNED_BUFFER_FN = """
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+"""
+
+# struct declaration with buffer ownership handling (constructors, destructor, copy/move),
+# identical for all structs except for their name
+_STRUCT_LIFECYCLE_TEMPLATE = Template(
+    """\
+struct ${name}
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit ${name}(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit ${name}(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : ${name}(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~${name}() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    ${name}(const ${name}&) = delete;
+    ${name}& operator=(const ${name}&) = delete;
+
+    // enable move
+    ${name}(${name}&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    ${name}& operator=(${name}&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+"""
+)
+
 
 class TypeDef:
+    __slots__ = (
+        "category",
+        "name",
+        "lang_type",
+        "include_stmt",
+        "native_size",
+        "aligned_size",
+        "variable_length",
+        "use_print",
+        "element_type_def",
+        "is_string",
+        "log2_size",
+    )
+
     category: str  # e = Enum, s = Struct, c = Container/Vector, p = Primitive
     name: str
     lang_type: str
@@ -16,6 +144,8 @@ class TypeDef:
     variable_length: bool
     use_print: bool
     element_type_def: Optional["TypeDef"]
+    is_string: bool
+    log2_size: Optional[int]  # log2(native_size) if native_size is a power of two
 
     def __init__(
         self,
@@ -28,19 +158,28 @@ class TypeDef:
         variable_length: bool,
         use_print: bool,
         element_type_def: Optional["TypeDef"] = None,
+        is_string: bool = False,
     ):
         self.category = category
-        self.name = name
-        self.lang_type = lang_type
+        self.name = sys.intern(name)
+        self.lang_type = sys.intern(lang_type)
         self.include_stmt = include_stmt
         self.native_size = native_size
         self.aligned_size = aligned_size
         self.variable_length = variable_length
         self.use_print = use_print
         self.element_type_def = element_type_def
+        self.is_string = is_string
+        self.log2_size = None
+        if native_size > 0 and native_size & (native_size - 1) == 0:
+            self.log2_size = native_size.bit_length() - 1
+        if category == "p":
+            assert self.log2_size is not None, f"Size of primitive '{name}' must be a power of two"
 
 
 class StructMemberDef:
+    __slots__ = ("name", "type_def")
+
     name: str
     type_def: TypeDef
 
@@ -49,46 +188,65 @@ class StructMemberDef:
         name: str,
         type_def: TypeDef,
     ):
-        self.name = name
+        self.name = sys.intern(name)
         self.type_def = type_def
 
 
 class StructDef:
+    __slots__ = (
+        "name",
+        "type_def",
+        "members",
+        "member_names",
+        "sys_includes",
+        "hpp_includes",
+        "docstring",
+    )
+
     name: str
     type_def: TypeDef
     members: Dict[str, StructMemberDef]
-    docstring: str
+    member_names: List[str]
+    sys_includes: Dict[str, None]
+    hpp_includes: Dict[str, None]
+    docstring: Optional[List[str]]
 
     def __init__(
         self,
         name: str,
         type_def: TypeDef,
         members: Dict[str, StructMemberDef],
-        docstring: str,
+        docstring: Optional[List[str]],
     ):
         self.name = name
         self.type_def = type_def
         self.members = members
+        self.member_names = list(members.keys())
+        self.sys_includes, self.hpp_includes = struct_includes(self)
         self.docstring = docstring
 
 
 class EnumMemberDef:
+    __slots__ = ("name", "value", "docstring")
+
     name: str
     value: int
-    docstring: List[str]
+    docstring: Optional[List[str]]
 
-    def __init__(self, name: str, value: int, docstring: str):
-        self.name = name
+    def __init__(self, name: str, value: int, docstring: Optional[List[str]]):
+        self.name = sys.intern(name)
         self.value = value
         self.docstring = docstring
 
 
 class EnumDef:
+    __slots__ = ("name", "type_def", "storage_type_def", "members", "docstring")
+
     name: str
     type_def: TypeDef
     storage_type_def: TypeDef
     members: Dict[str, EnumMemberDef]
-    docstring: str
+    docstring: Optional[List[str]]
 
     def __init__(
         self,
@@ -96,7 +254,7 @@ class EnumDef:
         type_def: TypeDef,
         storage_type_def: TypeDef,
         members: Dict[str, EnumMemberDef],
-        docstring: str,
+        docstring: Optional[List[str]],
     ):
         self.name = name
         self.type_def = type_def
@@ -105,19 +263,47 @@ class EnumDef:
         self.docstring = docstring
 
 
+def align_up(value: int, alignment: int) -> int:
+    # round value up to the next multiple of alignment (power of 2)
+    return (value + alignment - 1) & ~(alignment - 1)
+
+
+def member_alignment(type_def: TypeDef) -> int:
+    # primitives and enums are aligned to their (aligned) size, which is 8 bytes unless packed,
+    # containers and structs always start at 8-byte boundaries
+    if type_def.category in ("p", "e"):
+        return type_def.aligned_size
+    return 8
+
+
 class GenContext:
+    __slots__ = (
+        "namespace",
+        "enums",
+        "structs",
+        "enum_types",
+        "struct_types",
+        "built_in_types",
+        "_type_cache",
+        "_body_cache",
+    )
+
     namespace: str
     enums: Dict[str, EnumDef]
     structs: Dict[str, StructDef]
     enum_types: Dict[str, TypeDef]
     struct_types: Dict[str, TypeDef]
     built_in_types: Dict[str, TypeDef]
+    _type_cache: Dict[str, TypeDef]
+    _body_cache: Dict[Tuple[str, int, bool], str]
 
     def __init__(self, schema: dict):
         self.enums = {}
         self.structs = {}
         self.enum_types = {}
         self.struct_types = {}
+        self._type_cache = {}
+        self._body_cache = {}
         self.built_in_types = {
             "int8": TypeDef(
                 "p", "int8", "std::int8_t", "#include <cstdint>", 1, 8, False, True
@@ -150,7 +336,7 @@ class GenContext:
                 "p", "char", "char", "", 1, 8, False, True
             ),
             "float32": TypeDef(
-                "p", "float32", "float", "#include <cstddef>", 8, 8, False, True
+                "p", "float32", "float", "#include <cstddef>", 4, 8, False, True
             ),
             "float64": TypeDef(
                 "p", "float64", "double", "#include <cstddef>", 8, 8, False, True
@@ -167,19 +353,28 @@ class GenContext:
             True,
             True,
             self.built_in_types["char"],
+            is_string=True,
         )
 
         # parse namespace
-        self.namespace = schema.get("namespace", "")
+        self.namespace = sys.intern(schema.get("namespace", ""))
         if self.namespace == "":
             raise ValueError("No namespace defined in schema")
 
+        # packed schemas store primitives (and enums) with their natural size and alignment
+        if schema.get("pack", False):
+            for built_in_type in self.built_in_types.values():
+                if built_in_type.category == "p":
+                    built_in_type.aligned_size = built_in_type.native_size
+
         # parse enums
         for enum_name, enum_content in schema.get("enums", {}).items():
-            if not "type" in enum_content:
+            try:
+                storage_type_name = enum_content["type"]
+            except KeyError:
                 raise ValueError(f"Enum '{enum_name}' does not have 'type' defined")
 
-            storage_type = self.get_type_def(enum_content["type"])
+            storage_type = self.get_type_def(storage_type_name)
             type_def = TypeDef(
                 "e",
                 enum_name,
@@ -196,18 +391,28 @@ class GenContext:
             docstring = parse_docstring(enum_content.get("docstring", None))
 
             # parse enum members
-            members = {}
+            enum_members: Dict[str, EnumMemberDef] = {}
+            seen_values = set()
             for member_name, member_content in enum_content.get("members", {}).items():
-                value = member_content["value"]
+                try:
+                    value = member_content["value"]
+                except KeyError:
+                    raise ValueError(
+                        f"Enum member '{enum_name}.{member_name}' does not have 'value' defined"
+                    )
+                if value in seen_values:
+                    raise ValueError(
+                        f"Enum '{enum_name}' has duplicate value {value} for member '{member_name}'"
+                    )
+                seen_values.add(value)
                 member_docstring = parse_docstring(
                     member_content.get("docstring", None)
                 )
-                members[member_name] = EnumMemberDef(
-                    member_name, value, member_docstring
-                )
+                enum_member_def = EnumMemberDef(member_name, value, member_docstring)
+                enum_members[enum_member_def.name] = enum_member_def
 
             self.enums[enum_name] = EnumDef(
-                enum_name, type_def, storage_type, members, docstring
+                enum_name, type_def, storage_type, enum_members, docstring
             )
 
         # parse structs
@@ -216,16 +421,23 @@ class GenContext:
             docstring = parse_docstring(struct_content.get("docstring", None))
 
             # parse struct members
+            # and calculate total size of struct (aligned) in the same pass
             members: Dict[str, StructMemberDef] = {}
+            variable_length = False
+            size = 0
             for member_name, member_type in struct_content.get("members", {}).items():
                 type_def = self.get_type_def(member_type)
-                members[member_name] = StructMemberDef(member_name, type_def)
-
-            # calculate total size of struct (aligned)
-            variable_length = any(m.type_def.variable_length for m in members.values())
-            size = -1
-            if not variable_length:
-                size = sum(x.type_def.aligned_size for x in members.values())
+                member_def = StructMemberDef(member_name, type_def)
+                members[member_def.name] = member_def
+                if type_def.variable_length:
+                    variable_length = True
+                else:
+                    size = align_up(size, member_alignment(type_def)) + type_def.aligned_size
+            if variable_length:
+                size = -1
+            else:
+                # structs are always a multiple of 8 bytes
+                size = align_up(size, 8)
             type_def = TypeDef(
                 "s",
                 struct_name,
@@ -242,37 +454,51 @@ class GenContext:
             self.struct_types[struct_name] = type_def
 
     def get_struct_def(self, name: str) -> StructDef:
-        if not name in self.structs:
+        struct_def = self.structs.get(name)
+        if struct_def is None:
             raise ValueError(f"Struct '{name}' not found or used before declaration")
-        return self.structs[name]
+        return struct_def
 
     def get_enum_def(self, name: str) -> EnumDef:
-        if not name in self.enums:
+        enum_def = self.enums.get(name)
+        if enum_def is None:
             raise ValueError(f"Enum '{name}' not found")
-        return self.enums[name]
+        return enum_def
 
     def get_type_def(self, type_name: str) -> TypeDef:
+        # identical type names resolve to the same TypeDef instance
+        type_def = self._type_cache.get(type_name)
+        if type_def is None:
+            type_def = self._resolve_type_def(type_name)
+            self._type_cache[type_name] = type_def
+        return type_def
+
+    def _resolve_type_def(self, type_name: str) -> TypeDef:
         # primitive types (int8, double, etc.)
-        if type_name in self.built_in_types:
-            return self.built_in_types[type_name]
+        type_def = self.built_in_types.get(type_name)
+        if type_def is not None:
+            return type_def
 
         # enum:MyEnum
         if type_name.startswith("enum:"):
-            enum_type_name = type_name.split(":")[1]
-            if enum_type_name not in self.enum_types:
+            enum_type_name = type_name[5:]
+            type_def = self.enum_types.get(enum_type_name)
+            if type_def is None:
                 raise ValueError(f"Enum '{enum_type_name}' not found")
-            return self.enum_types[enum_type_name]
+            return type_def
 
         # struct:MyStruct
         if type_name.startswith("struct:"):
-            struct_type_name = type_name.split(":")[1]
-            if struct_type_name not in self.struct_types:
+            struct_type_name = type_name[7:]
+            type_def = self.struct_types.get(struct_type_name)
+            if type_def is None:
                 raise ValueError(f"Struct '{struct_type_name}' not found")
-            return self.struct_types[struct_type_name]
+            return type_def
 
-        # vector<T> -> Vector{T}
-        if type_name.startswith("vector<"):
-            el_type = type_name.split("<")[1].split(">")[0]
+        # vector<T> -> std::span<T>
+        m = _CONTAINER_RE.match(type_name)
+        if m is not None and m.group(1) == "vector":
+            el_type = m.group(2)
             el_type_def = self.get_type_def(el_type)
             if el_type_def.variable_length:
                 # TODO Support variable length vectors?
@@ -280,7 +506,7 @@ class GenContext:
             return TypeDef(
                 "c",
                 type_name,
-                f"std::span<{self.get_type_def(el_type).lang_type}>",
+                f"std::span<{el_type_def.lang_type}>",
                 "#include <span>",
                 -1,
                 -1,
@@ -292,239 +518,361 @@ class GenContext:
         raise ValueError(f"Unknown type: {type_name}")
 
 
-def parse_docstring(docstring: str | List[str] | None):
-    if docstring == None or docstring == "" or docstring == []:
+def parse_docstring(docstring: str | List[str] | None) -> Optional[List[str]]:
+    # None, "" and [] (no list is allocated for the comparison)
+    if not docstring:
         return None
     if isinstance(docstring, str):
         return [docstring]
     return docstring
 
 
-def generate_docstring(docstring: List[str], indent: int):
+def generate_docstring(docstring: List[str], indent: int) -> str:
     indent_str = " " * indent
-    code = ""
-    code += f"{indent_str}/**\n"
-    for line in docstring:
-        code += f"{indent_str} * {line}\n"
-    code += f"{indent_str} */\n"
-    return code
+    lines = f"\n{indent_str} * ".join(docstring)
+    return f"{indent_str}/**\n{indent_str} * {lines}\n{indent_str} */\n"
 
 
-def generate_enum(ctx: GenContext, enum_def: EnumDef):
-    print(f"Generating enum {ctx.namespace}::{enum_def.name}")
-
-    code_body = ""
+def enum_includes(enum_def: EnumDef) -> List[str]:
+    includes = [
+        "#include <string>",
+        "#include <string_view>",
+        "#include <stdexcept>",
+        "#include <ostream>",
+    ]
+    if enum_def.storage_type_def.include_stmt:
+        includes.append(enum_def.storage_type_def.include_stmt)
+    return includes
+
+
+def type_guard_macro(namespace: str, name: str) -> str:
+    # shared by the per-type header and models_all.hpp, so both can be included together
+    return f"FASTBIN_TYPE_{namespace.replace('::', '_')}_{name}"
+
+
+def generate_enum(
+    ctx: GenContext, enum_def: EnumDef, out: TextIO, standalone: bool = True
+) -> None:
+    # standalone=False omits `#pragma once` and includes (monolithic header)
+    if standalone:
+        print(f"Generating enum {ctx.namespace}::{enum_def.name}")
+        out.write("#pragma once\n")
+        out.write("\n")
+        for include in enum_includes(enum_def):
+            out.write(f"{include}\n")
+        out.write("\n")
+    guard = type_guard_macro(ctx.namespace, enum_def.name)
+    out.write(f"#ifndef {guard}\n")
+    out.write(f"#define {guard}\n")
+    out.write("\n")
+    out.write(f"namespace {ctx.namespace}\n")
+    out.write("{\n")
+    if enum_def.docstring:
+        out.write(generate_docstring(enum_def.docstring, 0))
+    out.write(f"enum class {enum_def.name} : {enum_def.storage_type_def.lang_type}\n")
+    out.write("{\n")
     for i, (name, member_def) in enumerate(enum_def.members.items()):
         # docstring
         if member_def.docstring:
             if i > 0:
-                code_body += "\n"
-            code_body += generate_docstring(member_def.docstring, 4)
+                out.write("\n")
+            out.write(generate_docstring(member_def.docstring, 4))
 
         # member
-        code_body += f"    {name} = {member_def.value},\n"
+        out.write(f"    {name} = {member_def.value},\n")
+    out.write("};\n")
 
-    code = "#pragma once\n"
-    code += "\n"
-    code += f"#include <string>\n"
-    code += f"#include <ostream>\n"
-    if enum_def.storage_type_def.include_stmt:
-        code += f"{enum_def.storage_type_def.include_stmt}\n"
-    code += "\n"
-    code += f"namespace {ctx.namespace}\n"
-    code += "{\n"
-    if enum_def.docstring:
-        code += generate_docstring(enum_def.docstring, 0)
-    code += f"enum class {enum_def.name} : {enum_def.storage_type_def.lang_type}\n"
-    code += "{\n"
-    code += code_body
-    code += "};\n"
+    out.write(f"}}; // namespace {ctx.namespace}\n")
 
-    code += f"}}; // namespace {ctx.namespace}\n"
+    # to_string_view (no allocation, usable in constant expressions)
+    out.write("\n")
+    out.write(f"[[nodiscard]] constexpr std::string_view to_string_view({ctx.namespace}::{enum_def.name} value) noexcept\n")
+    out.write("{\n")
+    out.write("    switch (value)\n")
+    out.write("    {\n")
+    for name in enum_def.members.keys():
+        out.write(f"        case {ctx.namespace}::{enum_def.name}::{name}:\n")
+        out.write(f'            return "{name}";\n')
+    out.write("        default:\n")
+    out.write('            return "Unknown";\n')
+    out.write("    }\n")
+    out.write("}\n")
 
     # to_string
-    code += "\n"
-    code += f"inline std::string to_string({ctx.namespace}::{enum_def.name} value)\n"
-    code += "{\n"
-    code += "    switch (value)\n"
-    code += "    {\n"
+    out.write("\n")
+    out.write(f"inline std::string to_string({ctx.namespace}::{enum_def.name} value)\n")
+    out.write("{\n")
+    out.write("    return std::string(to_string_view(value));\n")
+    out.write("}\n")
+
+    # from_string (switch on length first, then compare strings of equal length only)
+    names_by_len: Dict[int, List[str]] = {}
     for name in enum_def.members.keys():
-        code += f"        case {ctx.namespace}::{enum_def.name}::{name}:\n"
-        code += f'            return "{name}";\n'
-    code += "        default:\n"
-    code += '            return "Unknown";\n'
-    code += "    }\n"
-    code += "}\n"
+        names_by_len.setdefault(len(name), []).append(name)
+    # (declared in the schema namespace, not globally, to not clash with other libraries)
+    out.write("\n")
+    out.write(f"namespace {ctx.namespace}\n")
+    out.write("{\n")
+    out.write("template <typename T>\n")
+    out.write("T from_string(std::string_view str);\n")
+    out.write("\n")
+    out.write("template <>\n")
+    out.write(f"inline {ctx.namespace}::{enum_def.name} from_string<{ctx.namespace}::{enum_def.name}>(std::string_view str)\n")
+    out.write("{\n")
+    out.write("    switch (str.size())\n")
+    out.write("    {\n")
+    for length, names in names_by_len.items():
+        out.write(f"        case {length}:\n")
+        for name in names:
+            out.write(f'            if (str == "{name}")\n')
+            out.write(f"                return {ctx.namespace}::{enum_def.name}::{name};\n")
+        out.write("            break;\n")
+    out.write("    }\n")
+    out.write(f'    throw std::invalid_argument("Invalid string value for enum {ctx.namespace}::{enum_def.name}: " + std::string(str));\n')
+    out.write("}\n")
+    out.write(f"}}; // namespace {ctx.namespace}\n")
 
     # ostream << operator
-    code += "\n"
-    code += f"inline std::ostream& operator<<(std::ostream& os, const {ctx.namespace}::{enum_def.name}& obj)\n"
-    code += "{\n"
-    code += "    os << to_string(obj);\n"
-    code += "    return os;\n"
-    code += "}\n"
+    out.write("\n")
+    out.write(f"inline std::ostream& operator<<(std::ostream& os, const {ctx.namespace}::{enum_def.name}& obj)\n")
+    out.write("{\n")
+    out.write("    os << to_string_view(obj);\n")
+    out.write("    return os;\n")
+    out.write("}\n")
 
-    return code
+    out.write("\n")
+    out.write(f"#endif // {guard}\n")
 
 
-def generate_get_member_body(ctx: GenContext, member_def: StructMemberDef):
-    type_def = member_def.type_def
-    lang_type = type_def.lang_type
-
-    if type_def.category == "e":
-        # enum
-        code = f"        return static_cast<{lang_type}>(*reinterpret_cast<const {lang_type}*>(buffer + {prefix}{member_def.name}_offset()));\n"
-    elif type_def.category == "p":
-        # primitive
-        code = f"        return *reinterpret_cast<const {lang_type}*>(buffer + {prefix}{member_def.name}_offset());\n"
-    elif type_def.category == "s":
-        # struct
-        code = f"        auto ptr = buffer + {prefix}{member_def.name}_offset();\n"
-        code += f"        return {lang_type}(ptr, {prefix}{member_def.name}_size_aligned(), false);\n"
-    elif type_def.category == "c":
-        # container with variable length (string, vector<T>)
-        el_type_def = type_def.element_type_def
-        el_type_cpp = el_type_def.lang_type
-        code = f"        size_t n_bytes = {prefix}{member_def.name}_size_unaligned() - 8;\n"  # -8 to skip the size
-        if el_type_def.native_size == 1:
-            code += f"        size_t count = n_bytes;\n"
-        elif el_type_def.native_size == 2:
-            # >> 1 is equal to dividing by 2
-            code += f"        size_t count = n_bytes >> 1;\n"
-        elif el_type_def.native_size == 4:
-            # >> 2 is equal to dividing by 4
-            code += f"        size_t count = n_bytes >> 2;\n"
-        elif el_type_def.native_size == 8:
-            # >> 3 is equal to dividing by 8
-            code += f"        size_t count = n_bytes >> 3;\n"
-        else:
-            code += f"        size_t count = n_bytes / {el_type_def.native_size};\n"
-        if type_def.name == "string":
-            # std::string_view
-            code += f"        auto ptr = reinterpret_cast<const char*>(buffer + {prefix}{member_def.name}_offset() + 8);\n"  # +8 to skip the size
-            code += f"        return std::string_view(ptr, count);\n"
-        else:
-            # std::span<T>
-            code += f"        auto ptr = reinterpret_cast<{el_type_cpp}*>(buffer + {prefix}{member_def.name}_offset() + 8);\n"  # +8 to skip the size
-            code += f"        return std::span<{el_type_cpp}>(ptr, count);\n"
-    else:
-        raise ValueError(f"Unknown type category: {type_def.category}")
+def _get_primitive(ctx: GenContext, member_def: StructMemberDef) -> str:
+    # primitives, enum (memcpy avoids strict-aliasing UB, compiles to a single load)
+    code: List[str] = []
+    code.append(f"        {member_def.type_def.lang_type} value;\n")
+    code.append(f"        std::memcpy(&value, _aligned_buffer() + {prefix}{member_def.name}_offset(), sizeof(value));\n")
+    code.append(f"        return value;\n")
+    return "".join(code)
+
 
-    return code
+def _get_struct(ctx: GenContext, member_def: StructMemberDef) -> str:
+    code: List[str] = []
+    code.append(f"        auto ptr = _aligned_buffer() + {prefix}{member_def.name}_offset();\n")
+    code.append(f"        return {member_def.type_def.lang_type}(ptr, {prefix}{member_def.name}_size_aligned(), false);\n")
+    return "".join(code)
 
 
-def generate_set_member_body(ctx: GenContext, member_def: StructMemberDef):
+def _get_container(ctx: GenContext, member_def: StructMemberDef) -> str:
+    # container with variable length (string, vector<T>)
     type_def = member_def.type_def
-    lang_type = type_def.lang_type
-
-    if type_def.category == "e":
-        # enum
-        code = f"        *reinterpret_cast<{lang_type}*>(buffer + {prefix}{member_def.name}_offset()) = static_cast<{lang_type}>(value);\n"
-    elif type_def.category == "p":
-        # primitive
-        code = f"        *reinterpret_cast<{lang_type}*>(buffer + {prefix}{member_def.name}_offset()) = value;\n"
-    elif type_def.category == "c":
-        # container with variable length (string, vector<T>) and fixed element size
-        el_type_def = member_def.type_def.element_type_def
-        el_size_bytes = el_type_def.native_size
-        code = f"        size_t offset = {prefix}{member_def.name}_offset();\n"
-        code += f"        size_t contents_size = value.size() * {el_size_bytes};\n"
-        maybe_unaligned = el_type_def.native_size % 8 != 0
-        if maybe_unaligned:
-            # string or vector<T> with size of T not divisible of 8
-            code += f"        size_t unaligned_size = 8 + contents_size;\n"
-            code += f"        size_t aligned_size = (unaligned_size + 7) & ~7;\n"
-            code += f"        size_t aligned_diff = aligned_size - unaligned_size;\n"
-            # add diff to high-bits of aligned_size
-            code += f"        size_t aligned_size_high = aligned_size | (aligned_diff << 56);\n"
-            code += f"        *reinterpret_cast<size_t*>(buffer + offset) = aligned_size_high;\n"
+    el_type_def = type_def.element_type_def
+    assert el_type_def is not None
+    el_type_cpp = el_type_def.lang_type
+    code: List[str] = []
+    code.append(f"        size_t n_bytes = {prefix}{member_def.name}_size_unaligned() - 8;\n")  # -8 to skip the size
+    if el_type_def.log2_size == 0:
+        code.append(f"        size_t count = n_bytes;\n")
+    elif el_type_def.log2_size is not None:
+        # >> log2(n) is equal to dividing by n
+        code.append(f"        size_t count = n_bytes >> {el_type_def.log2_size};\n")
+    else:
+        code.append(f"        size_t count = n_bytes / {el_type_def.native_size};\n")
+    if type_def.is_string:
+        # std::string_view
+        code.append(f"        auto ptr = reinterpret_cast<const char*>(_aligned_buffer() + {prefix}{member_def.name}_offset() + 8);\n")  # +8 to skip the size
+        code.append(f"        return std::string_view(ptr, count);\n")
+    else:
+        # std::span<T>
+        code.append(f"        auto ptr = reinterpret_cast<{el_type_cpp}*>(_aligned_buffer() + {prefix}{member_def.name}_offset() + 8);\n")  # +8 to skip the size
+        code.append(f"        return std::span<{el_type_cpp}>(ptr, count);\n")
+    return "".join(code)
+
+
+def _set_primitive(ctx: GenContext, member_def: StructMemberDef) -> str:
+    # primitives, enum
+    return f"        std::memcpy(_aligned_buffer() + {prefix}{member_def.name}_offset(), &value, sizeof(value));\n"
+
+
+def _set_container(ctx: GenContext, member_def: StructMemberDef) -> str:
+    # container with variable length (string, vector<T>) and fixed element size
+    el_type_def = member_def.type_def.element_type_def
+    assert el_type_def is not None
+    el_size_bytes = el_type_def.native_size
+    code: List[str] = []
+    code.append(f"        size_t offset = {prefix}{member_def.name}_offset();\n")
+    code.append(f"        size_t contents_size = value.size() * {el_size_bytes};\n")
+    maybe_unaligned = el_type_def.native_size % 8 != 0
+    if maybe_unaligned:
+        # string or vector<T> with size of T not divisible of 8
+        code.append(f"        size_t unaligned_size = 8 + contents_size;\n")
+        code.append(f"        size_t aligned_size = (unaligned_size + 7) & ~7;\n")
+        code.append(f"        size_t aligned_diff = aligned_size - unaligned_size;\n")
+        # add diff to high-bits of aligned_size
+        code.append(f"        size_t aligned_size_high = aligned_size | (aligned_diff << 56);\n")
+        code.append(f"        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));\n")
+    else:
+        # element size is divisible by 8, no alignment adjustment needed
+        code.append(f"        size_t stored_size = 8 + contents_size;\n")
+        code.append(f"        std::memcpy(_aligned_buffer() + offset, &stored_size, sizeof(stored_size));\n")
+    code.append(f"        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);\n")
+    return "".join(code)
+
+
+def _set_struct(ctx: GenContext, member_def: StructMemberDef) -> str:
+    lang_type = member_def.type_def.lang_type
+    code: List[str] = []
+    code.append(f'        assert(value.fastbin_binary_size() > 0 && "Cannot set member `{member_def.name}`, parameter struct of type `{lang_type}` not finalized. Call fastbin_finalize() on struct after creation.");\n')
+    code.append(f"        size_t offset = {prefix}{member_def.name}_offset();\n")
+    code.append(f"        size_t size = value.fastbin_binary_size();\n")
+    code.append(f"        std::memcpy(_aligned_buffer() + offset, value.buffer, size);\n")
+    return "".join(code)
+
+
+def _size_primitive(ctx: GenContext, member_def: StructMemberDef, unaligned_size: bool) -> str:
+    # primitives, enum
+    return f"        return {member_def.type_def.aligned_size};\n"
+
+
+def _size_container(ctx: GenContext, member_def: StructMemberDef, unaligned_size: bool) -> str:
+    # container with variable length (string, vector<T>)
+    el_type_def = member_def.type_def.element_type_def
+    assert el_type_def is not None
+    code: List[str] = []
+    code.append(f"        size_t stored_size;\n")
+    code.append(f"        std::memcpy(&stored_size, _aligned_buffer() + {prefix}{member_def.name}_offset(), sizeof(stored_size));\n")
+    maybe_unaligned = el_type_def.native_size % 8 != 0
+    if maybe_unaligned:
+        # string or vector<T> with size of T not divisible of 8
+        if unaligned_size:
+            code.append(f"        size_t aligned_diff = stored_size >> 56;\n")
+            code.append(f"        size_t aligned_size = stored_size & {prefix}size_mask_v;\n")  # remove 8 high-bits
+            code.append(f"        return aligned_size - aligned_diff;\n")
         else:
-            # element size is divisible by 8, no alignment adjustment needed
-            code += f"        *reinterpret_cast<size_t*>(buffer + offset) = 8 + contents_size;\n"
-        code += f"        auto dest_ptr = reinterpret_cast<std::byte*>(buffer + offset + 8);\n"
-        code += f"        auto src_ptr = reinterpret_cast<const std::byte*>(value.data());\n"
-        code += f"        std::copy(src_ptr, src_ptr + contents_size, dest_ptr);\n"
-    elif type_def.category == "s":
-        # struct
-        code = f'        assert(value.fastbin_binary_size() > 0 && "Cannot set member `{member_def.name}`, parameter struct of type `{lang_type}` not finalized. Call fastbin_finalize() on struct after creation.");\n'
-        code += f"        size_t offset = {prefix}{member_def.name}_offset();\n"
-        code += f"        size_t size = value.fastbin_binary_size();\n"
-        code += (
-            f"        std::copy(value.buffer, value.buffer + size, buffer + offset);\n"
-        )
+            code.append(f"        size_t aligned_size = stored_size & {prefix}size_mask_v;\n")  # remove 8 high-bits
+            code.append(f"        return aligned_size;\n")
     else:
-        raise ValueError(f"Unknown type category: {type_def.category}")
-
-    return code
+        # element size is divisible by 8, no alignment adjustment needed
+        code.append(f"        return stored_size;\n")
+    return "".join(code)
 
 
-def generate_size_member_body(
-    ctx: GenContext, member_def: StructMemberDef, unaligned_size: bool
-):
+def _size_struct(ctx: GenContext, member_def: StructMemberDef, unaligned_size: bool) -> str:
+    # structs are always aligned to 8 bytes
     type_def = member_def.type_def
+    if type_def.variable_length:
+        code: List[str] = []
+        code.append(f"        size_t stored_size;\n")
+        code.append(f"        std::memcpy(&stored_size, _aligned_buffer() + {prefix}{member_def.name}_offset(), sizeof(stored_size));\n")
+        code.append(f"        return stored_size;\n")
+        return "".join(code)
+    return f"        return {type_def.aligned_size};\n"
+
+
+# member body generators by type category
+_GET_HANDLERS: Dict[str, Callable[[GenContext, StructMemberDef], str]] = {
+    "e": _get_primitive,
+    "p": _get_primitive,
+    "s": _get_struct,
+    "c": _get_container,
+}
+_SET_HANDLERS: Dict[str, Callable[[GenContext, StructMemberDef], str]] = {
+    "e": _set_primitive,
+    "p": _set_primitive,
+    "s": _set_struct,
+    "c": _set_container,
+}
+_SIZE_HANDLERS: Dict[str, Callable[[GenContext, StructMemberDef, bool], str]] = {
+    "e": _size_primitive,
+    "p": _size_primitive,
+    "s": _size_struct,
+    "c": _size_container,
+}
+
+
+def _cached_member_body(
+    ctx: GenContext,
+    cache_key: Tuple[str, int, bool],
+    member_def: StructMemberDef,
+    generate: Callable[[StructMemberDef], str],
+) -> str:
+    # member bodies only depend on the type and the member name, so they are generated
+    # once per type with a placeholder name, which is then replaced by the actual name
+    template = ctx._body_cache.get(cache_key)
+    if template is None:
+        template = generate(StructMemberDef(_MEMBER_NAME, member_def.type_def))
+        ctx._body_cache[cache_key] = template
+    return template.replace(_MEMBER_NAME, member_def.name)
+
+
+def generate_get_member_body(ctx: GenContext, member_def: StructMemberDef) -> str:
+    handler = _GET_HANDLERS.get(member_def.type_def.category)
+    if handler is None:
+        raise ValueError(f"Unknown type category: {member_def.type_def.category}")
+    cache_key = ("get", id(member_def.type_def), False)
+    return _cached_member_body(ctx, cache_key, member_def, partial(handler, ctx))
+
+
+def generate_set_member_body(ctx: GenContext, member_def: StructMemberDef) -> str:
+    handler = _SET_HANDLERS.get(member_def.type_def.category)
+    if handler is None:
+        raise ValueError(f"Unknown type category: {member_def.type_def.category}")
+    cache_key = ("set", id(member_def.type_def), False)
+    return _cached_member_body(ctx, cache_key, member_def, partial(handler, ctx))
 
-    if type_def.category in ["p", "e"]:
-        # primitives, enum
-        code = f"        return {type_def.aligned_size};\n"
-    elif type_def.category == "c":
-        # container with variable length (string, vector<T>)
-        el_type_def = type_def.element_type_def
-        code = f"        size_t stored_size = *reinterpret_cast<size_t*>(buffer + {prefix}{member_def.name}_offset());\n"
-        maybe_unaligned = el_type_def.native_size % 8 != 0
-        if maybe_unaligned:
-            # string or vector<T> with size of T not divisible of 8
-            if unaligned_size:
-                code += f"        size_t aligned_diff = stored_size >> 56;\n"
-                code += f"        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;\n"  # remove 8 high-bits
-                code += f"        return aligned_size - aligned_diff;\n"
-            else:
-                code += f"        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;\n"  # remove 8 high-bits
-                code += f"        return aligned_size;\n"
-        else:
-            # element size is divisible by 8, no alignment adjustment needed
-            code += f"        return stored_size;\n"
-    elif type_def.category == "s":
-        # structs are always aligned to 8 bytes
-        if type_def.variable_length:
-            code = f"        return *reinterpret_cast<size_t*>(buffer + {prefix}{member_def.name}_offset());\n"
-        else:
-            code = f"        return {type_def.aligned_size};\n"
-    else:
-        raise ValueError(f"Unknown type category: {type_def.category}")
 
-    return code
+def generate_size_member_body(
+    ctx: GenContext, member_def: StructMemberDef, unaligned_size: bool
+) -> str:
+    handler = _SIZE_HANDLERS.get(member_def.type_def.category)
+    if handler is None:
+        raise ValueError(f"Unknown type category: {member_def.type_def.category}")
+    cache_key = ("size", id(member_def.type_def), unaligned_size)
+    return _cached_member_body(
+        ctx, cache_key, member_def, lambda m: handler(ctx, m, unaligned_size)
+    )
 
 
-def generate_offset_member_body(
-    ctx: GenContext, index: int, struct_def: StructDef, member_def: StructMemberDef
-):
-    member_names = list(struct_def.members.keys())
+def calc_member_offsets(struct_def: StructDef) -> List[Optional[int]]:
+    # byte offset of each member, None if located after a variable-length member
+    offsets: List[Optional[int]] = []
     if struct_def.type_def.variable_length:
         # first 8 bytes are reserved for the size of the variable-length struct
-        offset = 8
+        offset: Optional[int] = 8
     else:
         # fixed-length struct
         offset = 0
-    for (i, prev_member) in enumerate(struct_def.members.values()):
-        if i < index:
-            if prev_member.type_def.variable_length:
-                # cannot precompute fixed offset, variable length member found
-                offset = -1
-                break
+    for member_def in struct_def.members.values():
+        if offset is not None:
+            offset = align_up(offset, member_alignment(member_def.type_def))
+        offsets.append(offset)
+        if offset is not None:
+            if member_def.type_def.variable_length:
+                # cannot precompute fixed offsets after a variable length member
+                offset = None
             else:
                 # fixed-length members only take up their aligned size space
-                offset += prev_member.type_def.aligned_size
-    if offset == -1:
+                offset += member_def.type_def.aligned_size
+    return offsets
+
+
+def generate_offset_member_body(
+    ctx: GenContext,
+    member_name: str,
+    offset: Optional[int],
+    prev_member_name: Optional[str],
+    alignment: int = 1,
+) -> str:
+    if offset is None:
         # variable length member found, cannot precompute offset
-        code_body = f"        return {prefix}{member_names[index-1]}_offset() + {prefix}{member_names[index-1]}_size_aligned();\n"
-    else:
-        code_body = f"        return {offset};\n"
-    return code_body
+        end = f"{prefix}{prev_member_name}_offset() + {prefix}{prev_member_name}_size_aligned()"
+        if alignment > 1:
+            # previous (packed) member may end before the required alignment of this member
+            return f"        return ({end} + {alignment - 1}) & ~size_t({alignment - 1});\n"
+        return f"        return {end};\n"
+    return f"        return {prefix}{member_name}_offset_v;\n"
 
 
-def ostream_member_output(ctx: GenContext, member_def: StructMemberDef):
+def ostream_member_output(ctx: GenContext, member_def: StructMemberDef) -> str:
     # string (string_view)
-    if member_def.type_def.name == "string":
+    if member_def.type_def.is_string:
         return f"std::string(obj.{member_def.name}())"
 
     # bool
@@ -538,290 +886,458 @@ def ostream_member_output(ctx: GenContext, member_def: StructMemberDef):
     return f"obj.{member_def.name}()"
 
 
-def generate_struct(ctx: GenContext, struct_def: StructDef):
-    print(f"Generating struct {ctx.namespace}::{struct_def.name}", end=" ")
-    if struct_def.type_def.variable_length:
-        print(f"[size=variable]")
-    else:
-        print(f"[size={struct_def.type_def.aligned_size} bytes]")
-    for name, member_def in struct_def.members.items():
-        print(f"- {name}: {member_def.type_def.lang_type}")
+def generate_struct_layout(
+    ctx: GenContext, struct_def: StructDef, offsets: List[Optional[int]], out: TextIO
+) -> None:
+    name = struct_def.name
+    out.write("\n")
+    out.write("/**\n")
+    out.write(f" * Plain memory layout of `{name}` with explicit padding.\n")
+    out.write(f" * The buffer of a `{name}` can be copied from/to it using `std::memcpy` or `std::bit_cast`.\n")
+    out.write(" */\n")
+    out.write(f"struct {name}_layout\n")
+    out.write("{\n")
+    for i, (member_name, member_def) in enumerate(struct_def.members.items()):
+        type_def = member_def.type_def
+        if type_def.category == "s":
+            # nested fixed-length struct, always a multiple of 8 bytes
+            out.write(f"    {type_def.lang_type}_layout {member_name};\n")
+            continue
+        out.write(f"    {type_def.lang_type} {member_name};\n")
+        # explicit padding up to the next member (or the end of the struct)
+        offset = offsets[i]
+        next_offset = offsets[i + 1] if i + 1 < len(offsets) else struct_def.type_def.aligned_size
+        assert offset is not None and next_offset is not None
+        padding = next_offset - offset - type_def.native_size
+        if padding > 0:
+            out.write(f"    std::byte {prefix}{member_name}_padding[{padding}];\n")
+    out.write("};\n")
+    out.write(f"static_assert(sizeof({name}_layout) == {struct_def.type_def.aligned_size});\n")
+    for i, member_name in enumerate(struct_def.members.keys()):
+        out.write(f"static_assert(offsetof({name}_layout, {member_name}) == {offsets[i]});\n")
+
+
+def struct_includes(struct_def: StructDef) -> Tuple[Dict[str, None], Dict[str, None]]:
+    # system includes and includes of generated *.hpp files based on member types
+    # (dicts are used as insertion-ordered sets to remove duplicates)
+    sys_includes: Dict[str, None] = dict.fromkeys(_STRUCT_SYS_INCLUDES)
+    hpp_includes: Dict[str, None] = {}
+    for m in struct_def.members.values():
+        include = m.type_def.include_stmt
+        if include == "":
+            continue
+        if ".hpp" in include:
+            hpp_includes[include] = None
+        else:
+            sys_includes[include] = None
+    return sys_includes, hpp_includes
 
-    includes = [
-        "#include <cstddef>",
-        "#include <cassert>",
-        "#include <ostream>",
-        "#include <span>",
-    ]
 
-    member_names = list(name for name, _ in struct_def.members.items())
+def generate_struct(
+    ctx: GenContext, struct_def: StructDef, out: TextIO, standalone: bool = True
+) -> None:
+    # frequently used values, bound to locals once
+    namespace = ctx.namespace
+    struct_name = struct_def.name
+    variable_length = struct_def.type_def.variable_length
+    aligned_size = struct_def.type_def.aligned_size
+    members = struct_def.members
+    member_names = struct_def.member_names
 
     if len(member_names) == 0:
         raise ValueError(
-            f"struct {ctx.namespace}::{struct_def.name} does not have any members"
+            f"struct {namespace}::{struct_name} does not have any members"
         )
 
-    # generate member functions (get, set, size, offset)
-    code_body = ""
-    for i, (name, member_def) in enumerate(struct_def.members.items()):
-        code_body += f"\n    // Member: {name} [{member_def.type_def.lang_type}]\n"
+    # standalone=False omits `#pragma once` and includes (monolithic header)
+    if standalone:
+        print(f"Generating struct {namespace}::{struct_name}", end=" ")
+        if variable_length:
+            print(f"[size=variable]")
+        else:
+            print(f"[size={aligned_size} bytes]")
+        for name, member_def in members.items():
+            print(f"- {name}: {member_def.type_def.lang_type}")
+
+        # *.hpp are included last
+        out.write("#pragma once\n")
+        out.write("\n")
+        for include in struct_def.sys_includes:
+            out.write(f"{include}\n")
+        for include in struct_def.hpp_includes:
+            out.write(f"{include}\n")
+        out.write("\n")
+    guard = type_guard_macro(namespace, struct_name)
+    out.write(f"#ifndef {guard}\n")
+    out.write(f"#define {guard}\n")
+    out.write("\n")
+    out.write(f"namespace {namespace}\n")
+    out.write("{\n")
+    out.write("/**\n")
+    if struct_def.docstring:
+        for line in struct_def.docstring:
+            out.write(f" * {line}\n")
+        out.write(f" *\n")
+        out.write(f" * {'-'*60}\n")
+        out.write(f" *\n")
+
+    out.write(" * Binary serializable data container generated by `fastbin`.\n")
+    out.write(" * \n")
+    if variable_length:
+        out.write(" * This container has variable size.\n")
+        out.write(" * All setter methods starting from the first variable-sized member and afterwards MUST be called in order.\n")
+        out.write(" *\n")
+        out.write(" * Members in order\n")
+        out.write(" * ================\n")
+        for i, (name, member_def) in enumerate(members.items()):
+            name_type = '`' + name + "` [`" + member_def.type_def.lang_type + '`]'
+            out.write(f" * - {name_type.ljust(24)} ({'variable' if member_def.type_def.variable_length else 'fixed'})\n")
+        out.write(" *\n")
+    else:
+        out.write(f" * This container has fixed size of {aligned_size} bytes.\n")
+        out.write(" *\n")
+    out.write(_STRUCT_DOCSTRING_FOOTER)
+    out.write(_STRUCT_LIFECYCLE_TEMPLATE.substitute(name=struct_name))
+
+    # alignment hint for member access
+    out.write(_ALIGNED_BUFFER_FN)
+
+    # mask for container size headers carrying the alignment diff in their 8 high-bits
+    if any(
+        m.type_def.category == "c"
+        and m.type_def.element_type_def is not None
+        and m.type_def.element_type_def.native_size % 8 != 0
+        for m in members.values()
+    ):
+        out.write("\n")
+        out.write(f"    static constexpr size_t {prefix}size_mask_v = 0x00FFFFFFFFFFFFFFULL;\n")
+
+    # member functions (get, set, size, offset)
+    offsets = calc_member_offsets(struct_def)
+    for i, (name, member_def) in enumerate(members.items()):
         type_def = member_def.type_def
+        out.write(f"\n    // Member: {name} [{type_def.lang_type}]\n")
         
         # getter
-        code_body += f"\n    inline {type_def.lang_type} {name}() const noexcept\n"
-        code_body += "    {\n"
-        code_body += generate_get_member_body(ctx, member_def)
-        code_body += "    }\n"
-        code_body += "\n"
+        out.write(f"\n    [[nodiscard]] inline {type_def.lang_type} {name}() const noexcept\n")
+        out.write("    {\n")
+        out.write(generate_get_member_body(ctx, member_def))
+        out.write("    }\n")
+        out.write("\n")
         
         # setter
         if type_def.category == "s":
             # struct
-            code_body += f"    inline void {name}(const {type_def.lang_type}& value) noexcept\n"
+            out.write(f"    inline void {name}(const {type_def.lang_type}& value) noexcept\n")
         else:
-            code_body += f"    inline void {name}(const {type_def.lang_type} value) noexcept\n"
-        code_body += "    {\n"
-        code_body += generate_set_member_body(ctx, member_def)
-        code_body += f"    }}\n"
-        code_body += "\n"
+            out.write(f"    inline void {name}(const {type_def.lang_type} value) noexcept\n")
+        out.write("    {\n")
+        out.write(generate_set_member_body(ctx, member_def))
+        out.write(f"    }}\n")
+        out.write("\n")
         
-        # offset
-        code_body += f"    constexpr inline size_t {prefix}{name}_offset() const noexcept\n"
-        code_body += "    {\n"
-        code_body += generate_offset_member_body(ctx, i, struct_def, member_def)
-        code_body += f"    }}\n"
-        code_body += "\n"
+        # offset (compile-time constant if known)
+        if offsets[i] is not None:
+            out.write(f"    static constexpr size_t {prefix}{name}_offset_v = {offsets[i]};\n")
+            out.write("\n")
+        out.write(f"    [[nodiscard]] constexpr inline size_t {prefix}{name}_offset() const noexcept\n")
+        out.write("    {\n")
+        prev_member_name = member_names[i - 1] if i > 0 else None
+        alignment = 1
+        if prev_member_name is not None:
+            alignment = member_alignment(type_def)
+            if alignment <= member_alignment(members[prev_member_name].type_def):
+                alignment = 1
+        out.write(generate_offset_member_body(ctx, name, offsets[i], prev_member_name, alignment))
+        out.write(f"    }}\n")
+        out.write("\n")
         
         # size aligned
-        code_body += f"    constexpr inline size_t {prefix}{name}_size_aligned() const noexcept\n"
-        code_body += "    {\n"
-        code_body += generate_size_member_body(ctx, member_def, False)
-        code_body += f"    }}\n"
+        out.write(f"    [[nodiscard]] constexpr inline size_t {prefix}{name}_size_aligned() const noexcept\n")
+        out.write("    {\n")
+        out.write(generate_size_member_body(ctx, member_def, False))
+        out.write(f"    }}\n")
         
         # size unaligned
         if type_def.category == "c":
-            code_body += "\n"
-            code_body += (
-                f"    constexpr inline size_t {prefix}{name}_size_unaligned() const noexcept\n"
-            )
-            code_body += "    {\n"
-            code_body += generate_size_member_body(ctx, member_def, True)
-            code_body += f"    }}\n"
-
-    code_body += "\n    // --------------------------------------------------------------------------------\n"
-    
-    # add includes based on member types
-    includes.extend([
-        m.type_def.include_stmt
-        for m in struct_def.members.values()
-        if m.type_def.include_stmt != ""
-    ])
-    
-    # sort includes so that *.hpp are included last
-    includes.sort(key=lambda x: ".hpp" in x)
-
-    code = "#pragma once\n"
-    code += "\n"
-    for include in list(dict.fromkeys(includes)):  # remove duplicates
-        code += f"{include}\n"
-    code += "\n"
-    code += f"namespace {ctx.namespace}\n"
-    code += "{\n"
-    code += "/**\n"
-    if struct_def.docstring:
-        for line in struct_def.docstring:
-            code += f" * {line}\n"
-        code += f" *\n"
-        code += f" * {'-'*60}\n"
-        code += f" *\n"
+            out.write("\n")
+            out.write(f"    [[nodiscard]] constexpr inline size_t {prefix}{name}_size_unaligned() const noexcept\n")
+            out.write("    {\n")
+            out.write(generate_size_member_body(ctx, member_def, True))
+            out.write(f"    }}\n")
 
-    code += " * Binary serializable data container generated by `fastbin`.\n"
-    code += " * \n"
-    if struct_def.type_def.variable_length:
-        code += " * This container has variable size.\n"
-        code += " * All setter methods starting from the first variable-sized member and afterwards MUST be called in order.\n"
-        code += " *\n"
-        code += " * Members in order\n"
-        code += " * ================\n"
-        for i, (name, member_def) in enumerate(struct_def.members.items()):
-            name_type = '`' + name + "` [`" + member_def.type_def.lang_type + '`]'
-            code += f" * - {name_type.ljust(24)} ({'variable' if member_def.type_def.variable_length else 'fixed'})\n"
-        code += " *\n"
-    else:
-        code += f" * This container has fixed size of {struct_def.type_def.aligned_size} bytes.\n"
-        code += " *\n"
-    code += " * The `finalize()` method MUST be called after all setter methods have been called.\n"
-    code += " * \n"
-    code += " * It is the responsibility of the caller to ensure that the buffer is\n"
-    code += " * large enough to hold all data.\n"
-    code += " */\n"
-    code += f"struct {struct_def.name}\n"
-    code += "{\n"
-    code += "    std::byte* buffer{nullptr};\n"
-    code += "    size_t buffer_size{0};\n"
-    code += "    bool owns_buffer{false};\n"
-
-    # constructor
-    code += "\n"
-    code += f"    explicit {struct_def.name}(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept\n"
-    code += (
-        "        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)\n"
-    )
-    code += "    {\n"
-    code += "    }\n"
-    code += "\n"
-    code += f"    explicit {struct_def.name}(std::span<std::byte> buffer, bool owns_buffer) noexcept\n"
-    code += (
-        f"        : {struct_def.name}(buffer.data(), buffer.size(), owns_buffer)\n"
-    )
-    code += "    {\n"
-    code += "    }\n"
-
-    # destructor
-    code += "\n"
-    code += f"    ~{struct_def.name}() noexcept\n"
-    code += "    {\n"
-    code += "        if (owns_buffer && buffer != nullptr)\n"
-    code += "        {\n"
-    code += "            delete[] buffer;\n"
-    code += "            buffer = nullptr;\n"
-    code += "        }\n"
-    code += "    }\n"
-
-    # delete copy constructor and assignment operator
-    code += "\n"
-    code += "    // disable copy\n"
-    code += f"    {struct_def.name}(const {struct_def.name}&) = delete;\n"
-    code += f"    {struct_def.name}& operator=(const {struct_def.name}&) = delete;\n"
-
-    # implement move constructor and assignment operator
-    code += "\n"
-    code += "    // enable move\n"
-    code += f"    {struct_def.name}({struct_def.name}&& other) noexcept\n"
-    code += "        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)\n"
-    code += "    {\n"
-    code += "        other.buffer = nullptr;\n"
-    code += "        other.buffer_size = 0;\n    }\n"
-    code += f"    {struct_def.name}& operator=({struct_def.name}&& other) noexcept\n"
-    code += "    {\n"
-    code += "        if (this != &other)\n"
-    code += "        {\n"
-    code += "            if (owns_buffer && buffer != nullptr)\n"
-    code += "               delete[] buffer;\n"
-    code += "            buffer = other.buffer;\n"
-    code += "            buffer_size = other.buffer_size;\n"
-    code += "            owns_buffer = other.owns_buffer;\n"
-    code += "            other.buffer = nullptr;\n"
-    code += "            other.buffer_size = 0;\n"
-    code += "            other.owns_buffer = false;\n"
-    code += "        }\n"
-    code += "        return *this;\n    }\n"
-
-    # member functions
-    code += code_body
+    out.write("\n    // --------------------------------------------------------------------------------\n")
+
+    # binary size of fixed-length struct is a compile-time constant
+    if not variable_length:
+        out.write("\n")
+        out.write(f"    static constexpr size_t fastbin_binary_size_v = {aligned_size};\n")
 
     # binary size calculated
-    code += "\n"
-    code += "    constexpr inline size_t fastbin_calc_binary_size() const noexcept\n"
-    code += "    {\n"
-    if struct_def.type_def.variable_length:
-        code += (
-            f"        return {prefix}{member_names[-1]}_offset() + {prefix}{member_names[-1]}_size_aligned();\n"
-        )
+    out.write("\n")
+    out.write("    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept\n")
+    out.write("    {\n")
+    if variable_length:
+        end = f"{prefix}{member_names[-1]}_offset() + {prefix}{member_names[-1]}_size_aligned()"
+        if member_alignment(members[member_names[-1]].type_def) < 8:
+            # structs are always a multiple of 8 bytes, last (packed) member may end before
+            out.write(f"        return ({end} + 7) & ~size_t(7);\n")
+        else:
+            out.write(f"        return {end};\n")
     else:
-        code += f"        return {struct_def.type_def.aligned_size};\n"
-    code += "    }\n"
+        out.write("        return fastbin_binary_size_v;\n")
+    out.write("    }\n")
 
     # binary size
-    code += "\n"
-    code += "    /**\n"
-    code += '     * Returns the stored (aligned) binary size of the object.\n'
-    code += '     * This function should only be called after `fastbin_finalize()`.\n'
-    code += '     */\n'
-    code += "    constexpr inline size_t fastbin_binary_size() const noexcept\n"
-    code += "    {\n"
-    if struct_def.type_def.variable_length:
-        code += f"        return *reinterpret_cast<size_t*>(buffer);\n"
+    out.write("\n")
+    out.write("    /**\n")
+    out.write('     * Returns the stored (aligned) binary size of the object.\n')
+    out.write('     * This function should only be called after `fastbin_finalize()`.\n')
+    out.write('     */\n')
+    out.write("    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept\n")
+    out.write("    {\n")
+    if variable_length:
+        out.write("        size_t binary_size;\n")
+        out.write("        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));\n")
+        out.write("        return binary_size;\n")
     else:
-        code += f"        return {struct_def.type_def.aligned_size};\n"
-    code += "    }\n"
+        out.write("        return fastbin_binary_size_v;\n")
+    out.write("    }\n")
 
     # finalize (write the struct's binary size to the first 8 bytes)
-    code += "\n"
-    code += "    /**\n"
-    code += '     * Finalizes the object by writing the binary size to the beginning of its buffer.\n'
-    code += '     * After calling this function, the underlying buffer can be used for serialization.\n'
-    code += '     * To get the actual buffer size, call `fastbin_binary_size()`.\n'
-    code += '     */\n'
-    code += "    inline void fastbin_finalize() const noexcept\n"
-    code += "    {\n"
-    if struct_def.type_def.variable_length:
-        code += "        *reinterpret_cast<size_t*>(buffer) = fastbin_calc_binary_size();\n"
-    code += "    }\n"
-
-    code += "};\n"
-    code += f"}}; // namespace {ctx.namespace}\n"
+    out.write("\n")
+    out.write("    /**\n")
+    out.write('     * Finalizes the object by writing the binary size to the beginning of its buffer.\n')
+    out.write('     * After calling this function, the underlying buffer can be used for serialization.\n')
+    out.write('     * To get the actual buffer size, call `fastbin_binary_size()`.\n')
+    out.write('     */\n')
+    out.write("    inline void fastbin_finalize() const noexcept\n")
+    out.write("    {\n")
+    if variable_length:
+        out.write("        size_t binary_size = fastbin_calc_binary_size();\n")
+        out.write("        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));\n")
+    out.write("    }\n")
+
+    out.write("};\n")
+
+    # compile-time checks that the C++ types match the sizes the offsets were computed with
+    checked_types: Dict[str, TypeDef] = {}
+    for member_def in members.values():
+        checked_type = member_def.type_def
+        if checked_type.category == "c":
+            assert checked_type.element_type_def is not None
+            checked_type = checked_type.element_type_def
+        if checked_type.category in ("p", "e"):
+            checked_types[checked_type.lang_type] = checked_type
+    if checked_types:
+        out.write("\n")
+    for lang_type, type_def in checked_types.items():
+        out.write(f'static_assert(sizeof({lang_type}) == {type_def.native_size}, "fastbin: unexpected size of `{lang_type}`");\n')
+        out.write(f'static_assert(alignof({lang_type}) <= 8, "fastbin: unexpected alignment of `{lang_type}`");\n')
+
+    # plain memory layout of fixed-length structs
+    if not variable_length:
+        generate_struct_layout(ctx, struct_def, offsets, out)
+
+    out.write(f"}}; // namespace {namespace}\n")
 
     # ostream << operator
-    code += "\n"
-    code += f"inline std::ostream& operator<<(std::ostream& os, const {ctx.namespace}::{struct_def.name}& obj)\n"
-    code += "{\n"
-    code += f'    os << "[{ctx.namespace}::{struct_def.name} size=" << obj.fastbin_binary_size() << " bytes]\\n";\n'
-    for i, (name, member_def) in enumerate(struct_def.members.items()):
-        code += f'    os << "    {name}: " << {ostream_member_output(ctx, member_def)} << "\\n";\n'
-    code += "    return os;\n"
-    code += "}\n"
-
-    return code
+    out.write("\n")
+    out.write(f"inline std::ostream& operator<<(std::ostream& os, const {namespace}::{struct_name}& obj)\n")
+    out.write("{\n")
+    out.write(f'    os << "[{namespace}::{struct_name} size=" << obj.fastbin_binary_size() << " bytes]\\n";\n')
+    for i, (name, member_def) in enumerate(members.items()):
+        out.write(f'    os << "    {name}: " << {ostream_member_output(ctx, member_def)} << "\\n";\n')
+    out.write("    return os;\n")
+    out.write("}\n")
+
+    out.write("\n")
+    out.write(f"#endif // {guard}\n")
+
+
+@contextmanager
+def open_output(path: str, buffering: int = -1) -> Iterator[TextIO]:
+    # written to a temporary file first and moved into place once complete,
+    # so readers (and interrupted runs) never see partially written files
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", buffering=buffering) as file:
+            yield file
+        if os.path.exists(path) and filecmp.cmp(tmp_path, path, shallow=False):
+            # keep unchanged files untouched, so their mtime does not trigger rebuilds
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 
-def generate_single_include_header_file(output_dir: str, ctx: GenContext):
-    code = "#pragma once\n"
-    code += "\n"
+def generate_single_include_header_file(output_dir: str, ctx: GenContext) -> None:
+    code: List[str] = ["#pragma once\n", "\n"]
 
     for enum_name in ctx.enums.keys():
-        code += f'#include "{enum_name}.hpp"\n'
+        code.append(f'#include "{enum_name}.hpp"\n')
 
-    code += "\n"
+    code.append("\n")
 
     for struct_name in ctx.structs.keys():
-        code += f'#include "{struct_name}.hpp"\n'
+        code.append(f'#include "{struct_name}.hpp"\n')
+
+    with open_output(f"{output_dir}/models.hpp") as file:
+        file.write("".join(code))
+
+
+def generate_monolithic_header_file(output_dir: str, ctx: GenContext) -> None:
+    # all enums and structs in a single header, each system header is included once
+    includes: Dict[str, None] = {}
+    for enum_def in ctx.enums.values():
+        includes.update(dict.fromkeys(enum_includes(enum_def)))
+    for struct_def in ctx.structs.values():
+        includes.update(struct_def.sys_includes)
+
+    with open_output(f"{output_dir}/models_all.hpp", buffering=1 << 20) as file:
+        file.write("#pragma once\n")
+        file.write("\n")
+        for include in includes:
+            file.write(f"{include}\n")
+        for enum_def in ctx.enums.values():
+            file.write("\n")
+            generate_enum(ctx, enum_def, file, standalone=False)
+        for struct_def in ctx.structs.values():
+            file.write("\n")
+            generate_struct(ctx, struct_def, file, standalone=False)
+
+
+def generate_type_file(ctx: GenContext, category: str, name: str, path: str) -> None:
+    # generated code is streamed directly into the (buffered) output file
+    with open_output(path, buffering=1 << 20) as file:
+        if category == "e":
+            generate_enum(ctx, ctx.enums[name], file)
+        else:
+            generate_struct(ctx, ctx.structs[name], file)
 
-    with open(f"{output_dir}/models.hpp", "w") as file:
-        file.write(code)
 
+# generation context of a pool worker process, built once per process by init_worker
+_worker_ctx: Optional[GenContext] = None
 
-def generate_cpp_code(schema_file, output_dir: str):
-    with open(schema_file, "r") as file:
-        schema = json.load(file)
 
-    ctx = GenContext(schema)
+def init_worker(schema: dict) -> None:
+    # workers rebuild the context from the plain schema instead of receiving it pickled
+    # with every job (native classes of the mypyc-compiled generator cannot be unpickled)
+    global _worker_ctx
+    _worker_ctx = GenContext(schema)
+
+
+def generate_type_file_in_worker(category: str, name: str, path: str) -> None:
+    assert _worker_ctx is not None
+    generate_type_file(_worker_ctx, category, name, path)
+
+
+def calc_generation_digest(schema_bytes: bytes) -> str:
+    # output depends on the schema and the generator itself
+    digest = hashlib.sha256(schema_bytes)
+    with open(__file__, "rb") as file:
+        digest.update(file.read())
+    return digest.hexdigest()
+
+
+def calc_file_hash(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
 
-    os.makedirs(output_dir, exist_ok=True)
 
-    for enum_name, enum_def in ctx.enums.items():
-        cpp_code = generate_enum(ctx, enum_def)
+def is_generation_up_to_date(output_dir: str, digest: str) -> bool:
+    # cache file holds the generation digest followed by "<sha256> <file>" of every output
+    # file, so deleted or hand-edited outputs are regenerated even if the digest matches
+    try:
+        with open(f"{output_dir}/{CACHE_FILE_NAME}", "r") as file:
+            lines = file.read().splitlines()
+    except FileNotFoundError:
+        return False
+    if len(lines) < 2 or lines[0] != digest:
+        return False
+    for line in lines[1:]:
+        file_hash, _, file_name = line.partition(" ")
+        path = f"{output_dir}/{file_name}"
+        if not os.path.exists(path) or calc_file_hash(path) != file_hash:
+            return False
+    return True
 
-        # write to file
-        with open(f"{output_dir}/{enum_name}.hpp", "w") as file:
-            file.write(cpp_code)
 
-    for struct_name, struct_def in ctx.structs.items():
-        cpp_code = generate_struct(ctx, struct_def)
+def write_generation_cache(output_dir: str, digest: str, file_names: List[str]) -> None:
+    lines = [digest]
+    for file_name in file_names:
+        lines.append(f"{calc_file_hash(f'{output_dir}/{file_name}')} {file_name}")
+    with open_output(f"{output_dir}/{CACHE_FILE_NAME}") as file:
+        file.write("\n".join(lines) + "\n")
 
-        # write to file
-        with open(f"{output_dir}/{struct_name}.hpp", "w") as file:
-            file.write(cpp_code)
+
+def generate_cpp_code(
+    schema_file: str,
+    output_dir: str,
+    parallel_min_types: int = PARALLEL_MIN_TYPES,
+    force: bool = False,
+) -> None:
+    with open(schema_file, "rb") as file:
+        schema_bytes = file.read()
+
+    # skip generation if neither schema, generator nor generated files changed since the last run
+    digest = calc_generation_digest(schema_bytes)
+    if not force and is_generation_up_to_date(output_dir, digest):
+        print(f"Generated code in {output_dir} is up to date")
+        return
+
+    schema = json_loads(schema_bytes)
+
+    ctx = GenContext(schema)
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    # every enum/struct is written to its own file, independent of all others
+    jobs = [("e", name, f"{output_dir}/{name}.hpp") for name in ctx.enums.keys()]
+    jobs += [("s", name, f"{output_dir}/{name}.hpp") for name in ctx.structs.keys()]
+
+    if len(jobs) < parallel_min_types:
+        for category, name, path in jobs:
+            generate_type_file(ctx, category, name, path)
+    else:
+        n_workers = os.cpu_count() or 1
+        chunksize = max(1, len(jobs) // (4 * n_workers))
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=init_worker, initargs=(schema,)
+        ) as executor:
+            categories, names, paths = zip(*jobs)
+            results = executor.map(
+                generate_type_file_in_worker,
+                categories,
+                names,
+                paths,
+                chunksize=chunksize,
+            )
+            list(results)  # propagate exceptions of workers
 
     # single include header file
     generate_single_include_header_file(output_dir, ctx)
 
+    # single header file containing all definitions
+    generate_monolithic_header_file(output_dir, ctx)
+
+    # written last, so an interrupted run is not considered up to date
+    file_names = [os.path.basename(path) for _, _, path in jobs]
+    file_names += ["models.hpp", "models_all.hpp"]
+    write_generation_cache(output_dir, digest, file_names)
+
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python fastbin_cpp.py <schema.json> <output_dir>")
+    # --force regenerates all files, even if the generated code is up to date
+    force = "--force" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--force"]
+    if len(args) != 2:
+        print("Usage: python fastbin_cpp.py [--force] <schema.json> <output_dir>")
         sys.exit(1)
 
-    schema_file = sys.argv[1]
-    output_dir = sys.argv[2]
-    generate_cpp_code(schema_file, output_dir)
+    schema_file = args[0]
+    output_dir = args[1]
+    generate_cpp_code(schema_file, output_dir, force=force)
@@ -1,3 +1,13 @@
 #!/bin/sh
 
-python3 fastbin_cpp.py ../schema.json generated
+# FASTBIN_MYPYC=1 compiles the generator with mypyc first (faster for large schemas)
+if [ "$FASTBIN_MYPYC" = "1" ]; then
+    mypyc fastbin_cpp.py >/dev/null || exit 1
+    # the compiled module takes precedence over fastbin_cpp.py, check its (parallel) generation first
+    python3 tests/test_fastbin_cpp.py >/dev/null || exit 1
+    python3 -c "import sys, fastbin_cpp; fastbin_cpp.generate_cpp_code(sys.argv[1], sys.argv[2])" ../schema.json generated
+    python3 -c "import sys, fastbin_cpp; fastbin_cpp.generate_cpp_code(sys.argv[1], sys.argv[2])" ../schema_packed.json generated_packed
+else
+    python3 fastbin_cpp.py ../schema.json generated
+    python3 fastbin_cpp.py ../schema_packed.json generated_packed
+fi
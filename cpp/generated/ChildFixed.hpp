@@ -2,9 +2,13 @@
 
 #include <cstddef>
 #include <cassert>
+#include <cstdint>
+#include <cstring>
 #include <ostream>
 #include <span>
-#include <cstdint>
+
+#ifndef FASTBIN_TYPE_my_models_ChildFixed
+#define FASTBIN_TYPE_my_models_ChildFixed
 
 namespace my_models
 {
@@ -16,7 +20,7 @@ namespace my_models
  * The `finalize()` method MUST be called after all setter methods have been called.
  * 
  * It is the responsibility of the caller to ensure that the buffer is
- * large enough to hold all data.
+ * large enough to hold all data, and that it is aligned to 8 bytes.
  */
 struct ChildFixed
 {
@@ -27,6 +31,8 @@ struct ChildFixed
     explicit ChildFixed(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
         : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
     {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
     }
 
     explicit ChildFixed(std::span<std::byte> buffer, bool owns_buffer) noexcept
@@ -70,64 +76,84 @@ struct ChildFixed
         return *this;
     }
 
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
     // Member: field1 [std::int32_t]
 
-    inline std::int32_t field1() const noexcept
+    [[nodiscard]] inline std::int32_t field1() const noexcept
     {
-        return *reinterpret_cast<const std::int32_t*>(buffer + _field1_offset());
+        std::int32_t value;
+        std::memcpy(&value, _aligned_buffer() + _field1_offset(), sizeof(value));
+        return value;
     }
 
     inline void field1(const std::int32_t value) noexcept
     {
-        *reinterpret_cast<std::int32_t*>(buffer + _field1_offset()) = value;
+        std::memcpy(_aligned_buffer() + _field1_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _field1_offset() const noexcept
+    static constexpr size_t _field1_offset_v = 0;
+
+    [[nodiscard]] constexpr inline size_t _field1_offset() const noexcept
     {
-        return 0;
+        return _field1_offset_v;
     }
 
-    constexpr inline size_t _field1_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _field1_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: field2 [std::int32_t]
 
-    inline std::int32_t field2() const noexcept
+    [[nodiscard]] inline std::int32_t field2() const noexcept
     {
-        return *reinterpret_cast<const std::int32_t*>(buffer + _field2_offset());
+        std::int32_t value;
+        std::memcpy(&value, _aligned_buffer() + _field2_offset(), sizeof(value));
+        return value;
     }
 
     inline void field2(const std::int32_t value) noexcept
     {
-        *reinterpret_cast<std::int32_t*>(buffer + _field2_offset()) = value;
+        std::memcpy(_aligned_buffer() + _field2_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _field2_offset() const noexcept
+    static constexpr size_t _field2_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _field2_offset() const noexcept
     {
-        return 8;
+        return _field2_offset_v;
     }
 
-    constexpr inline size_t _field2_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _field2_size_aligned() const noexcept
     {
         return 8;
     }
 
     // --------------------------------------------------------------------------------
 
-    constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    static constexpr size_t fastbin_binary_size_v = 16;
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
     {
-        return 16;
+        return fastbin_binary_size_v;
     }
 
     /**
      * Returns the stored (aligned) binary size of the object.
      * This function should only be called after `fastbin_finalize()`.
      */
-    constexpr inline size_t fastbin_binary_size() const noexcept
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
     {
-        return 16;
+        return fastbin_binary_size_v;
     }
 
     /**
@@ -139,6 +165,24 @@ struct ChildFixed
     {
     }
 };
+
+static_assert(sizeof(std::int32_t) == 4, "fastbin: unexpected size of `std::int32_t`");
+static_assert(alignof(std::int32_t) <= 8, "fastbin: unexpected alignment of `std::int32_t`");
+
+/**
+ * Plain memory layout of `ChildFixed` with explicit padding.
+ * The buffer of a `ChildFixed` can be copied from/to it using `std::memcpy` or `std::bit_cast`.
+ */
+struct ChildFixed_layout
+{
+    std::int32_t field1;
+    std::byte _field1_padding[4];
+    std::int32_t field2;
+    std::byte _field2_padding[4];
+};
+static_assert(sizeof(ChildFixed_layout) == 16);
+static_assert(offsetof(ChildFixed_layout, field1) == 0);
+static_assert(offsetof(ChildFixed_layout, field2) == 8);
 }; // namespace my_models
 
 inline std::ostream& operator<<(std::ostream& os, const my_models::ChildFixed& obj)
@@ -148,3 +192,5 @@ inline std::ostream& operator<<(std::ostream& os, const my_models::ChildFixed& o
     os << "    field2: " << obj.field2() << "\n";
     return os;
 }
+
+#endif // FASTBIN_TYPE_my_models_ChildFixed
@@ -2,11 +2,15 @@
 
 #include <cstddef>
 #include <cassert>
+#include <cstdint>
+#include <cstring>
 #include <ostream>
 #include <span>
-#include <cstdint>
 #include <string_view>
 
+#ifndef FASTBIN_TYPE_my_models_ChildVar
+#define FASTBIN_TYPE_my_models_ChildVar
+
 namespace my_models
 {
 /**
@@ -23,7 +27,7 @@ namespace my_models
  * The `finalize()` method MUST be called after all setter methods have been called.
  * 
  * It is the responsibility of the caller to ensure that the buffer is
- * large enough to hold all data.
+ * large enough to hold all data, and that it is aligned to 8 bytes.
  */
 struct ChildVar
 {
@@ -34,6 +38,8 @@ struct ChildVar
     explicit ChildVar(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
         : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
     {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
     }
 
     explicit ChildVar(std::span<std::byte> buffer, bool owns_buffer) noexcept
@@ -77,35 +83,51 @@ struct ChildVar
         return *this;
     }
 
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
     // Member: field1 [std::int32_t]
 
-    inline std::int32_t field1() const noexcept
+    [[nodiscard]] inline std::int32_t field1() const noexcept
     {
-        return *reinterpret_cast<const std::int32_t*>(buffer + _field1_offset());
+        std::int32_t value;
+        std::memcpy(&value, _aligned_buffer() + _field1_offset(), sizeof(value));
+        return value;
     }
 
     inline void field1(const std::int32_t value) noexcept
     {
-        *reinterpret_cast<std::int32_t*>(buffer + _field1_offset()) = value;
+        std::memcpy(_aligned_buffer() + _field1_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _field1_offset() const noexcept
+    static constexpr size_t _field1_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _field1_offset() const noexcept
     {
-        return 8;
+        return _field1_offset_v;
     }
 
-    constexpr inline size_t _field1_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _field1_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: field2 [std::string_view]
 
-    inline std::string_view field2() const noexcept
+    [[nodiscard]] inline std::string_view field2() const noexcept
     {
         size_t n_bytes = _field2_size_unaligned() - 8;
         size_t count = n_bytes;
-        auto ptr = reinterpret_cast<const char*>(buffer + _field2_offset() + 8);
+        auto ptr = reinterpret_cast<const char*>(_aligned_buffer() + _field2_offset() + 8);
         return std::string_view(ptr, count);
     }
 
@@ -117,35 +139,37 @@ struct ChildVar
         size_t aligned_size = (unaligned_size + 7) & ~7;
         size_t aligned_diff = aligned_size - unaligned_size;
         size_t aligned_size_high = aligned_size | (aligned_diff << 56);
-        *reinterpret_cast<size_t*>(buffer + offset) = aligned_size_high;
-        auto dest_ptr = reinterpret_cast<std::byte*>(buffer + offset + 8);
-        auto src_ptr = reinterpret_cast<const std::byte*>(value.data());
-        std::copy(src_ptr, src_ptr + contents_size, dest_ptr);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
     }
 
-    constexpr inline size_t _field2_offset() const noexcept
+    static constexpr size_t _field2_offset_v = 16;
+
+    [[nodiscard]] constexpr inline size_t _field2_offset() const noexcept
     {
-        return 16;
+        return _field2_offset_v;
     }
 
-    constexpr inline size_t _field2_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _field2_size_aligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _field2_offset());
-        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _field2_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
         return aligned_size;
     }
 
-    constexpr inline size_t _field2_size_unaligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _field2_size_unaligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _field2_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _field2_offset(), sizeof(stored_size));
         size_t aligned_diff = stored_size >> 56;
-        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;
+        size_t aligned_size = stored_size & _size_mask_v;
         return aligned_size - aligned_diff;
     }
 
     // --------------------------------------------------------------------------------
 
-    constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
     {
         return _field2_offset() + _field2_size_aligned();
     }
@@ -154,9 +178,11 @@ struct ChildVar
      * Returns the stored (aligned) binary size of the object.
      * This function should only be called after `fastbin_finalize()`.
      */
-    constexpr inline size_t fastbin_binary_size() const noexcept
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
     {
-        return *reinterpret_cast<size_t*>(buffer);
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
     }
 
     /**
@@ -166,9 +192,15 @@ struct ChildVar
      */
     inline void fastbin_finalize() const noexcept
     {
-        *reinterpret_cast<size_t*>(buffer) = fastbin_calc_binary_size();
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
     }
 };
+
+static_assert(sizeof(std::int32_t) == 4, "fastbin: unexpected size of `std::int32_t`");
+static_assert(alignof(std::int32_t) <= 8, "fastbin: unexpected alignment of `std::int32_t`");
+static_assert(sizeof(char) == 1, "fastbin: unexpected size of `char`");
+static_assert(alignof(char) <= 8, "fastbin: unexpected alignment of `char`");
 }; // namespace my_models
 
 inline std::ostream& operator<<(std::ostream& os, const my_models::ChildVar& obj)
@@ -178,3 +210,5 @@ inline std::ostream& operator<<(std::ostream& os, const my_models::ChildVar& obj
     os << "    field2: " << std::string(obj.field2()) << "\n";
     return os;
 }
+
+#endif // FASTBIN_TYPE_my_models_ChildVar
@@ -0,0 +1,211 @@
+#pragma once
+
+#include <cstddef>
+#include <cassert>
+#include <cstdint>
+#include <cstring>
+#include <ostream>
+#include <span>
+
+#ifndef FASTBIN_TYPE_my_models_Float32Vector
+#define FASTBIN_TYPE_my_models_Float32Vector
+
+namespace my_models
+{
+/**
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has variable size.
+ * All setter methods starting from the first variable-sized member and afterwards MUST be called in order.
+ *
+ * Members in order
+ * ================
+ * - `values` [`std::span<float>`] (variable)
+ * - `count` [`std::uint32_t`] (fixed)
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct Float32Vector
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit Float32Vector(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit Float32Vector(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : Float32Vector(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~Float32Vector() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    Float32Vector(const Float32Vector&) = delete;
+    Float32Vector& operator=(const Float32Vector&) = delete;
+
+    // enable move
+    Float32Vector(Float32Vector&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    Float32Vector& operator=(Float32Vector&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
+    // Member: values [std::span<float>]
+
+    [[nodiscard]] inline std::span<float> values() const noexcept
+    {
+        size_t n_bytes = _values_size_unaligned() - 8;
+        size_t count = n_bytes >> 2;
+        auto ptr = reinterpret_cast<float*>(_aligned_buffer() + _values_offset() + 8);
+        return std::span<float>(ptr, count);
+    }
+
+    inline void values(const std::span<float> value) noexcept
+    {
+        size_t offset = _values_offset();
+        size_t contents_size = value.size() * 4;
+        size_t unaligned_size = 8 + contents_size;
+        size_t aligned_size = (unaligned_size + 7) & ~7;
+        size_t aligned_diff = aligned_size - unaligned_size;
+        size_t aligned_size_high = aligned_size | (aligned_diff << 56);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    static constexpr size_t _values_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _values_offset() const noexcept
+    {
+        return _values_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _values_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _values_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _values_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _values_offset(), sizeof(stored_size));
+        size_t aligned_diff = stored_size >> 56;
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size - aligned_diff;
+    }
+
+    // Member: count [std::uint32_t]
+
+    [[nodiscard]] inline std::uint32_t count() const noexcept
+    {
+        std::uint32_t value;
+        std::memcpy(&value, _aligned_buffer() + _count_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void count(const std::uint32_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _count_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _count_offset() const noexcept
+    {
+        return _values_offset() + _values_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _count_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return _count_offset() + _count_size_aligned();
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
+    }
+};
+
+static_assert(sizeof(float) == 4, "fastbin: unexpected size of `float`");
+static_assert(alignof(float) <= 8, "fastbin: unexpected alignment of `float`");
+static_assert(sizeof(std::uint32_t) == 4, "fastbin: unexpected size of `std::uint32_t`");
+static_assert(alignof(std::uint32_t) <= 8, "fastbin: unexpected alignment of `std::uint32_t`");
+}; // namespace my_models
+
+inline std::ostream& operator<<(std::ostream& os, const my_models::Float32Vector& obj)
+{
+    os << "[my_models::Float32Vector size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    values: " << "[vector<float32> count=" << obj.values().size() << "]" << "\n";
+    os << "    count: " << obj.count() << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_Float32Vector
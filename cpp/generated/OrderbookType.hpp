@@ -1,9 +1,14 @@
 #pragma once
 
 #include <string>
+#include <string_view>
+#include <stdexcept>
 #include <ostream>
 #include <cstdint>
 
+#ifndef FASTBIN_TYPE_my_models_OrderbookType
+#define FASTBIN_TYPE_my_models_OrderbookType
+
 namespace my_models
 {
 enum class OrderbookType : std::uint8_t
@@ -13,7 +18,7 @@ enum class OrderbookType : std::uint8_t
 };
 }; // namespace my_models
 
-inline std::string to_string(my_models::OrderbookType value)
+[[nodiscard]] constexpr std::string_view to_string_view(my_models::OrderbookType value) noexcept
 {
     switch (value)
     {
@@ -26,8 +31,38 @@ inline std::string to_string(my_models::OrderbookType value)
     }
 }
 
+inline std::string to_string(my_models::OrderbookType value)
+{
+    return std::string(to_string_view(value));
+}
+
+namespace my_models
+{
+template <typename T>
+T from_string(std::string_view str);
+
+template <>
+inline my_models::OrderbookType from_string<my_models::OrderbookType>(std::string_view str)
+{
+    switch (str.size())
+    {
+        case 8:
+            if (str == "Snapshot")
+                return my_models::OrderbookType::Snapshot;
+            break;
+        case 5:
+            if (str == "Delta")
+                return my_models::OrderbookType::Delta;
+            break;
+    }
+    throw std::invalid_argument("Invalid string value for enum my_models::OrderbookType: " + std::string(str));
+}
+}; // namespace my_models
+
 inline std::ostream& operator<<(std::ostream& os, const my_models::OrderbookType& obj)
 {
-    os << to_string(obj);
+    os << to_string_view(obj);
     return os;
 }
+
+#endif // FASTBIN_TYPE_my_models_OrderbookType
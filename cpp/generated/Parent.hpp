@@ -2,13 +2,17 @@
 
 #include <cstddef>
 #include <cassert>
+#include <cstdint>
+#include <cstring>
 #include <ostream>
 #include <span>
-#include <cstdint>
 #include <string_view>
 #include "ChildFixed.hpp"
 #include "ChildVar.hpp"
 
+#ifndef FASTBIN_TYPE_my_models_Parent
+#define FASTBIN_TYPE_my_models_Parent
+
 namespace my_models
 {
 /**
@@ -27,7 +31,7 @@ namespace my_models
  * The `finalize()` method MUST be called after all setter methods have been called.
  * 
  * It is the responsibility of the caller to ensure that the buffer is
- * large enough to hold all data.
+ * large enough to hold all data, and that it is aligned to 8 bytes.
  */
 struct Parent
 {
@@ -38,6 +42,8 @@ struct Parent
     explicit Parent(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
         : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
     {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
     }
 
     explicit Parent(std::span<std::byte> buffer, bool owns_buffer) noexcept
@@ -81,33 +87,49 @@ struct Parent
         return *this;
     }
 
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
     // Member: field1 [std::int32_t]
 
-    inline std::int32_t field1() const noexcept
+    [[nodiscard]] inline std::int32_t field1() const noexcept
     {
-        return *reinterpret_cast<const std::int32_t*>(buffer + _field1_offset());
+        std::int32_t value;
+        std::memcpy(&value, _aligned_buffer() + _field1_offset(), sizeof(value));
+        return value;
     }
 
     inline void field1(const std::int32_t value) noexcept
     {
-        *reinterpret_cast<std::int32_t*>(buffer + _field1_offset()) = value;
+        std::memcpy(_aligned_buffer() + _field1_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _field1_offset() const noexcept
+    static constexpr size_t _field1_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _field1_offset() const noexcept
     {
-        return 8;
+        return _field1_offset_v;
     }
 
-    constexpr inline size_t _field1_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _field1_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: child1 [ChildFixed]
 
-    inline ChildFixed child1() const noexcept
+    [[nodiscard]] inline ChildFixed child1() const noexcept
     {
-        auto ptr = buffer + _child1_offset();
+        auto ptr = _aligned_buffer() + _child1_offset();
         return ChildFixed(ptr, _child1_size_aligned(), false);
     }
 
@@ -116,24 +138,26 @@ struct Parent
         assert(value.fastbin_binary_size() > 0 && "Cannot set member `child1`, parameter struct of type `ChildFixed` not finalized. Call fastbin_finalize() on struct after creation.");
         size_t offset = _child1_offset();
         size_t size = value.fastbin_binary_size();
-        std::copy(value.buffer, value.buffer + size, buffer + offset);
+        std::memcpy(_aligned_buffer() + offset, value.buffer, size);
     }
 
-    constexpr inline size_t _child1_offset() const noexcept
+    static constexpr size_t _child1_offset_v = 16;
+
+    [[nodiscard]] constexpr inline size_t _child1_offset() const noexcept
     {
-        return 16;
+        return _child1_offset_v;
     }
 
-    constexpr inline size_t _child1_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _child1_size_aligned() const noexcept
     {
         return 16;
     }
 
     // Member: child2 [ChildVar]
 
-    inline ChildVar child2() const noexcept
+    [[nodiscard]] inline ChildVar child2() const noexcept
     {
-        auto ptr = buffer + _child2_offset();
+        auto ptr = _aligned_buffer() + _child2_offset();
         return ChildVar(ptr, _child2_size_aligned(), false);
     }
 
@@ -142,26 +166,30 @@ struct Parent
         assert(value.fastbin_binary_size() > 0 && "Cannot set member `child2`, parameter struct of type `ChildVar` not finalized. Call fastbin_finalize() on struct after creation.");
         size_t offset = _child2_offset();
         size_t size = value.fastbin_binary_size();
-        std::copy(value.buffer, value.buffer + size, buffer + offset);
+        std::memcpy(_aligned_buffer() + offset, value.buffer, size);
     }
 
-    constexpr inline size_t _child2_offset() const noexcept
+    static constexpr size_t _child2_offset_v = 32;
+
+    [[nodiscard]] constexpr inline size_t _child2_offset() const noexcept
     {
-        return 32;
+        return _child2_offset_v;
     }
 
-    constexpr inline size_t _child2_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _child2_size_aligned() const noexcept
     {
-        return *reinterpret_cast<size_t*>(buffer + _child2_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _child2_offset(), sizeof(stored_size));
+        return stored_size;
     }
 
     // Member: str [std::string_view]
 
-    inline std::string_view str() const noexcept
+    [[nodiscard]] inline std::string_view str() const noexcept
     {
         size_t n_bytes = _str_size_unaligned() - 8;
         size_t count = n_bytes;
-        auto ptr = reinterpret_cast<const char*>(buffer + _str_offset() + 8);
+        auto ptr = reinterpret_cast<const char*>(_aligned_buffer() + _str_offset() + 8);
         return std::string_view(ptr, count);
     }
 
@@ -173,35 +201,35 @@ struct Parent
         size_t aligned_size = (unaligned_size + 7) & ~7;
         size_t aligned_diff = aligned_size - unaligned_size;
         size_t aligned_size_high = aligned_size | (aligned_diff << 56);
-        *reinterpret_cast<size_t*>(buffer + offset) = aligned_size_high;
-        auto dest_ptr = reinterpret_cast<std::byte*>(buffer + offset + 8);
-        auto src_ptr = reinterpret_cast<const std::byte*>(value.data());
-        std::copy(src_ptr, src_ptr + contents_size, dest_ptr);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
     }
 
-    constexpr inline size_t _str_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _str_offset() const noexcept
     {
         return _child2_offset() + _child2_size_aligned();
     }
 
-    constexpr inline size_t _str_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _str_size_aligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _str_offset());
-        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _str_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
         return aligned_size;
     }
 
-    constexpr inline size_t _str_size_unaligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _str_size_unaligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _str_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _str_offset(), sizeof(stored_size));
         size_t aligned_diff = stored_size >> 56;
-        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;
+        size_t aligned_size = stored_size & _size_mask_v;
         return aligned_size - aligned_diff;
     }
 
     // --------------------------------------------------------------------------------
 
-    constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
     {
         return _str_offset() + _str_size_aligned();
     }
@@ -210,9 +238,11 @@ struct Parent
      * Returns the stored (aligned) binary size of the object.
      * This function should only be called after `fastbin_finalize()`.
      */
-    constexpr inline size_t fastbin_binary_size() const noexcept
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
     {
-        return *reinterpret_cast<size_t*>(buffer);
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
     }
 
     /**
@@ -222,9 +252,15 @@ struct Parent
      */
     inline void fastbin_finalize() const noexcept
     {
-        *reinterpret_cast<size_t*>(buffer) = fastbin_calc_binary_size();
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
     }
 };
+
+static_assert(sizeof(std::int32_t) == 4, "fastbin: unexpected size of `std::int32_t`");
+static_assert(alignof(std::int32_t) <= 8, "fastbin: unexpected alignment of `std::int32_t`");
+static_assert(sizeof(char) == 1, "fastbin: unexpected size of `char`");
+static_assert(alignof(char) <= 8, "fastbin: unexpected alignment of `char`");
 }; // namespace my_models
 
 inline std::ostream& operator<<(std::ostream& os, const my_models::Parent& obj)
@@ -236,3 +272,5 @@ inline std::ostream& operator<<(std::ostream& os, const my_models::Parent& obj)
     os << "    str: " << std::string(obj.str()) << "\n";
     return os;
 }
+
+#endif // FASTBIN_TYPE_my_models_Parent
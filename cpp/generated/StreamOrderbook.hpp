@@ -2,12 +2,16 @@
 
 #include <cstddef>
 #include <cassert>
+#include <cstdint>
+#include <cstring>
 #include <ostream>
 #include <span>
-#include <cstdint>
 #include <string_view>
 #include "OrderbookType.hpp"
 
+#ifndef FASTBIN_TYPE_my_models_StreamOrderbook
+#define FASTBIN_TYPE_my_models_StreamOrderbook
+
 namespace my_models
 {
 /**
@@ -38,7 +42,7 @@ namespace my_models
  * The `finalize()` method MUST be called after all setter methods have been called.
  * 
  * It is the responsibility of the caller to ensure that the buffer is
- * large enough to hold all data.
+ * large enough to hold all data, and that it is aligned to 8 bytes.
  */
 struct StreamOrderbook
 {
@@ -49,6 +53,8 @@ struct StreamOrderbook
     explicit StreamOrderbook(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
         : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
     {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
     }
 
     explicit StreamOrderbook(std::span<std::byte> buffer, bool owns_buffer) noexcept
@@ -92,123 +98,155 @@ struct StreamOrderbook
         return *this;
     }
 
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
     // Member: server_time [std::int64_t]
 
-    inline std::int64_t server_time() const noexcept
+    [[nodiscard]] inline std::int64_t server_time() const noexcept
     {
-        return *reinterpret_cast<const std::int64_t*>(buffer + _server_time_offset());
+        std::int64_t value;
+        std::memcpy(&value, _aligned_buffer() + _server_time_offset(), sizeof(value));
+        return value;
     }
 
     inline void server_time(const std::int64_t value) noexcept
     {
-        *reinterpret_cast<std::int64_t*>(buffer + _server_time_offset()) = value;
+        std::memcpy(_aligned_buffer() + _server_time_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _server_time_offset() const noexcept
+    static constexpr size_t _server_time_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _server_time_offset() const noexcept
     {
-        return 8;
+        return _server_time_offset_v;
     }
 
-    constexpr inline size_t _server_time_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _server_time_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: recv_time [std::int64_t]
 
-    inline std::int64_t recv_time() const noexcept
+    [[nodiscard]] inline std::int64_t recv_time() const noexcept
     {
-        return *reinterpret_cast<const std::int64_t*>(buffer + _recv_time_offset());
+        std::int64_t value;
+        std::memcpy(&value, _aligned_buffer() + _recv_time_offset(), sizeof(value));
+        return value;
     }
 
     inline void recv_time(const std::int64_t value) noexcept
     {
-        *reinterpret_cast<std::int64_t*>(buffer + _recv_time_offset()) = value;
+        std::memcpy(_aligned_buffer() + _recv_time_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _recv_time_offset() const noexcept
+    static constexpr size_t _recv_time_offset_v = 16;
+
+    [[nodiscard]] constexpr inline size_t _recv_time_offset() const noexcept
     {
-        return 16;
+        return _recv_time_offset_v;
     }
 
-    constexpr inline size_t _recv_time_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _recv_time_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: cts [std::int64_t]
 
-    inline std::int64_t cts() const noexcept
+    [[nodiscard]] inline std::int64_t cts() const noexcept
     {
-        return *reinterpret_cast<const std::int64_t*>(buffer + _cts_offset());
+        std::int64_t value;
+        std::memcpy(&value, _aligned_buffer() + _cts_offset(), sizeof(value));
+        return value;
     }
 
     inline void cts(const std::int64_t value) noexcept
     {
-        *reinterpret_cast<std::int64_t*>(buffer + _cts_offset()) = value;
+        std::memcpy(_aligned_buffer() + _cts_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _cts_offset() const noexcept
+    static constexpr size_t _cts_offset_v = 24;
+
+    [[nodiscard]] constexpr inline size_t _cts_offset() const noexcept
     {
-        return 24;
+        return _cts_offset_v;
     }
 
-    constexpr inline size_t _cts_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _cts_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: type [OrderbookType]
 
-    inline OrderbookType type() const noexcept
+    [[nodiscard]] inline OrderbookType type() const noexcept
     {
-        return static_cast<OrderbookType>(*reinterpret_cast<const OrderbookType*>(buffer + _type_offset()));
+        OrderbookType value;
+        std::memcpy(&value, _aligned_buffer() + _type_offset(), sizeof(value));
+        return value;
     }
 
     inline void type(const OrderbookType value) noexcept
     {
-        *reinterpret_cast<OrderbookType*>(buffer + _type_offset()) = static_cast<OrderbookType>(value);
+        std::memcpy(_aligned_buffer() + _type_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _type_offset() const noexcept
+    static constexpr size_t _type_offset_v = 32;
+
+    [[nodiscard]] constexpr inline size_t _type_offset() const noexcept
     {
-        return 32;
+        return _type_offset_v;
     }
 
-    constexpr inline size_t _type_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _type_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: depth [std::uint16_t]
 
-    inline std::uint16_t depth() const noexcept
+    [[nodiscard]] inline std::uint16_t depth() const noexcept
     {
-        return *reinterpret_cast<const std::uint16_t*>(buffer + _depth_offset());
+        std::uint16_t value;
+        std::memcpy(&value, _aligned_buffer() + _depth_offset(), sizeof(value));
+        return value;
     }
 
     inline void depth(const std::uint16_t value) noexcept
     {
-        *reinterpret_cast<std::uint16_t*>(buffer + _depth_offset()) = value;
+        std::memcpy(_aligned_buffer() + _depth_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _depth_offset() const noexcept
+    static constexpr size_t _depth_offset_v = 40;
+
+    [[nodiscard]] constexpr inline size_t _depth_offset() const noexcept
     {
-        return 40;
+        return _depth_offset_v;
     }
 
-    constexpr inline size_t _depth_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _depth_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: symbol [std::string_view]
 
-    inline std::string_view symbol() const noexcept
+    [[nodiscard]] inline std::string_view symbol() const noexcept
     {
         size_t n_bytes = _symbol_size_unaligned() - 8;
         size_t count = n_bytes;
-        auto ptr = reinterpret_cast<const char*>(buffer + _symbol_offset() + 8);
+        auto ptr = reinterpret_cast<const char*>(_aligned_buffer() + _symbol_offset() + 8);
         return std::string_view(ptr, count);
     }
 
@@ -220,83 +258,89 @@ struct StreamOrderbook
         size_t aligned_size = (unaligned_size + 7) & ~7;
         size_t aligned_diff = aligned_size - unaligned_size;
         size_t aligned_size_high = aligned_size | (aligned_diff << 56);
-        *reinterpret_cast<size_t*>(buffer + offset) = aligned_size_high;
-        auto dest_ptr = reinterpret_cast<std::byte*>(buffer + offset + 8);
-        auto src_ptr = reinterpret_cast<const std::byte*>(value.data());
-        std::copy(src_ptr, src_ptr + contents_size, dest_ptr);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
     }
 
-    constexpr inline size_t _symbol_offset() const noexcept
+    static constexpr size_t _symbol_offset_v = 48;
+
+    [[nodiscard]] constexpr inline size_t _symbol_offset() const noexcept
     {
-        return 48;
+        return _symbol_offset_v;
     }
 
-    constexpr inline size_t _symbol_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _symbol_size_aligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _symbol_offset());
-        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _symbol_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
         return aligned_size;
     }
 
-    constexpr inline size_t _symbol_size_unaligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _symbol_size_unaligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _symbol_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _symbol_offset(), sizeof(stored_size));
         size_t aligned_diff = stored_size >> 56;
-        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;
+        size_t aligned_size = stored_size & _size_mask_v;
         return aligned_size - aligned_diff;
     }
 
     // Member: update_id [std::uint64_t]
 
-    inline std::uint64_t update_id() const noexcept
+    [[nodiscard]] inline std::uint64_t update_id() const noexcept
     {
-        return *reinterpret_cast<const std::uint64_t*>(buffer + _update_id_offset());
+        std::uint64_t value;
+        std::memcpy(&value, _aligned_buffer() + _update_id_offset(), sizeof(value));
+        return value;
     }
 
     inline void update_id(const std::uint64_t value) noexcept
     {
-        *reinterpret_cast<std::uint64_t*>(buffer + _update_id_offset()) = value;
+        std::memcpy(_aligned_buffer() + _update_id_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _update_id_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _update_id_offset() const noexcept
     {
         return _symbol_offset() + _symbol_size_aligned();
     }
 
-    constexpr inline size_t _update_id_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _update_id_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: seq_num [std::uint64_t]
 
-    inline std::uint64_t seq_num() const noexcept
+    [[nodiscard]] inline std::uint64_t seq_num() const noexcept
     {
-        return *reinterpret_cast<const std::uint64_t*>(buffer + _seq_num_offset());
+        std::uint64_t value;
+        std::memcpy(&value, _aligned_buffer() + _seq_num_offset(), sizeof(value));
+        return value;
     }
 
     inline void seq_num(const std::uint64_t value) noexcept
     {
-        *reinterpret_cast<std::uint64_t*>(buffer + _seq_num_offset()) = value;
+        std::memcpy(_aligned_buffer() + _seq_num_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _seq_num_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _seq_num_offset() const noexcept
     {
         return _update_id_offset() + _update_id_size_aligned();
     }
 
-    constexpr inline size_t _seq_num_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _seq_num_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: bid_prices [std::span<double>]
 
-    inline std::span<double> bid_prices() const noexcept
+    [[nodiscard]] inline std::span<double> bid_prices() const noexcept
     {
         size_t n_bytes = _bid_prices_size_unaligned() - 8;
         size_t count = n_bytes >> 3;
-        auto ptr = reinterpret_cast<double*>(buffer + _bid_prices_offset() + 8);
+        auto ptr = reinterpret_cast<double*>(_aligned_buffer() + _bid_prices_offset() + 8);
         return std::span<double>(ptr, count);
     }
 
@@ -304,36 +348,37 @@ struct StreamOrderbook
     {
         size_t offset = _bid_prices_offset();
         size_t contents_size = value.size() * 8;
-        *reinterpret_cast<size_t*>(buffer + offset) = 8 + contents_size;
-        auto dest_ptr = reinterpret_cast<std::byte*>(buffer + offset + 8);
-        auto src_ptr = reinterpret_cast<const std::byte*>(value.data());
-        std::copy(src_ptr, src_ptr + contents_size, dest_ptr);
+        size_t stored_size = 8 + contents_size;
+        std::memcpy(_aligned_buffer() + offset, &stored_size, sizeof(stored_size));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
     }
 
-    constexpr inline size_t _bid_prices_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _bid_prices_offset() const noexcept
     {
         return _seq_num_offset() + _seq_num_size_aligned();
     }
 
-    constexpr inline size_t _bid_prices_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _bid_prices_size_aligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _bid_prices_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _bid_prices_offset(), sizeof(stored_size));
         return stored_size;
     }
 
-    constexpr inline size_t _bid_prices_size_unaligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _bid_prices_size_unaligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _bid_prices_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _bid_prices_offset(), sizeof(stored_size));
         return stored_size;
     }
 
     // Member: bid_quantities [std::span<double>]
 
-    inline std::span<double> bid_quantities() const noexcept
+    [[nodiscard]] inline std::span<double> bid_quantities() const noexcept
     {
         size_t n_bytes = _bid_quantities_size_unaligned() - 8;
         size_t count = n_bytes >> 3;
-        auto ptr = reinterpret_cast<double*>(buffer + _bid_quantities_offset() + 8);
+        auto ptr = reinterpret_cast<double*>(_aligned_buffer() + _bid_quantities_offset() + 8);
         return std::span<double>(ptr, count);
     }
 
@@ -341,36 +386,37 @@ struct StreamOrderbook
     {
         size_t offset = _bid_quantities_offset();
         size_t contents_size = value.size() * 8;
-        *reinterpret_cast<size_t*>(buffer + offset) = 8 + contents_size;
-        auto dest_ptr = reinterpret_cast<std::byte*>(buffer + offset + 8);
-        auto src_ptr = reinterpret_cast<const std::byte*>(value.data());
-        std::copy(src_ptr, src_ptr + contents_size, dest_ptr);
+        size_t stored_size = 8 + contents_size;
+        std::memcpy(_aligned_buffer() + offset, &stored_size, sizeof(stored_size));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
     }
 
-    constexpr inline size_t _bid_quantities_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _bid_quantities_offset() const noexcept
     {
         return _bid_prices_offset() + _bid_prices_size_aligned();
     }
 
-    constexpr inline size_t _bid_quantities_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _bid_quantities_size_aligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _bid_quantities_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _bid_quantities_offset(), sizeof(stored_size));
         return stored_size;
     }
 
-    constexpr inline size_t _bid_quantities_size_unaligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _bid_quantities_size_unaligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _bid_quantities_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _bid_quantities_offset(), sizeof(stored_size));
         return stored_size;
     }
 
     // Member: ask_prices [std::span<double>]
 
-    inline std::span<double> ask_prices() const noexcept
+    [[nodiscard]] inline std::span<double> ask_prices() const noexcept
     {
         size_t n_bytes = _ask_prices_size_unaligned() - 8;
         size_t count = n_bytes >> 3;
-        auto ptr = reinterpret_cast<double*>(buffer + _ask_prices_offset() + 8);
+        auto ptr = reinterpret_cast<double*>(_aligned_buffer() + _ask_prices_offset() + 8);
         return std::span<double>(ptr, count);
     }
 
@@ -378,36 +424,37 @@ struct StreamOrderbook
     {
         size_t offset = _ask_prices_offset();
         size_t contents_size = value.size() * 8;
-        *reinterpret_cast<size_t*>(buffer + offset) = 8 + contents_size;
-        auto dest_ptr = reinterpret_cast<std::byte*>(buffer + offset + 8);
-        auto src_ptr = reinterpret_cast<const std::byte*>(value.data());
-        std::copy(src_ptr, src_ptr + contents_size, dest_ptr);
+        size_t stored_size = 8 + contents_size;
+        std::memcpy(_aligned_buffer() + offset, &stored_size, sizeof(stored_size));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
     }
 
-    constexpr inline size_t _ask_prices_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _ask_prices_offset() const noexcept
     {
         return _bid_quantities_offset() + _bid_quantities_size_aligned();
     }
 
-    constexpr inline size_t _ask_prices_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _ask_prices_size_aligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _ask_prices_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _ask_prices_offset(), sizeof(stored_size));
         return stored_size;
     }
 
-    constexpr inline size_t _ask_prices_size_unaligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _ask_prices_size_unaligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _ask_prices_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _ask_prices_offset(), sizeof(stored_size));
         return stored_size;
     }
 
     // Member: ask_quantities [std::span<double>]
 
-    inline std::span<double> ask_quantities() const noexcept
+    [[nodiscard]] inline std::span<double> ask_quantities() const noexcept
     {
         size_t n_bytes = _ask_quantities_size_unaligned() - 8;
         size_t count = n_bytes >> 3;
-        auto ptr = reinterpret_cast<double*>(buffer + _ask_quantities_offset() + 8);
+        auto ptr = reinterpret_cast<double*>(_aligned_buffer() + _ask_quantities_offset() + 8);
         return std::span<double>(ptr, count);
     }
 
@@ -415,32 +462,33 @@ struct StreamOrderbook
     {
         size_t offset = _ask_quantities_offset();
         size_t contents_size = value.size() * 8;
-        *reinterpret_cast<size_t*>(buffer + offset) = 8 + contents_size;
-        auto dest_ptr = reinterpret_cast<std::byte*>(buffer + offset + 8);
-        auto src_ptr = reinterpret_cast<const std::byte*>(value.data());
-        std::copy(src_ptr, src_ptr + contents_size, dest_ptr);
+        size_t stored_size = 8 + contents_size;
+        std::memcpy(_aligned_buffer() + offset, &stored_size, sizeof(stored_size));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
     }
 
-    constexpr inline size_t _ask_quantities_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _ask_quantities_offset() const noexcept
     {
         return _ask_prices_offset() + _ask_prices_size_aligned();
     }
 
-    constexpr inline size_t _ask_quantities_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _ask_quantities_size_aligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _ask_quantities_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _ask_quantities_offset(), sizeof(stored_size));
         return stored_size;
     }
 
-    constexpr inline size_t _ask_quantities_size_unaligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _ask_quantities_size_unaligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _ask_quantities_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _ask_quantities_offset(), sizeof(stored_size));
         return stored_size;
     }
 
     // --------------------------------------------------------------------------------
 
-    constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
     {
         return _ask_quantities_offset() + _ask_quantities_size_aligned();
     }
@@ -449,9 +497,11 @@ struct StreamOrderbook
      * Returns the stored (aligned) binary size of the object.
      * This function should only be called after `fastbin_finalize()`.
      */
-    constexpr inline size_t fastbin_binary_size() const noexcept
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
     {
-        return *reinterpret_cast<size_t*>(buffer);
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
     }
 
     /**
@@ -461,9 +511,23 @@ struct StreamOrderbook
      */
     inline void fastbin_finalize() const noexcept
     {
-        *reinterpret_cast<size_t*>(buffer) = fastbin_calc_binary_size();
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
     }
 };
+
+static_assert(sizeof(std::int64_t) == 8, "fastbin: unexpected size of `std::int64_t`");
+static_assert(alignof(std::int64_t) <= 8, "fastbin: unexpected alignment of `std::int64_t`");
+static_assert(sizeof(OrderbookType) == 1, "fastbin: unexpected size of `OrderbookType`");
+static_assert(alignof(OrderbookType) <= 8, "fastbin: unexpected alignment of `OrderbookType`");
+static_assert(sizeof(std::uint16_t) == 2, "fastbin: unexpected size of `std::uint16_t`");
+static_assert(alignof(std::uint16_t) <= 8, "fastbin: unexpected alignment of `std::uint16_t`");
+static_assert(sizeof(char) == 1, "fastbin: unexpected size of `char`");
+static_assert(alignof(char) <= 8, "fastbin: unexpected alignment of `char`");
+static_assert(sizeof(std::uint64_t) == 8, "fastbin: unexpected size of `std::uint64_t`");
+static_assert(alignof(std::uint64_t) <= 8, "fastbin: unexpected alignment of `std::uint64_t`");
+static_assert(sizeof(double) == 8, "fastbin: unexpected size of `double`");
+static_assert(alignof(double) <= 8, "fastbin: unexpected alignment of `double`");
 }; // namespace my_models
 
 inline std::ostream& operator<<(std::ostream& os, const my_models::StreamOrderbook& obj)
@@ -483,3 +547,5 @@ inline std::ostream& operator<<(std::ostream& os, const my_models::StreamOrderbo
     os << "    ask_quantities: " << "[vector<float64> count=" << obj.ask_quantities().size() << "]" << "\n";
     return os;
 }
+
+#endif // FASTBIN_TYPE_my_models_StreamOrderbook
@@ -2,13 +2,17 @@
 
 #include <cstddef>
 #include <cassert>
+#include <cstdint>
+#include <cstring>
 #include <ostream>
 #include <span>
-#include <cstdint>
 #include <string_view>
 #include "TradeSide.hpp"
 #include "TickDirection.hpp"
 
+#ifndef FASTBIN_TYPE_my_models_StreamTrade
+#define FASTBIN_TYPE_my_models_StreamTrade
+
 namespace my_models
 {
 /**
@@ -37,7 +41,7 @@ namespace my_models
  * The `finalize()` method MUST be called after all setter methods have been called.
  * 
  * It is the responsibility of the caller to ensure that the buffer is
- * large enough to hold all data.
+ * large enough to hold all data, and that it is aligned to 8 bytes.
  */
 struct StreamTrade
 {
@@ -48,6 +52,8 @@ struct StreamTrade
     explicit StreamTrade(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
         : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
     {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
     }
 
     explicit StreamTrade(std::span<std::byte> buffer, bool owns_buffer) noexcept
@@ -91,57 +97,77 @@ struct StreamTrade
         return *this;
     }
 
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
     // Member: server_time [std::int64_t]
 
-    inline std::int64_t server_time() const noexcept
+    [[nodiscard]] inline std::int64_t server_time() const noexcept
     {
-        return *reinterpret_cast<const std::int64_t*>(buffer + _server_time_offset());
+        std::int64_t value;
+        std::memcpy(&value, _aligned_buffer() + _server_time_offset(), sizeof(value));
+        return value;
     }
 
     inline void server_time(const std::int64_t value) noexcept
     {
-        *reinterpret_cast<std::int64_t*>(buffer + _server_time_offset()) = value;
+        std::memcpy(_aligned_buffer() + _server_time_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _server_time_offset() const noexcept
+    static constexpr size_t _server_time_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _server_time_offset() const noexcept
     {
-        return 8;
+        return _server_time_offset_v;
     }
 
-    constexpr inline size_t _server_time_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _server_time_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: recv_time [std::int64_t]
 
-    inline std::int64_t recv_time() const noexcept
+    [[nodiscard]] inline std::int64_t recv_time() const noexcept
     {
-        return *reinterpret_cast<const std::int64_t*>(buffer + _recv_time_offset());
+        std::int64_t value;
+        std::memcpy(&value, _aligned_buffer() + _recv_time_offset(), sizeof(value));
+        return value;
     }
 
     inline void recv_time(const std::int64_t value) noexcept
     {
-        *reinterpret_cast<std::int64_t*>(buffer + _recv_time_offset()) = value;
+        std::memcpy(_aligned_buffer() + _recv_time_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _recv_time_offset() const noexcept
+    static constexpr size_t _recv_time_offset_v = 16;
+
+    [[nodiscard]] constexpr inline size_t _recv_time_offset() const noexcept
     {
-        return 16;
+        return _recv_time_offset_v;
     }
 
-    constexpr inline size_t _recv_time_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _recv_time_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: symbol [std::string_view]
 
-    inline std::string_view symbol() const noexcept
+    [[nodiscard]] inline std::string_view symbol() const noexcept
     {
         size_t n_bytes = _symbol_size_unaligned() - 8;
         size_t count = n_bytes;
-        auto ptr = reinterpret_cast<const char*>(buffer + _symbol_offset() + 8);
+        auto ptr = reinterpret_cast<const char*>(_aligned_buffer() + _symbol_offset() + 8);
         return std::string_view(ptr, count);
     }
 
@@ -153,149 +179,161 @@ struct StreamTrade
         size_t aligned_size = (unaligned_size + 7) & ~7;
         size_t aligned_diff = aligned_size - unaligned_size;
         size_t aligned_size_high = aligned_size | (aligned_diff << 56);
-        *reinterpret_cast<size_t*>(buffer + offset) = aligned_size_high;
-        auto dest_ptr = reinterpret_cast<std::byte*>(buffer + offset + 8);
-        auto src_ptr = reinterpret_cast<const std::byte*>(value.data());
-        std::copy(src_ptr, src_ptr + contents_size, dest_ptr);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
     }
 
-    constexpr inline size_t _symbol_offset() const noexcept
+    static constexpr size_t _symbol_offset_v = 24;
+
+    [[nodiscard]] constexpr inline size_t _symbol_offset() const noexcept
     {
-        return 24;
+        return _symbol_offset_v;
     }
 
-    constexpr inline size_t _symbol_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _symbol_size_aligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _symbol_offset());
-        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _symbol_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
         return aligned_size;
     }
 
-    constexpr inline size_t _symbol_size_unaligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _symbol_size_unaligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _symbol_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _symbol_offset(), sizeof(stored_size));
         size_t aligned_diff = stored_size >> 56;
-        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;
+        size_t aligned_size = stored_size & _size_mask_v;
         return aligned_size - aligned_diff;
     }
 
     // Member: fill_time [std::int64_t]
 
-    inline std::int64_t fill_time() const noexcept
+    [[nodiscard]] inline std::int64_t fill_time() const noexcept
     {
-        return *reinterpret_cast<const std::int64_t*>(buffer + _fill_time_offset());
+        std::int64_t value;
+        std::memcpy(&value, _aligned_buffer() + _fill_time_offset(), sizeof(value));
+        return value;
     }
 
     inline void fill_time(const std::int64_t value) noexcept
     {
-        *reinterpret_cast<std::int64_t*>(buffer + _fill_time_offset()) = value;
+        std::memcpy(_aligned_buffer() + _fill_time_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _fill_time_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _fill_time_offset() const noexcept
     {
         return _symbol_offset() + _symbol_size_aligned();
     }
 
-    constexpr inline size_t _fill_time_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _fill_time_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: side [TradeSide]
 
-    inline TradeSide side() const noexcept
+    [[nodiscard]] inline TradeSide side() const noexcept
     {
-        return static_cast<TradeSide>(*reinterpret_cast<const TradeSide*>(buffer + _side_offset()));
+        TradeSide value;
+        std::memcpy(&value, _aligned_buffer() + _side_offset(), sizeof(value));
+        return value;
     }
 
     inline void side(const TradeSide value) noexcept
     {
-        *reinterpret_cast<TradeSide*>(buffer + _side_offset()) = static_cast<TradeSide>(value);
+        std::memcpy(_aligned_buffer() + _side_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _side_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _side_offset() const noexcept
     {
         return _fill_time_offset() + _fill_time_size_aligned();
     }
 
-    constexpr inline size_t _side_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _side_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: price [double]
 
-    inline double price() const noexcept
+    [[nodiscard]] inline double price() const noexcept
     {
-        return *reinterpret_cast<const double*>(buffer + _price_offset());
+        double value;
+        std::memcpy(&value, _aligned_buffer() + _price_offset(), sizeof(value));
+        return value;
     }
 
     inline void price(const double value) noexcept
     {
-        *reinterpret_cast<double*>(buffer + _price_offset()) = value;
+        std::memcpy(_aligned_buffer() + _price_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _price_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _price_offset() const noexcept
     {
         return _side_offset() + _side_size_aligned();
     }
 
-    constexpr inline size_t _price_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _price_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: price_chg_dir [TickDirection]
 
-    inline TickDirection price_chg_dir() const noexcept
+    [[nodiscard]] inline TickDirection price_chg_dir() const noexcept
     {
-        return static_cast<TickDirection>(*reinterpret_cast<const TickDirection*>(buffer + _price_chg_dir_offset()));
+        TickDirection value;
+        std::memcpy(&value, _aligned_buffer() + _price_chg_dir_offset(), sizeof(value));
+        return value;
     }
 
     inline void price_chg_dir(const TickDirection value) noexcept
     {
-        *reinterpret_cast<TickDirection*>(buffer + _price_chg_dir_offset()) = static_cast<TickDirection>(value);
+        std::memcpy(_aligned_buffer() + _price_chg_dir_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _price_chg_dir_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _price_chg_dir_offset() const noexcept
     {
         return _price_offset() + _price_size_aligned();
     }
 
-    constexpr inline size_t _price_chg_dir_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _price_chg_dir_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: size [double]
 
-    inline double size() const noexcept
+    [[nodiscard]] inline double size() const noexcept
     {
-        return *reinterpret_cast<const double*>(buffer + _size_offset());
+        double value;
+        std::memcpy(&value, _aligned_buffer() + _size_offset(), sizeof(value));
+        return value;
     }
 
     inline void size(const double value) noexcept
     {
-        *reinterpret_cast<double*>(buffer + _size_offset()) = value;
+        std::memcpy(_aligned_buffer() + _size_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _size_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _size_offset() const noexcept
     {
         return _price_chg_dir_offset() + _price_chg_dir_size_aligned();
     }
 
-    constexpr inline size_t _size_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _size_size_aligned() const noexcept
     {
         return 8;
     }
 
     // Member: trade_id [std::string_view]
 
-    inline std::string_view trade_id() const noexcept
+    [[nodiscard]] inline std::string_view trade_id() const noexcept
     {
         size_t n_bytes = _trade_id_size_unaligned() - 8;
         size_t count = n_bytes;
-        auto ptr = reinterpret_cast<const char*>(buffer + _trade_id_offset() + 8);
+        auto ptr = reinterpret_cast<const char*>(_aligned_buffer() + _trade_id_offset() + 8);
         return std::string_view(ptr, count);
     }
 
@@ -307,57 +345,59 @@ struct StreamTrade
         size_t aligned_size = (unaligned_size + 7) & ~7;
         size_t aligned_diff = aligned_size - unaligned_size;
         size_t aligned_size_high = aligned_size | (aligned_diff << 56);
-        *reinterpret_cast<size_t*>(buffer + offset) = aligned_size_high;
-        auto dest_ptr = reinterpret_cast<std::byte*>(buffer + offset + 8);
-        auto src_ptr = reinterpret_cast<const std::byte*>(value.data());
-        std::copy(src_ptr, src_ptr + contents_size, dest_ptr);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
     }
 
-    constexpr inline size_t _trade_id_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _trade_id_offset() const noexcept
     {
         return _size_offset() + _size_size_aligned();
     }
 
-    constexpr inline size_t _trade_id_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _trade_id_size_aligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _trade_id_offset());
-        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _trade_id_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
         return aligned_size;
     }
 
-    constexpr inline size_t _trade_id_size_unaligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _trade_id_size_unaligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _trade_id_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _trade_id_offset(), sizeof(stored_size));
         size_t aligned_diff = stored_size >> 56;
-        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;
+        size_t aligned_size = stored_size & _size_mask_v;
         return aligned_size - aligned_diff;
     }
 
     // Member: block_trade [bool]
 
-    inline bool block_trade() const noexcept
+    [[nodiscard]] inline bool block_trade() const noexcept
     {
-        return *reinterpret_cast<const bool*>(buffer + _block_trade_offset());
+        bool value;
+        std::memcpy(&value, _aligned_buffer() + _block_trade_offset(), sizeof(value));
+        return value;
     }
 
     inline void block_trade(const bool value) noexcept
     {
-        *reinterpret_cast<bool*>(buffer + _block_trade_offset()) = value;
+        std::memcpy(_aligned_buffer() + _block_trade_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _block_trade_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _block_trade_offset() const noexcept
     {
         return _trade_id_offset() + _trade_id_size_aligned();
     }
 
-    constexpr inline size_t _block_trade_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _block_trade_size_aligned() const noexcept
     {
         return 8;
     }
 
     // --------------------------------------------------------------------------------
 
-    constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
     {
         return _block_trade_offset() + _block_trade_size_aligned();
     }
@@ -366,9 +406,11 @@ struct StreamTrade
      * Returns the stored (aligned) binary size of the object.
      * This function should only be called after `fastbin_finalize()`.
      */
-    constexpr inline size_t fastbin_binary_size() const noexcept
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
     {
-        return *reinterpret_cast<size_t*>(buffer);
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
     }
 
     /**
@@ -378,9 +420,23 @@ struct StreamTrade
      */
     inline void fastbin_finalize() const noexcept
     {
-        *reinterpret_cast<size_t*>(buffer) = fastbin_calc_binary_size();
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
     }
 };
+
+static_assert(sizeof(std::int64_t) == 8, "fastbin: unexpected size of `std::int64_t`");
+static_assert(alignof(std::int64_t) <= 8, "fastbin: unexpected alignment of `std::int64_t`");
+static_assert(sizeof(char) == 1, "fastbin: unexpected size of `char`");
+static_assert(alignof(char) <= 8, "fastbin: unexpected alignment of `char`");
+static_assert(sizeof(TradeSide) == 1, "fastbin: unexpected size of `TradeSide`");
+static_assert(alignof(TradeSide) <= 8, "fastbin: unexpected alignment of `TradeSide`");
+static_assert(sizeof(double) == 8, "fastbin: unexpected size of `double`");
+static_assert(alignof(double) <= 8, "fastbin: unexpected alignment of `double`");
+static_assert(sizeof(TickDirection) == 1, "fastbin: unexpected size of `TickDirection`");
+static_assert(alignof(TickDirection) <= 8, "fastbin: unexpected alignment of `TickDirection`");
+static_assert(sizeof(bool) == 1, "fastbin: unexpected size of `bool`");
+static_assert(alignof(bool) <= 8, "fastbin: unexpected alignment of `bool`");
 }; // namespace my_models
 
 inline std::ostream& operator<<(std::ostream& os, const my_models::StreamTrade& obj)
@@ -398,3 +454,5 @@ inline std::ostream& operator<<(std::ostream& os, const my_models::StreamTrade&
     os << "    block_trade: " << (obj.block_trade() ? "true" : "false") << "\n";
     return os;
 }
+
+#endif // FASTBIN_TYPE_my_models_StreamTrade
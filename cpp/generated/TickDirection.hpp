@@ -1,9 +1,14 @@
 #pragma once
 
 #include <string>
+#include <string_view>
+#include <stdexcept>
 #include <ostream>
 #include <cstdint>
 
+#ifndef FASTBIN_TYPE_my_models_TickDirection
+#define FASTBIN_TYPE_my_models_TickDirection
+
 namespace my_models
 {
 /**
@@ -41,7 +46,7 @@ enum class TickDirection : std::uint8_t
 };
 }; // namespace my_models
 
-inline std::string to_string(my_models::TickDirection value)
+[[nodiscard]] constexpr std::string_view to_string_view(my_models::TickDirection value) noexcept
 {
     switch (value)
     {
@@ -60,8 +65,50 @@ inline std::string to_string(my_models::TickDirection value)
     }
 }
 
+inline std::string to_string(my_models::TickDirection value)
+{
+    return std::string(to_string_view(value));
+}
+
+namespace my_models
+{
+template <typename T>
+T from_string(std::string_view str);
+
+template <>
+inline my_models::TickDirection from_string<my_models::TickDirection>(std::string_view str)
+{
+    switch (str.size())
+    {
+        case 7:
+            if (str == "Unknown")
+                return my_models::TickDirection::Unknown;
+            break;
+        case 8:
+            if (str == "PlusTick")
+                return my_models::TickDirection::PlusTick;
+            break;
+        case 12:
+            if (str == "ZeroPlusTick")
+                return my_models::TickDirection::ZeroPlusTick;
+            break;
+        case 9:
+            if (str == "MinusTick")
+                return my_models::TickDirection::MinusTick;
+            break;
+        case 13:
+            if (str == "ZeroMinusTick")
+                return my_models::TickDirection::ZeroMinusTick;
+            break;
+    }
+    throw std::invalid_argument("Invalid string value for enum my_models::TickDirection: " + std::string(str));
+}
+}; // namespace my_models
+
 inline std::ostream& operator<<(std::ostream& os, const my_models::TickDirection& obj)
 {
-    os << to_string(obj);
+    os << to_string_view(obj);
     return os;
 }
+
+#endif // FASTBIN_TYPE_my_models_TickDirection
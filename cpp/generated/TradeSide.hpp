@@ -1,9 +1,14 @@
 #pragma once
 
 #include <string>
+#include <string_view>
+#include <stdexcept>
 #include <ostream>
 #include <cstdint>
 
+#ifndef FASTBIN_TYPE_my_models_TradeSide
+#define FASTBIN_TYPE_my_models_TradeSide
+
 namespace my_models
 {
 enum class TradeSide : std::uint8_t
@@ -13,7 +18,7 @@ enum class TradeSide : std::uint8_t
 };
 }; // namespace my_models
 
-inline std::string to_string(my_models::TradeSide value)
+[[nodiscard]] constexpr std::string_view to_string_view(my_models::TradeSide value) noexcept
 {
     switch (value)
     {
@@ -26,8 +31,38 @@ inline std::string to_string(my_models::TradeSide value)
     }
 }
 
+inline std::string to_string(my_models::TradeSide value)
+{
+    return std::string(to_string_view(value));
+}
+
+namespace my_models
+{
+template <typename T>
+T from_string(std::string_view str);
+
+template <>
+inline my_models::TradeSide from_string<my_models::TradeSide>(std::string_view str)
+{
+    switch (str.size())
+    {
+        case 4:
+            if (str == "Sell")
+                return my_models::TradeSide::Sell;
+            break;
+        case 3:
+            if (str == "Buy")
+                return my_models::TradeSide::Buy;
+            break;
+    }
+    throw std::invalid_argument("Invalid string value for enum my_models::TradeSide: " + std::string(str));
+}
+}; // namespace my_models
+
 inline std::ostream& operator<<(std::ostream& os, const my_models::TradeSide& obj)
 {
-    os << to_string(obj);
+    os << to_string_view(obj);
     return os;
 }
+
+#endif // FASTBIN_TYPE_my_models_TradeSide
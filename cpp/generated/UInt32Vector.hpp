@@ -2,9 +2,13 @@
 
 #include <cstddef>
 #include <cassert>
+#include <cstdint>
+#include <cstring>
 #include <ostream>
 #include <span>
-#include <cstdint>
+
+#ifndef FASTBIN_TYPE_my_models_UInt32Vector
+#define FASTBIN_TYPE_my_models_UInt32Vector
 
 namespace my_models
 {
@@ -22,7 +26,7 @@ namespace my_models
  * The `finalize()` method MUST be called after all setter methods have been called.
  * 
  * It is the responsibility of the caller to ensure that the buffer is
- * large enough to hold all data.
+ * large enough to hold all data, and that it is aligned to 8 bytes.
  */
 struct UInt32Vector
 {
@@ -33,6 +37,8 @@ struct UInt32Vector
     explicit UInt32Vector(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
         : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
     {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
     }
 
     explicit UInt32Vector(std::span<std::byte> buffer, bool owns_buffer) noexcept
@@ -76,13 +82,25 @@ struct UInt32Vector
         return *this;
     }
 
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
     // Member: values [std::span<std::uint32_t>]
 
-    inline std::span<std::uint32_t> values() const noexcept
+    [[nodiscard]] inline std::span<std::uint32_t> values() const noexcept
     {
         size_t n_bytes = _values_size_unaligned() - 8;
         size_t count = n_bytes >> 2;
-        auto ptr = reinterpret_cast<std::uint32_t*>(buffer + _values_offset() + 8);
+        auto ptr = reinterpret_cast<std::uint32_t*>(_aligned_buffer() + _values_offset() + 8);
         return std::span<std::uint32_t>(ptr, count);
     }
 
@@ -94,57 +112,61 @@ struct UInt32Vector
         size_t aligned_size = (unaligned_size + 7) & ~7;
         size_t aligned_diff = aligned_size - unaligned_size;
         size_t aligned_size_high = aligned_size | (aligned_diff << 56);
-        *reinterpret_cast<size_t*>(buffer + offset) = aligned_size_high;
-        auto dest_ptr = reinterpret_cast<std::byte*>(buffer + offset + 8);
-        auto src_ptr = reinterpret_cast<const std::byte*>(value.data());
-        std::copy(src_ptr, src_ptr + contents_size, dest_ptr);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
     }
 
-    constexpr inline size_t _values_offset() const noexcept
+    static constexpr size_t _values_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _values_offset() const noexcept
     {
-        return 8;
+        return _values_offset_v;
     }
 
-    constexpr inline size_t _values_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _values_size_aligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _values_offset());
-        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _values_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
         return aligned_size;
     }
 
-    constexpr inline size_t _values_size_unaligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _values_size_unaligned() const noexcept
     {
-        size_t stored_size = *reinterpret_cast<size_t*>(buffer + _values_offset());
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _values_offset(), sizeof(stored_size));
         size_t aligned_diff = stored_size >> 56;
-        size_t aligned_size = stored_size & 0x00FFFFFFFFFFFFFF;
+        size_t aligned_size = stored_size & _size_mask_v;
         return aligned_size - aligned_diff;
     }
 
     // Member: count [std::uint32_t]
 
-    inline std::uint32_t count() const noexcept
+    [[nodiscard]] inline std::uint32_t count() const noexcept
     {
-        return *reinterpret_cast<const std::uint32_t*>(buffer + _count_offset());
+        std::uint32_t value;
+        std::memcpy(&value, _aligned_buffer() + _count_offset(), sizeof(value));
+        return value;
     }
 
     inline void count(const std::uint32_t value) noexcept
     {
-        *reinterpret_cast<std::uint32_t*>(buffer + _count_offset()) = value;
+        std::memcpy(_aligned_buffer() + _count_offset(), &value, sizeof(value));
     }
 
-    constexpr inline size_t _count_offset() const noexcept
+    [[nodiscard]] constexpr inline size_t _count_offset() const noexcept
     {
         return _values_offset() + _values_size_aligned();
     }
 
-    constexpr inline size_t _count_size_aligned() const noexcept
+    [[nodiscard]] constexpr inline size_t _count_size_aligned() const noexcept
     {
         return 8;
     }
 
     // --------------------------------------------------------------------------------
 
-    constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
     {
         return _count_offset() + _count_size_aligned();
     }
@@ -153,9 +175,11 @@ struct UInt32Vector
      * Returns the stored (aligned) binary size of the object.
      * This function should only be called after `fastbin_finalize()`.
      */
-    constexpr inline size_t fastbin_binary_size() const noexcept
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
     {
-        return *reinterpret_cast<size_t*>(buffer);
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
     }
 
     /**
@@ -165,9 +189,13 @@ struct UInt32Vector
      */
     inline void fastbin_finalize() const noexcept
     {
-        *reinterpret_cast<size_t*>(buffer) = fastbin_calc_binary_size();
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
     }
 };
+
+static_assert(sizeof(std::uint32_t) == 4, "fastbin: unexpected size of `std::uint32_t`");
+static_assert(alignof(std::uint32_t) <= 8, "fastbin: unexpected alignment of `std::uint32_t`");
 }; // namespace my_models
 
 inline std::ostream& operator<<(std::ostream& os, const my_models::UInt32Vector& obj)
@@ -177,3 +205,5 @@ inline std::ostream& operator<<(std::ostream& os, const my_models::UInt32Vector&
     os << "    count: " << obj.count() << "\n";
     return os;
 }
+
+#endif // FASTBIN_TYPE_my_models_UInt32Vector
@@ -10,4 +10,5 @@
 #include "ChildFixed.hpp"
 #include "Parent.hpp"
 #include "UInt32Vector.hpp"
+#include "Float32Vector.hpp"
 #include "StructVector.hpp"
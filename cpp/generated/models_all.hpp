@@ -0,0 +1,2483 @@
+#pragma once
+
+#include <string>
+#include <string_view>
+#include <stdexcept>
+#include <ostream>
+#include <cstdint>
+#include <cstddef>
+#include <cassert>
+#include <cstring>
+#include <span>
+
+#ifndef FASTBIN_TYPE_my_models_TradeSide
+#define FASTBIN_TYPE_my_models_TradeSide
+
+namespace my_models
+{
+enum class TradeSide : std::uint8_t
+{
+    Sell = 0,
+    Buy = 1,
+};
+}; // namespace my_models
+
+[[nodiscard]] constexpr std::string_view to_string_view(my_models::TradeSide value) noexcept
+{
+    switch (value)
+    {
+        case my_models::TradeSide::Sell:
+            return "Sell";
+        case my_models::TradeSide::Buy:
+            return "Buy";
+        default:
+            return "Unknown";
+    }
+}
+
+inline std::string to_string(my_models::TradeSide value)
+{
+    return std::string(to_string_view(value));
+}
+
+namespace my_models
+{
+template <typename T>
+T from_string(std::string_view str);
+
+template <>
+inline my_models::TradeSide from_string<my_models::TradeSide>(std::string_view str)
+{
+    switch (str.size())
+    {
+        case 4:
+            if (str == "Sell")
+                return my_models::TradeSide::Sell;
+            break;
+        case 3:
+            if (str == "Buy")
+                return my_models::TradeSide::Buy;
+            break;
+    }
+    throw std::invalid_argument("Invalid string value for enum my_models::TradeSide: " + std::string(str));
+}
+}; // namespace my_models
+
+inline std::ostream& operator<<(std::ostream& os, const my_models::TradeSide& obj)
+{
+    os << to_string_view(obj);
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_TradeSide
+
+#ifndef FASTBIN_TYPE_my_models_OrderbookType
+#define FASTBIN_TYPE_my_models_OrderbookType
+
+namespace my_models
+{
+enum class OrderbookType : std::uint8_t
+{
+    Snapshot = 1,
+    Delta = 2,
+};
+}; // namespace my_models
+
+[[nodiscard]] constexpr std::string_view to_string_view(my_models::OrderbookType value) noexcept
+{
+    switch (value)
+    {
+        case my_models::OrderbookType::Snapshot:
+            return "Snapshot";
+        case my_models::OrderbookType::Delta:
+            return "Delta";
+        default:
+            return "Unknown";
+    }
+}
+
+inline std::string to_string(my_models::OrderbookType value)
+{
+    return std::string(to_string_view(value));
+}
+
+namespace my_models
+{
+template <typename T>
+T from_string(std::string_view str);
+
+template <>
+inline my_models::OrderbookType from_string<my_models::OrderbookType>(std::string_view str)
+{
+    switch (str.size())
+    {
+        case 8:
+            if (str == "Snapshot")
+                return my_models::OrderbookType::Snapshot;
+            break;
+        case 5:
+            if (str == "Delta")
+                return my_models::OrderbookType::Delta;
+            break;
+    }
+    throw std::invalid_argument("Invalid string value for enum my_models::OrderbookType: " + std::string(str));
+}
+}; // namespace my_models
+
+inline std::ostream& operator<<(std::ostream& os, const my_models::OrderbookType& obj)
+{
+    os << to_string_view(obj);
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_OrderbookType
+
+#ifndef FASTBIN_TYPE_my_models_TickDirection
+#define FASTBIN_TYPE_my_models_TickDirection
+
+namespace my_models
+{
+/**
+ * https://bybit-exchange.github.io/docs/v5/enum#tickdirection
+ */
+enum class TickDirection : std::uint8_t
+{
+    Unknown = 0,
+
+    /**
+     * Price rise.
+     */
+    PlusTick = 1,
+
+    /**
+     * Trade occurs at the same price as the previous trade,
+     * which occurred at a price lower than that for the trade preceding it.
+     * 
+     * Example price series: 100 -> 99 -> 99
+     */
+    ZeroPlusTick = 2,
+
+    /**
+     * Price drop.
+     */
+    MinusTick = 3,
+
+    /**
+     * Trade occurs at the same price as the previous trade,
+     * which occurred at a price higher than that for the trade preceding it.
+     * 
+     * Example price series: 100 -> 101 -> 101
+     */
+    ZeroMinusTick = 4,
+};
+}; // namespace my_models
+
+[[nodiscard]] constexpr std::string_view to_string_view(my_models::TickDirection value) noexcept
+{
+    switch (value)
+    {
+        case my_models::TickDirection::Unknown:
+            return "Unknown";
+        case my_models::TickDirection::PlusTick:
+            return "PlusTick";
+        case my_models::TickDirection::ZeroPlusTick:
+            return "ZeroPlusTick";
+        case my_models::TickDirection::MinusTick:
+            return "MinusTick";
+        case my_models::TickDirection::ZeroMinusTick:
+            return "ZeroMinusTick";
+        default:
+            return "Unknown";
+    }
+}
+
+inline std::string to_string(my_models::TickDirection value)
+{
+    return std::string(to_string_view(value));
+}
+
+namespace my_models
+{
+template <typename T>
+T from_string(std::string_view str);
+
+template <>
+inline my_models::TickDirection from_string<my_models::TickDirection>(std::string_view str)
+{
+    switch (str.size())
+    {
+        case 7:
+            if (str == "Unknown")
+                return my_models::TickDirection::Unknown;
+            break;
+        case 8:
+            if (str == "PlusTick")
+                return my_models::TickDirection::PlusTick;
+            break;
+        case 12:
+            if (str == "ZeroPlusTick")
+                return my_models::TickDirection::ZeroPlusTick;
+            break;
+        case 9:
+            if (str == "MinusTick")
+                return my_models::TickDirection::MinusTick;
+            break;
+        case 13:
+            if (str == "ZeroMinusTick")
+                return my_models::TickDirection::ZeroMinusTick;
+            break;
+    }
+    throw std::invalid_argument("Invalid string value for enum my_models::TickDirection: " + std::string(str));
+}
+}; // namespace my_models
+
+inline std::ostream& operator<<(std::ostream& os, const my_models::TickDirection& obj)
+{
+    os << to_string_view(obj);
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_TickDirection
+
+#ifndef FASTBIN_TYPE_my_models_StreamTrade
+#define FASTBIN_TYPE_my_models_StreamTrade
+
+namespace my_models
+{
+/**
+ * https://bybit-exchange.github.io/docs/v5/websocket/public/trade
+ *
+ * ------------------------------------------------------------
+ *
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has variable size.
+ * All setter methods starting from the first variable-sized member and afterwards MUST be called in order.
+ *
+ * Members in order
+ * ================
+ * - `server_time` [`std::int64_t`] (fixed)
+ * - `recv_time` [`std::int64_t`] (fixed)
+ * - `symbol` [`std::string_view`] (variable)
+ * - `fill_time` [`std::int64_t`] (fixed)
+ * - `side` [`TradeSide`]     (fixed)
+ * - `price` [`double`]       (fixed)
+ * - `price_chg_dir` [`TickDirection`] (fixed)
+ * - `size` [`double`]        (fixed)
+ * - `trade_id` [`std::string_view`] (variable)
+ * - `block_trade` [`bool`]   (fixed)
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct StreamTrade
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit StreamTrade(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit StreamTrade(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : StreamTrade(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~StreamTrade() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    StreamTrade(const StreamTrade&) = delete;
+    StreamTrade& operator=(const StreamTrade&) = delete;
+
+    // enable move
+    StreamTrade(StreamTrade&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    StreamTrade& operator=(StreamTrade&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
+    // Member: server_time [std::int64_t]
+
+    [[nodiscard]] inline std::int64_t server_time() const noexcept
+    {
+        std::int64_t value;
+        std::memcpy(&value, _aligned_buffer() + _server_time_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void server_time(const std::int64_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _server_time_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _server_time_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _server_time_offset() const noexcept
+    {
+        return _server_time_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _server_time_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: recv_time [std::int64_t]
+
+    [[nodiscard]] inline std::int64_t recv_time() const noexcept
+    {
+        std::int64_t value;
+        std::memcpy(&value, _aligned_buffer() + _recv_time_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void recv_time(const std::int64_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _recv_time_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _recv_time_offset_v = 16;
+
+    [[nodiscard]] constexpr inline size_t _recv_time_offset() const noexcept
+    {
+        return _recv_time_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _recv_time_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: symbol [std::string_view]
+
+    [[nodiscard]] inline std::string_view symbol() const noexcept
+    {
+        size_t n_bytes = _symbol_size_unaligned() - 8;
+        size_t count = n_bytes;
+        auto ptr = reinterpret_cast<const char*>(_aligned_buffer() + _symbol_offset() + 8);
+        return std::string_view(ptr, count);
+    }
+
+    inline void symbol(const std::string_view value) noexcept
+    {
+        size_t offset = _symbol_offset();
+        size_t contents_size = value.size() * 1;
+        size_t unaligned_size = 8 + contents_size;
+        size_t aligned_size = (unaligned_size + 7) & ~7;
+        size_t aligned_diff = aligned_size - unaligned_size;
+        size_t aligned_size_high = aligned_size | (aligned_diff << 56);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    static constexpr size_t _symbol_offset_v = 24;
+
+    [[nodiscard]] constexpr inline size_t _symbol_offset() const noexcept
+    {
+        return _symbol_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _symbol_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _symbol_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _symbol_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _symbol_offset(), sizeof(stored_size));
+        size_t aligned_diff = stored_size >> 56;
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size - aligned_diff;
+    }
+
+    // Member: fill_time [std::int64_t]
+
+    [[nodiscard]] inline std::int64_t fill_time() const noexcept
+    {
+        std::int64_t value;
+        std::memcpy(&value, _aligned_buffer() + _fill_time_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void fill_time(const std::int64_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _fill_time_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _fill_time_offset() const noexcept
+    {
+        return _symbol_offset() + _symbol_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _fill_time_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: side [TradeSide]
+
+    [[nodiscard]] inline TradeSide side() const noexcept
+    {
+        TradeSide value;
+        std::memcpy(&value, _aligned_buffer() + _side_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void side(const TradeSide value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _side_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _side_offset() const noexcept
+    {
+        return _fill_time_offset() + _fill_time_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _side_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: price [double]
+
+    [[nodiscard]] inline double price() const noexcept
+    {
+        double value;
+        std::memcpy(&value, _aligned_buffer() + _price_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void price(const double value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _price_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _price_offset() const noexcept
+    {
+        return _side_offset() + _side_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _price_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: price_chg_dir [TickDirection]
+
+    [[nodiscard]] inline TickDirection price_chg_dir() const noexcept
+    {
+        TickDirection value;
+        std::memcpy(&value, _aligned_buffer() + _price_chg_dir_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void price_chg_dir(const TickDirection value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _price_chg_dir_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _price_chg_dir_offset() const noexcept
+    {
+        return _price_offset() + _price_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _price_chg_dir_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: size [double]
+
+    [[nodiscard]] inline double size() const noexcept
+    {
+        double value;
+        std::memcpy(&value, _aligned_buffer() + _size_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void size(const double value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _size_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _size_offset() const noexcept
+    {
+        return _price_chg_dir_offset() + _price_chg_dir_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _size_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: trade_id [std::string_view]
+
+    [[nodiscard]] inline std::string_view trade_id() const noexcept
+    {
+        size_t n_bytes = _trade_id_size_unaligned() - 8;
+        size_t count = n_bytes;
+        auto ptr = reinterpret_cast<const char*>(_aligned_buffer() + _trade_id_offset() + 8);
+        return std::string_view(ptr, count);
+    }
+
+    inline void trade_id(const std::string_view value) noexcept
+    {
+        size_t offset = _trade_id_offset();
+        size_t contents_size = value.size() * 1;
+        size_t unaligned_size = 8 + contents_size;
+        size_t aligned_size = (unaligned_size + 7) & ~7;
+        size_t aligned_diff = aligned_size - unaligned_size;
+        size_t aligned_size_high = aligned_size | (aligned_diff << 56);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    [[nodiscard]] constexpr inline size_t _trade_id_offset() const noexcept
+    {
+        return _size_offset() + _size_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _trade_id_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _trade_id_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _trade_id_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _trade_id_offset(), sizeof(stored_size));
+        size_t aligned_diff = stored_size >> 56;
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size - aligned_diff;
+    }
+
+    // Member: block_trade [bool]
+
+    [[nodiscard]] inline bool block_trade() const noexcept
+    {
+        bool value;
+        std::memcpy(&value, _aligned_buffer() + _block_trade_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void block_trade(const bool value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _block_trade_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _block_trade_offset() const noexcept
+    {
+        return _trade_id_offset() + _trade_id_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _block_trade_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return _block_trade_offset() + _block_trade_size_aligned();
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
+    }
+};
+
+static_assert(sizeof(std::int64_t) == 8, "fastbin: unexpected size of `std::int64_t`");
+static_assert(alignof(std::int64_t) <= 8, "fastbin: unexpected alignment of `std::int64_t`");
+static_assert(sizeof(char) == 1, "fastbin: unexpected size of `char`");
+static_assert(alignof(char) <= 8, "fastbin: unexpected alignment of `char`");
+static_assert(sizeof(TradeSide) == 1, "fastbin: unexpected size of `TradeSide`");
+static_assert(alignof(TradeSide) <= 8, "fastbin: unexpected alignment of `TradeSide`");
+static_assert(sizeof(double) == 8, "fastbin: unexpected size of `double`");
+static_assert(alignof(double) <= 8, "fastbin: unexpected alignment of `double`");
+static_assert(sizeof(TickDirection) == 1, "fastbin: unexpected size of `TickDirection`");
+static_assert(alignof(TickDirection) <= 8, "fastbin: unexpected alignment of `TickDirection`");
+static_assert(sizeof(bool) == 1, "fastbin: unexpected size of `bool`");
+static_assert(alignof(bool) <= 8, "fastbin: unexpected alignment of `bool`");
+}; // namespace my_models
+
+inline std::ostream& operator<<(std::ostream& os, const my_models::StreamTrade& obj)
+{
+    os << "[my_models::StreamTrade size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    server_time: " << obj.server_time() << "\n";
+    os << "    recv_time: " << obj.recv_time() << "\n";
+    os << "    symbol: " << std::string(obj.symbol()) << "\n";
+    os << "    fill_time: " << obj.fill_time() << "\n";
+    os << "    side: " << obj.side() << "\n";
+    os << "    price: " << obj.price() << "\n";
+    os << "    price_chg_dir: " << obj.price_chg_dir() << "\n";
+    os << "    size: " << obj.size() << "\n";
+    os << "    trade_id: " << std::string(obj.trade_id()) << "\n";
+    os << "    block_trade: " << (obj.block_trade() ? "true" : "false") << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_StreamTrade
+
+#ifndef FASTBIN_TYPE_my_models_StreamOrderbook
+#define FASTBIN_TYPE_my_models_StreamOrderbook
+
+namespace my_models
+{
+/**
+ * https://bybit-exchange.github.io/docs/v5/websocket/public/orderbook
+ *
+ * ------------------------------------------------------------
+ *
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has variable size.
+ * All setter methods starting from the first variable-sized member and afterwards MUST be called in order.
+ *
+ * Members in order
+ * ================
+ * - `server_time` [`std::int64_t`] (fixed)
+ * - `recv_time` [`std::int64_t`] (fixed)
+ * - `cts` [`std::int64_t`]   (fixed)
+ * - `type` [`OrderbookType`] (fixed)
+ * - `depth` [`std::uint16_t`] (fixed)
+ * - `symbol` [`std::string_view`] (variable)
+ * - `update_id` [`std::uint64_t`] (fixed)
+ * - `seq_num` [`std::uint64_t`] (fixed)
+ * - `bid_prices` [`std::span<double>`] (variable)
+ * - `bid_quantities` [`std::span<double>`] (variable)
+ * - `ask_prices` [`std::span<double>`] (variable)
+ * - `ask_quantities` [`std::span<double>`] (variable)
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct StreamOrderbook
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit StreamOrderbook(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit StreamOrderbook(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : StreamOrderbook(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~StreamOrderbook() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    StreamOrderbook(const StreamOrderbook&) = delete;
+    StreamOrderbook& operator=(const StreamOrderbook&) = delete;
+
+    // enable move
+    StreamOrderbook(StreamOrderbook&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    StreamOrderbook& operator=(StreamOrderbook&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
+    // Member: server_time [std::int64_t]
+
+    [[nodiscard]] inline std::int64_t server_time() const noexcept
+    {
+        std::int64_t value;
+        std::memcpy(&value, _aligned_buffer() + _server_time_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void server_time(const std::int64_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _server_time_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _server_time_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _server_time_offset() const noexcept
+    {
+        return _server_time_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _server_time_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: recv_time [std::int64_t]
+
+    [[nodiscard]] inline std::int64_t recv_time() const noexcept
+    {
+        std::int64_t value;
+        std::memcpy(&value, _aligned_buffer() + _recv_time_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void recv_time(const std::int64_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _recv_time_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _recv_time_offset_v = 16;
+
+    [[nodiscard]] constexpr inline size_t _recv_time_offset() const noexcept
+    {
+        return _recv_time_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _recv_time_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: cts [std::int64_t]
+
+    [[nodiscard]] inline std::int64_t cts() const noexcept
+    {
+        std::int64_t value;
+        std::memcpy(&value, _aligned_buffer() + _cts_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void cts(const std::int64_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _cts_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _cts_offset_v = 24;
+
+    [[nodiscard]] constexpr inline size_t _cts_offset() const noexcept
+    {
+        return _cts_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _cts_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: type [OrderbookType]
+
+    [[nodiscard]] inline OrderbookType type() const noexcept
+    {
+        OrderbookType value;
+        std::memcpy(&value, _aligned_buffer() + _type_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void type(const OrderbookType value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _type_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _type_offset_v = 32;
+
+    [[nodiscard]] constexpr inline size_t _type_offset() const noexcept
+    {
+        return _type_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _type_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: depth [std::uint16_t]
+
+    [[nodiscard]] inline std::uint16_t depth() const noexcept
+    {
+        std::uint16_t value;
+        std::memcpy(&value, _aligned_buffer() + _depth_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void depth(const std::uint16_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _depth_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _depth_offset_v = 40;
+
+    [[nodiscard]] constexpr inline size_t _depth_offset() const noexcept
+    {
+        return _depth_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _depth_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: symbol [std::string_view]
+
+    [[nodiscard]] inline std::string_view symbol() const noexcept
+    {
+        size_t n_bytes = _symbol_size_unaligned() - 8;
+        size_t count = n_bytes;
+        auto ptr = reinterpret_cast<const char*>(_aligned_buffer() + _symbol_offset() + 8);
+        return std::string_view(ptr, count);
+    }
+
+    inline void symbol(const std::string_view value) noexcept
+    {
+        size_t offset = _symbol_offset();
+        size_t contents_size = value.size() * 1;
+        size_t unaligned_size = 8 + contents_size;
+        size_t aligned_size = (unaligned_size + 7) & ~7;
+        size_t aligned_diff = aligned_size - unaligned_size;
+        size_t aligned_size_high = aligned_size | (aligned_diff << 56);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    static constexpr size_t _symbol_offset_v = 48;
+
+    [[nodiscard]] constexpr inline size_t _symbol_offset() const noexcept
+    {
+        return _symbol_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _symbol_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _symbol_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _symbol_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _symbol_offset(), sizeof(stored_size));
+        size_t aligned_diff = stored_size >> 56;
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size - aligned_diff;
+    }
+
+    // Member: update_id [std::uint64_t]
+
+    [[nodiscard]] inline std::uint64_t update_id() const noexcept
+    {
+        std::uint64_t value;
+        std::memcpy(&value, _aligned_buffer() + _update_id_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void update_id(const std::uint64_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _update_id_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _update_id_offset() const noexcept
+    {
+        return _symbol_offset() + _symbol_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _update_id_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: seq_num [std::uint64_t]
+
+    [[nodiscard]] inline std::uint64_t seq_num() const noexcept
+    {
+        std::uint64_t value;
+        std::memcpy(&value, _aligned_buffer() + _seq_num_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void seq_num(const std::uint64_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _seq_num_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _seq_num_offset() const noexcept
+    {
+        return _update_id_offset() + _update_id_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _seq_num_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: bid_prices [std::span<double>]
+
+    [[nodiscard]] inline std::span<double> bid_prices() const noexcept
+    {
+        size_t n_bytes = _bid_prices_size_unaligned() - 8;
+        size_t count = n_bytes >> 3;
+        auto ptr = reinterpret_cast<double*>(_aligned_buffer() + _bid_prices_offset() + 8);
+        return std::span<double>(ptr, count);
+    }
+
+    inline void bid_prices(const std::span<double> value) noexcept
+    {
+        size_t offset = _bid_prices_offset();
+        size_t contents_size = value.size() * 8;
+        size_t stored_size = 8 + contents_size;
+        std::memcpy(_aligned_buffer() + offset, &stored_size, sizeof(stored_size));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    [[nodiscard]] constexpr inline size_t _bid_prices_offset() const noexcept
+    {
+        return _seq_num_offset() + _seq_num_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _bid_prices_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _bid_prices_offset(), sizeof(stored_size));
+        return stored_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _bid_prices_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _bid_prices_offset(), sizeof(stored_size));
+        return stored_size;
+    }
+
+    // Member: bid_quantities [std::span<double>]
+
+    [[nodiscard]] inline std::span<double> bid_quantities() const noexcept
+    {
+        size_t n_bytes = _bid_quantities_size_unaligned() - 8;
+        size_t count = n_bytes >> 3;
+        auto ptr = reinterpret_cast<double*>(_aligned_buffer() + _bid_quantities_offset() + 8);
+        return std::span<double>(ptr, count);
+    }
+
+    inline void bid_quantities(const std::span<double> value) noexcept
+    {
+        size_t offset = _bid_quantities_offset();
+        size_t contents_size = value.size() * 8;
+        size_t stored_size = 8 + contents_size;
+        std::memcpy(_aligned_buffer() + offset, &stored_size, sizeof(stored_size));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    [[nodiscard]] constexpr inline size_t _bid_quantities_offset() const noexcept
+    {
+        return _bid_prices_offset() + _bid_prices_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _bid_quantities_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _bid_quantities_offset(), sizeof(stored_size));
+        return stored_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _bid_quantities_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _bid_quantities_offset(), sizeof(stored_size));
+        return stored_size;
+    }
+
+    // Member: ask_prices [std::span<double>]
+
+    [[nodiscard]] inline std::span<double> ask_prices() const noexcept
+    {
+        size_t n_bytes = _ask_prices_size_unaligned() - 8;
+        size_t count = n_bytes >> 3;
+        auto ptr = reinterpret_cast<double*>(_aligned_buffer() + _ask_prices_offset() + 8);
+        return std::span<double>(ptr, count);
+    }
+
+    inline void ask_prices(const std::span<double> value) noexcept
+    {
+        size_t offset = _ask_prices_offset();
+        size_t contents_size = value.size() * 8;
+        size_t stored_size = 8 + contents_size;
+        std::memcpy(_aligned_buffer() + offset, &stored_size, sizeof(stored_size));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    [[nodiscard]] constexpr inline size_t _ask_prices_offset() const noexcept
+    {
+        return _bid_quantities_offset() + _bid_quantities_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _ask_prices_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _ask_prices_offset(), sizeof(stored_size));
+        return stored_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _ask_prices_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _ask_prices_offset(), sizeof(stored_size));
+        return stored_size;
+    }
+
+    // Member: ask_quantities [std::span<double>]
+
+    [[nodiscard]] inline std::span<double> ask_quantities() const noexcept
+    {
+        size_t n_bytes = _ask_quantities_size_unaligned() - 8;
+        size_t count = n_bytes >> 3;
+        auto ptr = reinterpret_cast<double*>(_aligned_buffer() + _ask_quantities_offset() + 8);
+        return std::span<double>(ptr, count);
+    }
+
+    inline void ask_quantities(const std::span<double> value) noexcept
+    {
+        size_t offset = _ask_quantities_offset();
+        size_t contents_size = value.size() * 8;
+        size_t stored_size = 8 + contents_size;
+        std::memcpy(_aligned_buffer() + offset, &stored_size, sizeof(stored_size));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    [[nodiscard]] constexpr inline size_t _ask_quantities_offset() const noexcept
+    {
+        return _ask_prices_offset() + _ask_prices_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _ask_quantities_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _ask_quantities_offset(), sizeof(stored_size));
+        return stored_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _ask_quantities_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _ask_quantities_offset(), sizeof(stored_size));
+        return stored_size;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return _ask_quantities_offset() + _ask_quantities_size_aligned();
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
+    }
+};
+
+static_assert(sizeof(std::int64_t) == 8, "fastbin: unexpected size of `std::int64_t`");
+static_assert(alignof(std::int64_t) <= 8, "fastbin: unexpected alignment of `std::int64_t`");
+static_assert(sizeof(OrderbookType) == 1, "fastbin: unexpected size of `OrderbookType`");
+static_assert(alignof(OrderbookType) <= 8, "fastbin: unexpected alignment of `OrderbookType`");
+static_assert(sizeof(std::uint16_t) == 2, "fastbin: unexpected size of `std::uint16_t`");
+static_assert(alignof(std::uint16_t) <= 8, "fastbin: unexpected alignment of `std::uint16_t`");
+static_assert(sizeof(char) == 1, "fastbin: unexpected size of `char`");
+static_assert(alignof(char) <= 8, "fastbin: unexpected alignment of `char`");
+static_assert(sizeof(std::uint64_t) == 8, "fastbin: unexpected size of `std::uint64_t`");
+static_assert(alignof(std::uint64_t) <= 8, "fastbin: unexpected alignment of `std::uint64_t`");
+static_assert(sizeof(double) == 8, "fastbin: unexpected size of `double`");
+static_assert(alignof(double) <= 8, "fastbin: unexpected alignment of `double`");
+}; // namespace my_models
+
+inline std::ostream& operator<<(std::ostream& os, const my_models::StreamOrderbook& obj)
+{
+    os << "[my_models::StreamOrderbook size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    server_time: " << obj.server_time() << "\n";
+    os << "    recv_time: " << obj.recv_time() << "\n";
+    os << "    cts: " << obj.cts() << "\n";
+    os << "    type: " << obj.type() << "\n";
+    os << "    depth: " << obj.depth() << "\n";
+    os << "    symbol: " << std::string(obj.symbol()) << "\n";
+    os << "    update_id: " << obj.update_id() << "\n";
+    os << "    seq_num: " << obj.seq_num() << "\n";
+    os << "    bid_prices: " << "[vector<float64> count=" << obj.bid_prices().size() << "]" << "\n";
+    os << "    bid_quantities: " << "[vector<float64> count=" << obj.bid_quantities().size() << "]" << "\n";
+    os << "    ask_prices: " << "[vector<float64> count=" << obj.ask_prices().size() << "]" << "\n";
+    os << "    ask_quantities: " << "[vector<float64> count=" << obj.ask_quantities().size() << "]" << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_StreamOrderbook
+
+#ifndef FASTBIN_TYPE_my_models_ChildVar
+#define FASTBIN_TYPE_my_models_ChildVar
+
+namespace my_models
+{
+/**
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has variable size.
+ * All setter methods starting from the first variable-sized member and afterwards MUST be called in order.
+ *
+ * Members in order
+ * ================
+ * - `field1` [`std::int32_t`] (fixed)
+ * - `field2` [`std::string_view`] (variable)
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct ChildVar
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit ChildVar(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit ChildVar(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : ChildVar(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~ChildVar() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    ChildVar(const ChildVar&) = delete;
+    ChildVar& operator=(const ChildVar&) = delete;
+
+    // enable move
+    ChildVar(ChildVar&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    ChildVar& operator=(ChildVar&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
+    // Member: field1 [std::int32_t]
+
+    [[nodiscard]] inline std::int32_t field1() const noexcept
+    {
+        std::int32_t value;
+        std::memcpy(&value, _aligned_buffer() + _field1_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void field1(const std::int32_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _field1_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _field1_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _field1_offset() const noexcept
+    {
+        return _field1_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _field1_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: field2 [std::string_view]
+
+    [[nodiscard]] inline std::string_view field2() const noexcept
+    {
+        size_t n_bytes = _field2_size_unaligned() - 8;
+        size_t count = n_bytes;
+        auto ptr = reinterpret_cast<const char*>(_aligned_buffer() + _field2_offset() + 8);
+        return std::string_view(ptr, count);
+    }
+
+    inline void field2(const std::string_view value) noexcept
+    {
+        size_t offset = _field2_offset();
+        size_t contents_size = value.size() * 1;
+        size_t unaligned_size = 8 + contents_size;
+        size_t aligned_size = (unaligned_size + 7) & ~7;
+        size_t aligned_diff = aligned_size - unaligned_size;
+        size_t aligned_size_high = aligned_size | (aligned_diff << 56);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    static constexpr size_t _field2_offset_v = 16;
+
+    [[nodiscard]] constexpr inline size_t _field2_offset() const noexcept
+    {
+        return _field2_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _field2_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _field2_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _field2_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _field2_offset(), sizeof(stored_size));
+        size_t aligned_diff = stored_size >> 56;
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size - aligned_diff;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return _field2_offset() + _field2_size_aligned();
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
+    }
+};
+
+static_assert(sizeof(std::int32_t) == 4, "fastbin: unexpected size of `std::int32_t`");
+static_assert(alignof(std::int32_t) <= 8, "fastbin: unexpected alignment of `std::int32_t`");
+static_assert(sizeof(char) == 1, "fastbin: unexpected size of `char`");
+static_assert(alignof(char) <= 8, "fastbin: unexpected alignment of `char`");
+}; // namespace my_models
+
+inline std::ostream& operator<<(std::ostream& os, const my_models::ChildVar& obj)
+{
+    os << "[my_models::ChildVar size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    field1: " << obj.field1() << "\n";
+    os << "    field2: " << std::string(obj.field2()) << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_ChildVar
+
+#ifndef FASTBIN_TYPE_my_models_ChildFixed
+#define FASTBIN_TYPE_my_models_ChildFixed
+
+namespace my_models
+{
+/**
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has fixed size of 16 bytes.
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct ChildFixed
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit ChildFixed(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit ChildFixed(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : ChildFixed(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~ChildFixed() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    ChildFixed(const ChildFixed&) = delete;
+    ChildFixed& operator=(const ChildFixed&) = delete;
+
+    // enable move
+    ChildFixed(ChildFixed&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    ChildFixed& operator=(ChildFixed&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    // Member: field1 [std::int32_t]
+
+    [[nodiscard]] inline std::int32_t field1() const noexcept
+    {
+        std::int32_t value;
+        std::memcpy(&value, _aligned_buffer() + _field1_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void field1(const std::int32_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _field1_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _field1_offset_v = 0;
+
+    [[nodiscard]] constexpr inline size_t _field1_offset() const noexcept
+    {
+        return _field1_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _field1_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: field2 [std::int32_t]
+
+    [[nodiscard]] inline std::int32_t field2() const noexcept
+    {
+        std::int32_t value;
+        std::memcpy(&value, _aligned_buffer() + _field2_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void field2(const std::int32_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _field2_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _field2_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _field2_offset() const noexcept
+    {
+        return _field2_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _field2_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    static constexpr size_t fastbin_binary_size_v = 16;
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return fastbin_binary_size_v;
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        return fastbin_binary_size_v;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+    }
+};
+
+static_assert(sizeof(std::int32_t) == 4, "fastbin: unexpected size of `std::int32_t`");
+static_assert(alignof(std::int32_t) <= 8, "fastbin: unexpected alignment of `std::int32_t`");
+
+/**
+ * Plain memory layout of `ChildFixed` with explicit padding.
+ * The buffer of a `ChildFixed` can be copied from/to it using `std::memcpy` or `std::bit_cast`.
+ */
+struct ChildFixed_layout
+{
+    std::int32_t field1;
+    std::byte _field1_padding[4];
+    std::int32_t field2;
+    std::byte _field2_padding[4];
+};
+static_assert(sizeof(ChildFixed_layout) == 16);
+static_assert(offsetof(ChildFixed_layout, field1) == 0);
+static_assert(offsetof(ChildFixed_layout, field2) == 8);
+}; // namespace my_models
+
+inline std::ostream& operator<<(std::ostream& os, const my_models::ChildFixed& obj)
+{
+    os << "[my_models::ChildFixed size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    field1: " << obj.field1() << "\n";
+    os << "    field2: " << obj.field2() << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_ChildFixed
+
+#ifndef FASTBIN_TYPE_my_models_Parent
+#define FASTBIN_TYPE_my_models_Parent
+
+namespace my_models
+{
+/**
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has variable size.
+ * All setter methods starting from the first variable-sized member and afterwards MUST be called in order.
+ *
+ * Members in order
+ * ================
+ * - `field1` [`std::int32_t`] (fixed)
+ * - `child1` [`ChildFixed`]  (fixed)
+ * - `child2` [`ChildVar`]    (variable)
+ * - `str` [`std::string_view`] (variable)
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct Parent
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit Parent(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit Parent(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : Parent(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~Parent() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    Parent(const Parent&) = delete;
+    Parent& operator=(const Parent&) = delete;
+
+    // enable move
+    Parent(Parent&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    Parent& operator=(Parent&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
+    // Member: field1 [std::int32_t]
+
+    [[nodiscard]] inline std::int32_t field1() const noexcept
+    {
+        std::int32_t value;
+        std::memcpy(&value, _aligned_buffer() + _field1_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void field1(const std::int32_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _field1_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _field1_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _field1_offset() const noexcept
+    {
+        return _field1_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _field1_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: child1 [ChildFixed]
+
+    [[nodiscard]] inline ChildFixed child1() const noexcept
+    {
+        auto ptr = _aligned_buffer() + _child1_offset();
+        return ChildFixed(ptr, _child1_size_aligned(), false);
+    }
+
+    inline void child1(const ChildFixed& value) noexcept
+    {
+        assert(value.fastbin_binary_size() > 0 && "Cannot set member `child1`, parameter struct of type `ChildFixed` not finalized. Call fastbin_finalize() on struct after creation.");
+        size_t offset = _child1_offset();
+        size_t size = value.fastbin_binary_size();
+        std::memcpy(_aligned_buffer() + offset, value.buffer, size);
+    }
+
+    static constexpr size_t _child1_offset_v = 16;
+
+    [[nodiscard]] constexpr inline size_t _child1_offset() const noexcept
+    {
+        return _child1_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _child1_size_aligned() const noexcept
+    {
+        return 16;
+    }
+
+    // Member: child2 [ChildVar]
+
+    [[nodiscard]] inline ChildVar child2() const noexcept
+    {
+        auto ptr = _aligned_buffer() + _child2_offset();
+        return ChildVar(ptr, _child2_size_aligned(), false);
+    }
+
+    inline void child2(const ChildVar& value) noexcept
+    {
+        assert(value.fastbin_binary_size() > 0 && "Cannot set member `child2`, parameter struct of type `ChildVar` not finalized. Call fastbin_finalize() on struct after creation.");
+        size_t offset = _child2_offset();
+        size_t size = value.fastbin_binary_size();
+        std::memcpy(_aligned_buffer() + offset, value.buffer, size);
+    }
+
+    static constexpr size_t _child2_offset_v = 32;
+
+    [[nodiscard]] constexpr inline size_t _child2_offset() const noexcept
+    {
+        return _child2_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _child2_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _child2_offset(), sizeof(stored_size));
+        return stored_size;
+    }
+
+    // Member: str [std::string_view]
+
+    [[nodiscard]] inline std::string_view str() const noexcept
+    {
+        size_t n_bytes = _str_size_unaligned() - 8;
+        size_t count = n_bytes;
+        auto ptr = reinterpret_cast<const char*>(_aligned_buffer() + _str_offset() + 8);
+        return std::string_view(ptr, count);
+    }
+
+    inline void str(const std::string_view value) noexcept
+    {
+        size_t offset = _str_offset();
+        size_t contents_size = value.size() * 1;
+        size_t unaligned_size = 8 + contents_size;
+        size_t aligned_size = (unaligned_size + 7) & ~7;
+        size_t aligned_diff = aligned_size - unaligned_size;
+        size_t aligned_size_high = aligned_size | (aligned_diff << 56);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    [[nodiscard]] constexpr inline size_t _str_offset() const noexcept
+    {
+        return _child2_offset() + _child2_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _str_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _str_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _str_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _str_offset(), sizeof(stored_size));
+        size_t aligned_diff = stored_size >> 56;
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size - aligned_diff;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return _str_offset() + _str_size_aligned();
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
+    }
+};
+
+static_assert(sizeof(std::int32_t) == 4, "fastbin: unexpected size of `std::int32_t`");
+static_assert(alignof(std::int32_t) <= 8, "fastbin: unexpected alignment of `std::int32_t`");
+static_assert(sizeof(char) == 1, "fastbin: unexpected size of `char`");
+static_assert(alignof(char) <= 8, "fastbin: unexpected alignment of `char`");
+}; // namespace my_models
+
+inline std::ostream& operator<<(std::ostream& os, const my_models::Parent& obj)
+{
+    os << "[my_models::Parent size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    field1: " << obj.field1() << "\n";
+    os << "    child1: " << obj.child1() << "\n";
+    os << "    child2: " << obj.child2() << "\n";
+    os << "    str: " << std::string(obj.str()) << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_Parent
+
+#ifndef FASTBIN_TYPE_my_models_UInt32Vector
+#define FASTBIN_TYPE_my_models_UInt32Vector
+
+namespace my_models
+{
+/**
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has variable size.
+ * All setter methods starting from the first variable-sized member and afterwards MUST be called in order.
+ *
+ * Members in order
+ * ================
+ * - `values` [`std::span<std::uint32_t>`] (variable)
+ * - `count` [`std::uint32_t`] (fixed)
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct UInt32Vector
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit UInt32Vector(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit UInt32Vector(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : UInt32Vector(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~UInt32Vector() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    UInt32Vector(const UInt32Vector&) = delete;
+    UInt32Vector& operator=(const UInt32Vector&) = delete;
+
+    // enable move
+    UInt32Vector(UInt32Vector&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    UInt32Vector& operator=(UInt32Vector&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
+    // Member: values [std::span<std::uint32_t>]
+
+    [[nodiscard]] inline std::span<std::uint32_t> values() const noexcept
+    {
+        size_t n_bytes = _values_size_unaligned() - 8;
+        size_t count = n_bytes >> 2;
+        auto ptr = reinterpret_cast<std::uint32_t*>(_aligned_buffer() + _values_offset() + 8);
+        return std::span<std::uint32_t>(ptr, count);
+    }
+
+    inline void values(const std::span<std::uint32_t> value) noexcept
+    {
+        size_t offset = _values_offset();
+        size_t contents_size = value.size() * 4;
+        size_t unaligned_size = 8 + contents_size;
+        size_t aligned_size = (unaligned_size + 7) & ~7;
+        size_t aligned_diff = aligned_size - unaligned_size;
+        size_t aligned_size_high = aligned_size | (aligned_diff << 56);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    static constexpr size_t _values_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _values_offset() const noexcept
+    {
+        return _values_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _values_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _values_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _values_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _values_offset(), sizeof(stored_size));
+        size_t aligned_diff = stored_size >> 56;
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size - aligned_diff;
+    }
+
+    // Member: count [std::uint32_t]
+
+    [[nodiscard]] inline std::uint32_t count() const noexcept
+    {
+        std::uint32_t value;
+        std::memcpy(&value, _aligned_buffer() + _count_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void count(const std::uint32_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _count_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _count_offset() const noexcept
+    {
+        return _values_offset() + _values_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _count_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return _count_offset() + _count_size_aligned();
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
+    }
+};
+
+static_assert(sizeof(std::uint32_t) == 4, "fastbin: unexpected size of `std::uint32_t`");
+static_assert(alignof(std::uint32_t) <= 8, "fastbin: unexpected alignment of `std::uint32_t`");
+}; // namespace my_models
+
+inline std::ostream& operator<<(std::ostream& os, const my_models::UInt32Vector& obj)
+{
+    os << "[my_models::UInt32Vector size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    values: " << "[vector<uint32> count=" << obj.values().size() << "]" << "\n";
+    os << "    count: " << obj.count() << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_UInt32Vector
+
+#ifndef FASTBIN_TYPE_my_models_Float32Vector
+#define FASTBIN_TYPE_my_models_Float32Vector
+
+namespace my_models
+{
+/**
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has variable size.
+ * All setter methods starting from the first variable-sized member and afterwards MUST be called in order.
+ *
+ * Members in order
+ * ================
+ * - `values` [`std::span<float>`] (variable)
+ * - `count` [`std::uint32_t`] (fixed)
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct Float32Vector
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit Float32Vector(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit Float32Vector(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : Float32Vector(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~Float32Vector() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    Float32Vector(const Float32Vector&) = delete;
+    Float32Vector& operator=(const Float32Vector&) = delete;
+
+    // enable move
+    Float32Vector(Float32Vector&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    Float32Vector& operator=(Float32Vector&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
+    // Member: values [std::span<float>]
+
+    [[nodiscard]] inline std::span<float> values() const noexcept
+    {
+        size_t n_bytes = _values_size_unaligned() - 8;
+        size_t count = n_bytes >> 2;
+        auto ptr = reinterpret_cast<float*>(_aligned_buffer() + _values_offset() + 8);
+        return std::span<float>(ptr, count);
+    }
+
+    inline void values(const std::span<float> value) noexcept
+    {
+        size_t offset = _values_offset();
+        size_t contents_size = value.size() * 4;
+        size_t unaligned_size = 8 + contents_size;
+        size_t aligned_size = (unaligned_size + 7) & ~7;
+        size_t aligned_diff = aligned_size - unaligned_size;
+        size_t aligned_size_high = aligned_size | (aligned_diff << 56);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    static constexpr size_t _values_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _values_offset() const noexcept
+    {
+        return _values_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _values_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _values_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _values_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _values_offset(), sizeof(stored_size));
+        size_t aligned_diff = stored_size >> 56;
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size - aligned_diff;
+    }
+
+    // Member: count [std::uint32_t]
+
+    [[nodiscard]] inline std::uint32_t count() const noexcept
+    {
+        std::uint32_t value;
+        std::memcpy(&value, _aligned_buffer() + _count_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void count(const std::uint32_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _count_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _count_offset() const noexcept
+    {
+        return _values_offset() + _values_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _count_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return _count_offset() + _count_size_aligned();
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
+    }
+};
+
+static_assert(sizeof(float) == 4, "fastbin: unexpected size of `float`");
+static_assert(alignof(float) <= 8, "fastbin: unexpected alignment of `float`");
+static_assert(sizeof(std::uint32_t) == 4, "fastbin: unexpected size of `std::uint32_t`");
+static_assert(alignof(std::uint32_t) <= 8, "fastbin: unexpected alignment of `std::uint32_t`");
+}; // namespace my_models
+
+inline std::ostream& operator<<(std::ostream& os, const my_models::Float32Vector& obj)
+{
+    os << "[my_models::Float32Vector size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    values: " << "[vector<float32> count=" << obj.values().size() << "]" << "\n";
+    os << "    count: " << obj.count() << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_Float32Vector
+
+#ifndef FASTBIN_TYPE_my_models_StructVector
+#define FASTBIN_TYPE_my_models_StructVector
+
+namespace my_models
+{
+/**
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has variable size.
+ * All setter methods starting from the first variable-sized member and afterwards MUST be called in order.
+ *
+ * Members in order
+ * ================
+ * - `values` [`std::span<ChildFixed>`] (variable)
+ * - `count` [`std::uint32_t`] (fixed)
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct StructVector
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit StructVector(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit StructVector(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : StructVector(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~StructVector() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    StructVector(const StructVector&) = delete;
+    StructVector& operator=(const StructVector&) = delete;
+
+    // enable move
+    StructVector(StructVector&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    StructVector& operator=(StructVector&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    // Member: values [std::span<ChildFixed>]
+
+    [[nodiscard]] inline std::span<ChildFixed> values() const noexcept
+    {
+        size_t n_bytes = _values_size_unaligned() - 8;
+        size_t count = n_bytes >> 4;
+        auto ptr = reinterpret_cast<ChildFixed*>(_aligned_buffer() + _values_offset() + 8);
+        return std::span<ChildFixed>(ptr, count);
+    }
+
+    inline void values(const std::span<ChildFixed> value) noexcept
+    {
+        size_t offset = _values_offset();
+        size_t contents_size = value.size() * 16;
+        size_t stored_size = 8 + contents_size;
+        std::memcpy(_aligned_buffer() + offset, &stored_size, sizeof(stored_size));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    static constexpr size_t _values_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _values_offset() const noexcept
+    {
+        return _values_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _values_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _values_offset(), sizeof(stored_size));
+        return stored_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _values_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _values_offset(), sizeof(stored_size));
+        return stored_size;
+    }
+
+    // Member: count [std::uint32_t]
+
+    [[nodiscard]] inline std::uint32_t count() const noexcept
+    {
+        std::uint32_t value;
+        std::memcpy(&value, _aligned_buffer() + _count_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void count(const std::uint32_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _count_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _count_offset() const noexcept
+    {
+        return _values_offset() + _values_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _count_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return _count_offset() + _count_size_aligned();
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
+    }
+};
+
+static_assert(sizeof(std::uint32_t) == 4, "fastbin: unexpected size of `std::uint32_t`");
+static_assert(alignof(std::uint32_t) <= 8, "fastbin: unexpected alignment of `std::uint32_t`");
+}; // namespace my_models
+
+inline std::ostream& operator<<(std::ostream& os, const my_models::StructVector& obj)
+{
+    os << "[my_models::StructVector size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    values: " << "[vector<struct:ChildFixed> count=" << obj.values().size() << "]" << "\n";
+    os << "    count: " << obj.count() << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_StructVector
@@ -0,0 +1,265 @@
+#pragma once
+
+#include <cstddef>
+#include <cassert>
+#include <cstdint>
+#include <cstring>
+#include <ostream>
+#include <span>
+#include "Quote.hpp"
+
+#ifndef FASTBIN_TYPE_my_models_packed_Book
+#define FASTBIN_TYPE_my_models_packed_Book
+
+namespace my_models_packed
+{
+/**
+ * Fixed-size struct with nested fixed-size structs, which start at 8-byte boundaries.
+ *
+ * ------------------------------------------------------------
+ *
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has fixed size of 64 bytes.
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct Book
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit Book(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit Book(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : Book(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~Book() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    Book(const Book&) = delete;
+    Book& operator=(const Book&) = delete;
+
+    // enable move
+    Book(Book&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    Book& operator=(Book&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    // Member: id [std::uint32_t]
+
+    [[nodiscard]] inline std::uint32_t id() const noexcept
+    {
+        std::uint32_t value;
+        std::memcpy(&value, _aligned_buffer() + _id_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void id(const std::uint32_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _id_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _id_offset_v = 0;
+
+    [[nodiscard]] constexpr inline size_t _id_offset() const noexcept
+    {
+        return _id_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _id_size_aligned() const noexcept
+    {
+        return 4;
+    }
+
+    // Member: bid [Quote]
+
+    [[nodiscard]] inline Quote bid() const noexcept
+    {
+        auto ptr = _aligned_buffer() + _bid_offset();
+        return Quote(ptr, _bid_size_aligned(), false);
+    }
+
+    inline void bid(const Quote& value) noexcept
+    {
+        assert(value.fastbin_binary_size() > 0 && "Cannot set member `bid`, parameter struct of type `Quote` not finalized. Call fastbin_finalize() on struct after creation.");
+        size_t offset = _bid_offset();
+        size_t size = value.fastbin_binary_size();
+        std::memcpy(_aligned_buffer() + offset, value.buffer, size);
+    }
+
+    static constexpr size_t _bid_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _bid_offset() const noexcept
+    {
+        return _bid_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _bid_size_aligned() const noexcept
+    {
+        return 24;
+    }
+
+    // Member: ask [Quote]
+
+    [[nodiscard]] inline Quote ask() const noexcept
+    {
+        auto ptr = _aligned_buffer() + _ask_offset();
+        return Quote(ptr, _ask_size_aligned(), false);
+    }
+
+    inline void ask(const Quote& value) noexcept
+    {
+        assert(value.fastbin_binary_size() > 0 && "Cannot set member `ask`, parameter struct of type `Quote` not finalized. Call fastbin_finalize() on struct after creation.");
+        size_t offset = _ask_offset();
+        size_t size = value.fastbin_binary_size();
+        std::memcpy(_aligned_buffer() + offset, value.buffer, size);
+    }
+
+    static constexpr size_t _ask_offset_v = 32;
+
+    [[nodiscard]] constexpr inline size_t _ask_offset() const noexcept
+    {
+        return _ask_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _ask_size_aligned() const noexcept
+    {
+        return 24;
+    }
+
+    // Member: depth [std::uint8_t]
+
+    [[nodiscard]] inline std::uint8_t depth() const noexcept
+    {
+        std::uint8_t value;
+        std::memcpy(&value, _aligned_buffer() + _depth_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void depth(const std::uint8_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _depth_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _depth_offset_v = 56;
+
+    [[nodiscard]] constexpr inline size_t _depth_offset() const noexcept
+    {
+        return _depth_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _depth_size_aligned() const noexcept
+    {
+        return 1;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    static constexpr size_t fastbin_binary_size_v = 64;
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return fastbin_binary_size_v;
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        return fastbin_binary_size_v;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+    }
+};
+
+static_assert(sizeof(std::uint32_t) == 4, "fastbin: unexpected size of `std::uint32_t`");
+static_assert(alignof(std::uint32_t) <= 8, "fastbin: unexpected alignment of `std::uint32_t`");
+static_assert(sizeof(std::uint8_t) == 1, "fastbin: unexpected size of `std::uint8_t`");
+static_assert(alignof(std::uint8_t) <= 8, "fastbin: unexpected alignment of `std::uint8_t`");
+
+/**
+ * Plain memory layout of `Book` with explicit padding.
+ * The buffer of a `Book` can be copied from/to it using `std::memcpy` or `std::bit_cast`.
+ */
+struct Book_layout
+{
+    std::uint32_t id;
+    std::byte _id_padding[4];
+    Quote_layout bid;
+    Quote_layout ask;
+    std::uint8_t depth;
+    std::byte _depth_padding[7];
+};
+static_assert(sizeof(Book_layout) == 64);
+static_assert(offsetof(Book_layout, id) == 0);
+static_assert(offsetof(Book_layout, bid) == 8);
+static_assert(offsetof(Book_layout, ask) == 32);
+static_assert(offsetof(Book_layout, depth) == 56);
+}; // namespace my_models_packed
+
+inline std::ostream& operator<<(std::ostream& os, const my_models_packed::Book& obj)
+{
+    os << "[my_models_packed::Book size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    id: " << obj.id() << "\n";
+    os << "    bid: " << obj.bid() << "\n";
+    os << "    ask: " << obj.ask() << "\n";
+    os << "    depth: " << obj.depth() << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_packed_Book
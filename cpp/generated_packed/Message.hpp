@@ -0,0 +1,377 @@
+#pragma once
+
+#include <cstddef>
+#include <cassert>
+#include <cstdint>
+#include <cstring>
+#include <ostream>
+#include <span>
+#include <string_view>
+#include "Book.hpp"
+
+#ifndef FASTBIN_TYPE_my_models_packed_Message
+#define FASTBIN_TYPE_my_models_packed_Message
+
+namespace my_models_packed
+{
+/**
+ * Variable-length struct with packed members after variable-length members.
+ *
+ * ------------------------------------------------------------
+ *
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has variable size.
+ * All setter methods starting from the first variable-sized member and afterwards MUST be called in order.
+ *
+ * Members in order
+ * ================
+ * - `seq` [`std::uint16_t`]  (fixed)
+ * - `symbol` [`std::string_view`] (variable)
+ * - `count` [`std::uint8_t`] (fixed)
+ * - `sizes` [`std::span<std::uint16_t>`] (variable)
+ * - `book` [`Book`]          (fixed)
+ * - `flags` [`std::uint32_t`] (fixed)
+ * - `last` [`std::int8_t`]   (fixed)
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct Message
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit Message(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit Message(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : Message(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~Message() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    Message(const Message&) = delete;
+    Message& operator=(const Message&) = delete;
+
+    // enable move
+    Message(Message&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    Message& operator=(Message&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
+    // Member: seq [std::uint16_t]
+
+    [[nodiscard]] inline std::uint16_t seq() const noexcept
+    {
+        std::uint16_t value;
+        std::memcpy(&value, _aligned_buffer() + _seq_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void seq(const std::uint16_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _seq_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _seq_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _seq_offset() const noexcept
+    {
+        return _seq_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _seq_size_aligned() const noexcept
+    {
+        return 2;
+    }
+
+    // Member: symbol [std::string_view]
+
+    [[nodiscard]] inline std::string_view symbol() const noexcept
+    {
+        size_t n_bytes = _symbol_size_unaligned() - 8;
+        size_t count = n_bytes;
+        auto ptr = reinterpret_cast<const char*>(_aligned_buffer() + _symbol_offset() + 8);
+        return std::string_view(ptr, count);
+    }
+
+    inline void symbol(const std::string_view value) noexcept
+    {
+        size_t offset = _symbol_offset();
+        size_t contents_size = value.size() * 1;
+        size_t unaligned_size = 8 + contents_size;
+        size_t aligned_size = (unaligned_size + 7) & ~7;
+        size_t aligned_diff = aligned_size - unaligned_size;
+        size_t aligned_size_high = aligned_size | (aligned_diff << 56);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    static constexpr size_t _symbol_offset_v = 16;
+
+    [[nodiscard]] constexpr inline size_t _symbol_offset() const noexcept
+    {
+        return _symbol_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _symbol_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _symbol_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _symbol_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _symbol_offset(), sizeof(stored_size));
+        size_t aligned_diff = stored_size >> 56;
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size - aligned_diff;
+    }
+
+    // Member: count [std::uint8_t]
+
+    [[nodiscard]] inline std::uint8_t count() const noexcept
+    {
+        std::uint8_t value;
+        std::memcpy(&value, _aligned_buffer() + _count_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void count(const std::uint8_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _count_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _count_offset() const noexcept
+    {
+        return _symbol_offset() + _symbol_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _count_size_aligned() const noexcept
+    {
+        return 1;
+    }
+
+    // Member: sizes [std::span<std::uint16_t>]
+
+    [[nodiscard]] inline std::span<std::uint16_t> sizes() const noexcept
+    {
+        size_t n_bytes = _sizes_size_unaligned() - 8;
+        size_t count = n_bytes >> 1;
+        auto ptr = reinterpret_cast<std::uint16_t*>(_aligned_buffer() + _sizes_offset() + 8);
+        return std::span<std::uint16_t>(ptr, count);
+    }
+
+    inline void sizes(const std::span<std::uint16_t> value) noexcept
+    {
+        size_t offset = _sizes_offset();
+        size_t contents_size = value.size() * 2;
+        size_t unaligned_size = 8 + contents_size;
+        size_t aligned_size = (unaligned_size + 7) & ~7;
+        size_t aligned_diff = aligned_size - unaligned_size;
+        size_t aligned_size_high = aligned_size | (aligned_diff << 56);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    [[nodiscard]] constexpr inline size_t _sizes_offset() const noexcept
+    {
+        return (_count_offset() + _count_size_aligned() + 7) & ~size_t(7);
+    }
+
+    [[nodiscard]] constexpr inline size_t _sizes_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _sizes_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _sizes_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _sizes_offset(), sizeof(stored_size));
+        size_t aligned_diff = stored_size >> 56;
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size - aligned_diff;
+    }
+
+    // Member: book [Book]
+
+    [[nodiscard]] inline Book book() const noexcept
+    {
+        auto ptr = _aligned_buffer() + _book_offset();
+        return Book(ptr, _book_size_aligned(), false);
+    }
+
+    inline void book(const Book& value) noexcept
+    {
+        assert(value.fastbin_binary_size() > 0 && "Cannot set member `book`, parameter struct of type `Book` not finalized. Call fastbin_finalize() on struct after creation.");
+        size_t offset = _book_offset();
+        size_t size = value.fastbin_binary_size();
+        std::memcpy(_aligned_buffer() + offset, value.buffer, size);
+    }
+
+    [[nodiscard]] constexpr inline size_t _book_offset() const noexcept
+    {
+        return _sizes_offset() + _sizes_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _book_size_aligned() const noexcept
+    {
+        return 64;
+    }
+
+    // Member: flags [std::uint32_t]
+
+    [[nodiscard]] inline std::uint32_t flags() const noexcept
+    {
+        std::uint32_t value;
+        std::memcpy(&value, _aligned_buffer() + _flags_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void flags(const std::uint32_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _flags_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _flags_offset() const noexcept
+    {
+        return _book_offset() + _book_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _flags_size_aligned() const noexcept
+    {
+        return 4;
+    }
+
+    // Member: last [std::int8_t]
+
+    [[nodiscard]] inline std::int8_t last() const noexcept
+    {
+        std::int8_t value;
+        std::memcpy(&value, _aligned_buffer() + _last_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void last(const std::int8_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _last_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _last_offset() const noexcept
+    {
+        return _flags_offset() + _flags_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _last_size_aligned() const noexcept
+    {
+        return 1;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return (_last_offset() + _last_size_aligned() + 7) & ~size_t(7);
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
+    }
+};
+
+static_assert(sizeof(std::uint16_t) == 2, "fastbin: unexpected size of `std::uint16_t`");
+static_assert(alignof(std::uint16_t) <= 8, "fastbin: unexpected alignment of `std::uint16_t`");
+static_assert(sizeof(char) == 1, "fastbin: unexpected size of `char`");
+static_assert(alignof(char) <= 8, "fastbin: unexpected alignment of `char`");
+static_assert(sizeof(std::uint8_t) == 1, "fastbin: unexpected size of `std::uint8_t`");
+static_assert(alignof(std::uint8_t) <= 8, "fastbin: unexpected alignment of `std::uint8_t`");
+static_assert(sizeof(std::uint32_t) == 4, "fastbin: unexpected size of `std::uint32_t`");
+static_assert(alignof(std::uint32_t) <= 8, "fastbin: unexpected alignment of `std::uint32_t`");
+static_assert(sizeof(std::int8_t) == 1, "fastbin: unexpected size of `std::int8_t`");
+static_assert(alignof(std::int8_t) <= 8, "fastbin: unexpected alignment of `std::int8_t`");
+}; // namespace my_models_packed
+
+inline std::ostream& operator<<(std::ostream& os, const my_models_packed::Message& obj)
+{
+    os << "[my_models_packed::Message size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    seq: " << obj.seq() << "\n";
+    os << "    symbol: " << std::string(obj.symbol()) << "\n";
+    os << "    count: " << obj.count() << "\n";
+    os << "    sizes: " << "[vector<uint16> count=" << obj.sizes().size() << "]" << "\n";
+    os << "    book: " << obj.book() << "\n";
+    os << "    flags: " << obj.flags() << "\n";
+    os << "    last: " << obj.last() << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_packed_Message
@@ -0,0 +1,296 @@
+#pragma once
+
+#include <cstddef>
+#include <cassert>
+#include <cstdint>
+#include <cstring>
+#include <ostream>
+#include <span>
+#include "Side.hpp"
+
+#ifndef FASTBIN_TYPE_my_models_packed_Quote
+#define FASTBIN_TYPE_my_models_packed_Quote
+
+namespace my_models_packed
+{
+/**
+ * Fixed-size struct, members end at byte 23 and the size is rounded up to 24 bytes.
+ *
+ * ------------------------------------------------------------
+ *
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has fixed size of 24 bytes.
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct Quote
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit Quote(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit Quote(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : Quote(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~Quote() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    Quote(const Quote&) = delete;
+    Quote& operator=(const Quote&) = delete;
+
+    // enable move
+    Quote(Quote&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    Quote& operator=(Quote&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    // Member: flag [bool]
+
+    [[nodiscard]] inline bool flag() const noexcept
+    {
+        bool value;
+        std::memcpy(&value, _aligned_buffer() + _flag_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void flag(const bool value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _flag_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _flag_offset_v = 0;
+
+    [[nodiscard]] constexpr inline size_t _flag_offset() const noexcept
+    {
+        return _flag_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _flag_size_aligned() const noexcept
+    {
+        return 1;
+    }
+
+    // Member: price [double]
+
+    [[nodiscard]] inline double price() const noexcept
+    {
+        double value;
+        std::memcpy(&value, _aligned_buffer() + _price_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void price(const double value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _price_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _price_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _price_offset() const noexcept
+    {
+        return _price_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _price_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: qty [float]
+
+    [[nodiscard]] inline float qty() const noexcept
+    {
+        float value;
+        std::memcpy(&value, _aligned_buffer() + _qty_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void qty(const float value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _qty_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _qty_offset_v = 16;
+
+    [[nodiscard]] constexpr inline size_t _qty_offset() const noexcept
+    {
+        return _qty_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _qty_size_aligned() const noexcept
+    {
+        return 4;
+    }
+
+    // Member: level [std::uint16_t]
+
+    [[nodiscard]] inline std::uint16_t level() const noexcept
+    {
+        std::uint16_t value;
+        std::memcpy(&value, _aligned_buffer() + _level_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void level(const std::uint16_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _level_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _level_offset_v = 20;
+
+    [[nodiscard]] constexpr inline size_t _level_offset() const noexcept
+    {
+        return _level_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _level_size_aligned() const noexcept
+    {
+        return 2;
+    }
+
+    // Member: side [Side]
+
+    [[nodiscard]] inline Side side() const noexcept
+    {
+        Side value;
+        std::memcpy(&value, _aligned_buffer() + _side_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void side(const Side value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _side_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _side_offset_v = 22;
+
+    [[nodiscard]] constexpr inline size_t _side_offset() const noexcept
+    {
+        return _side_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _side_size_aligned() const noexcept
+    {
+        return 1;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    static constexpr size_t fastbin_binary_size_v = 24;
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return fastbin_binary_size_v;
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        return fastbin_binary_size_v;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+    }
+};
+
+static_assert(sizeof(bool) == 1, "fastbin: unexpected size of `bool`");
+static_assert(alignof(bool) <= 8, "fastbin: unexpected alignment of `bool`");
+static_assert(sizeof(double) == 8, "fastbin: unexpected size of `double`");
+static_assert(alignof(double) <= 8, "fastbin: unexpected alignment of `double`");
+static_assert(sizeof(float) == 4, "fastbin: unexpected size of `float`");
+static_assert(alignof(float) <= 8, "fastbin: unexpected alignment of `float`");
+static_assert(sizeof(std::uint16_t) == 2, "fastbin: unexpected size of `std::uint16_t`");
+static_assert(alignof(std::uint16_t) <= 8, "fastbin: unexpected alignment of `std::uint16_t`");
+static_assert(sizeof(Side) == 1, "fastbin: unexpected size of `Side`");
+static_assert(alignof(Side) <= 8, "fastbin: unexpected alignment of `Side`");
+
+/**
+ * Plain memory layout of `Quote` with explicit padding.
+ * The buffer of a `Quote` can be copied from/to it using `std::memcpy` or `std::bit_cast`.
+ */
+struct Quote_layout
+{
+    bool flag;
+    std::byte _flag_padding[7];
+    double price;
+    float qty;
+    std::uint16_t level;
+    Side side;
+    std::byte _side_padding[1];
+};
+static_assert(sizeof(Quote_layout) == 24);
+static_assert(offsetof(Quote_layout, flag) == 0);
+static_assert(offsetof(Quote_layout, price) == 8);
+static_assert(offsetof(Quote_layout, qty) == 16);
+static_assert(offsetof(Quote_layout, level) == 20);
+static_assert(offsetof(Quote_layout, side) == 22);
+}; // namespace my_models_packed
+
+inline std::ostream& operator<<(std::ostream& os, const my_models_packed::Quote& obj)
+{
+    os << "[my_models_packed::Quote size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    flag: " << (obj.flag() ? "true" : "false") << "\n";
+    os << "    price: " << obj.price() << "\n";
+    os << "    qty: " << obj.qty() << "\n";
+    os << "    level: " << obj.level() << "\n";
+    os << "    side: " << obj.side() << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_packed_Quote
@@ -0,0 +1,68 @@
+#pragma once
+
+#include <string>
+#include <string_view>
+#include <stdexcept>
+#include <ostream>
+#include <cstdint>
+
+#ifndef FASTBIN_TYPE_my_models_packed_Side
+#define FASTBIN_TYPE_my_models_packed_Side
+
+namespace my_models_packed
+{
+enum class Side : std::uint8_t
+{
+    Buy = 0,
+    Sell = 1,
+};
+}; // namespace my_models_packed
+
+[[nodiscard]] constexpr std::string_view to_string_view(my_models_packed::Side value) noexcept
+{
+    switch (value)
+    {
+        case my_models_packed::Side::Buy:
+            return "Buy";
+        case my_models_packed::Side::Sell:
+            return "Sell";
+        default:
+            return "Unknown";
+    }
+}
+
+inline std::string to_string(my_models_packed::Side value)
+{
+    return std::string(to_string_view(value));
+}
+
+namespace my_models_packed
+{
+template <typename T>
+T from_string(std::string_view str);
+
+template <>
+inline my_models_packed::Side from_string<my_models_packed::Side>(std::string_view str)
+{
+    switch (str.size())
+    {
+        case 3:
+            if (str == "Buy")
+                return my_models_packed::Side::Buy;
+            break;
+        case 4:
+            if (str == "Sell")
+                return my_models_packed::Side::Sell;
+            break;
+    }
+    throw std::invalid_argument("Invalid string value for enum my_models_packed::Side: " + std::string(str));
+}
+}; // namespace my_models_packed
+
+inline std::ostream& operator<<(std::ostream& os, const my_models_packed::Side& obj)
+{
+    os << to_string_view(obj);
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_packed_Side
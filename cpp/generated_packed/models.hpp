@@ -0,0 +1,7 @@
+#pragma once
+
+#include "Side.hpp"
+
+#include "Quote.hpp"
+#include "Book.hpp"
+#include "Message.hpp"
@@ -0,0 +1,982 @@
+#pragma once
+
+#include <string>
+#include <string_view>
+#include <stdexcept>
+#include <ostream>
+#include <cstdint>
+#include <cstddef>
+#include <cassert>
+#include <cstring>
+#include <span>
+
+#ifndef FASTBIN_TYPE_my_models_packed_Side
+#define FASTBIN_TYPE_my_models_packed_Side
+
+namespace my_models_packed
+{
+enum class Side : std::uint8_t
+{
+    Buy = 0,
+    Sell = 1,
+};
+}; // namespace my_models_packed
+
+[[nodiscard]] constexpr std::string_view to_string_view(my_models_packed::Side value) noexcept
+{
+    switch (value)
+    {
+        case my_models_packed::Side::Buy:
+            return "Buy";
+        case my_models_packed::Side::Sell:
+            return "Sell";
+        default:
+            return "Unknown";
+    }
+}
+
+inline std::string to_string(my_models_packed::Side value)
+{
+    return std::string(to_string_view(value));
+}
+
+namespace my_models_packed
+{
+template <typename T>
+T from_string(std::string_view str);
+
+template <>
+inline my_models_packed::Side from_string<my_models_packed::Side>(std::string_view str)
+{
+    switch (str.size())
+    {
+        case 3:
+            if (str == "Buy")
+                return my_models_packed::Side::Buy;
+            break;
+        case 4:
+            if (str == "Sell")
+                return my_models_packed::Side::Sell;
+            break;
+    }
+    throw std::invalid_argument("Invalid string value for enum my_models_packed::Side: " + std::string(str));
+}
+}; // namespace my_models_packed
+
+inline std::ostream& operator<<(std::ostream& os, const my_models_packed::Side& obj)
+{
+    os << to_string_view(obj);
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_packed_Side
+
+#ifndef FASTBIN_TYPE_my_models_packed_Quote
+#define FASTBIN_TYPE_my_models_packed_Quote
+
+namespace my_models_packed
+{
+/**
+ * Fixed-size struct, members end at byte 23 and the size is rounded up to 24 bytes.
+ *
+ * ------------------------------------------------------------
+ *
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has fixed size of 24 bytes.
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct Quote
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit Quote(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit Quote(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : Quote(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~Quote() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    Quote(const Quote&) = delete;
+    Quote& operator=(const Quote&) = delete;
+
+    // enable move
+    Quote(Quote&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    Quote& operator=(Quote&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    // Member: flag [bool]
+
+    [[nodiscard]] inline bool flag() const noexcept
+    {
+        bool value;
+        std::memcpy(&value, _aligned_buffer() + _flag_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void flag(const bool value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _flag_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _flag_offset_v = 0;
+
+    [[nodiscard]] constexpr inline size_t _flag_offset() const noexcept
+    {
+        return _flag_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _flag_size_aligned() const noexcept
+    {
+        return 1;
+    }
+
+    // Member: price [double]
+
+    [[nodiscard]] inline double price() const noexcept
+    {
+        double value;
+        std::memcpy(&value, _aligned_buffer() + _price_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void price(const double value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _price_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _price_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _price_offset() const noexcept
+    {
+        return _price_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _price_size_aligned() const noexcept
+    {
+        return 8;
+    }
+
+    // Member: qty [float]
+
+    [[nodiscard]] inline float qty() const noexcept
+    {
+        float value;
+        std::memcpy(&value, _aligned_buffer() + _qty_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void qty(const float value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _qty_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _qty_offset_v = 16;
+
+    [[nodiscard]] constexpr inline size_t _qty_offset() const noexcept
+    {
+        return _qty_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _qty_size_aligned() const noexcept
+    {
+        return 4;
+    }
+
+    // Member: level [std::uint16_t]
+
+    [[nodiscard]] inline std::uint16_t level() const noexcept
+    {
+        std::uint16_t value;
+        std::memcpy(&value, _aligned_buffer() + _level_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void level(const std::uint16_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _level_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _level_offset_v = 20;
+
+    [[nodiscard]] constexpr inline size_t _level_offset() const noexcept
+    {
+        return _level_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _level_size_aligned() const noexcept
+    {
+        return 2;
+    }
+
+    // Member: side [Side]
+
+    [[nodiscard]] inline Side side() const noexcept
+    {
+        Side value;
+        std::memcpy(&value, _aligned_buffer() + _side_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void side(const Side value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _side_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _side_offset_v = 22;
+
+    [[nodiscard]] constexpr inline size_t _side_offset() const noexcept
+    {
+        return _side_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _side_size_aligned() const noexcept
+    {
+        return 1;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    static constexpr size_t fastbin_binary_size_v = 24;
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return fastbin_binary_size_v;
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        return fastbin_binary_size_v;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+    }
+};
+
+static_assert(sizeof(bool) == 1, "fastbin: unexpected size of `bool`");
+static_assert(alignof(bool) <= 8, "fastbin: unexpected alignment of `bool`");
+static_assert(sizeof(double) == 8, "fastbin: unexpected size of `double`");
+static_assert(alignof(double) <= 8, "fastbin: unexpected alignment of `double`");
+static_assert(sizeof(float) == 4, "fastbin: unexpected size of `float`");
+static_assert(alignof(float) <= 8, "fastbin: unexpected alignment of `float`");
+static_assert(sizeof(std::uint16_t) == 2, "fastbin: unexpected size of `std::uint16_t`");
+static_assert(alignof(std::uint16_t) <= 8, "fastbin: unexpected alignment of `std::uint16_t`");
+static_assert(sizeof(Side) == 1, "fastbin: unexpected size of `Side`");
+static_assert(alignof(Side) <= 8, "fastbin: unexpected alignment of `Side`");
+
+/**
+ * Plain memory layout of `Quote` with explicit padding.
+ * The buffer of a `Quote` can be copied from/to it using `std::memcpy` or `std::bit_cast`.
+ */
+struct Quote_layout
+{
+    bool flag;
+    std::byte _flag_padding[7];
+    double price;
+    float qty;
+    std::uint16_t level;
+    Side side;
+    std::byte _side_padding[1];
+};
+static_assert(sizeof(Quote_layout) == 24);
+static_assert(offsetof(Quote_layout, flag) == 0);
+static_assert(offsetof(Quote_layout, price) == 8);
+static_assert(offsetof(Quote_layout, qty) == 16);
+static_assert(offsetof(Quote_layout, level) == 20);
+static_assert(offsetof(Quote_layout, side) == 22);
+}; // namespace my_models_packed
+
+inline std::ostream& operator<<(std::ostream& os, const my_models_packed::Quote& obj)
+{
+    os << "[my_models_packed::Quote size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    flag: " << (obj.flag() ? "true" : "false") << "\n";
+    os << "    price: " << obj.price() << "\n";
+    os << "    qty: " << obj.qty() << "\n";
+    os << "    level: " << obj.level() << "\n";
+    os << "    side: " << obj.side() << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_packed_Quote
+
+#ifndef FASTBIN_TYPE_my_models_packed_Book
+#define FASTBIN_TYPE_my_models_packed_Book
+
+namespace my_models_packed
+{
+/**
+ * Fixed-size struct with nested fixed-size structs, which start at 8-byte boundaries.
+ *
+ * ------------------------------------------------------------
+ *
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has fixed size of 64 bytes.
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct Book
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit Book(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit Book(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : Book(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~Book() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    Book(const Book&) = delete;
+    Book& operator=(const Book&) = delete;
+
+    // enable move
+    Book(Book&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    Book& operator=(Book&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    // Member: id [std::uint32_t]
+
+    [[nodiscard]] inline std::uint32_t id() const noexcept
+    {
+        std::uint32_t value;
+        std::memcpy(&value, _aligned_buffer() + _id_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void id(const std::uint32_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _id_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _id_offset_v = 0;
+
+    [[nodiscard]] constexpr inline size_t _id_offset() const noexcept
+    {
+        return _id_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _id_size_aligned() const noexcept
+    {
+        return 4;
+    }
+
+    // Member: bid [Quote]
+
+    [[nodiscard]] inline Quote bid() const noexcept
+    {
+        auto ptr = _aligned_buffer() + _bid_offset();
+        return Quote(ptr, _bid_size_aligned(), false);
+    }
+
+    inline void bid(const Quote& value) noexcept
+    {
+        assert(value.fastbin_binary_size() > 0 && "Cannot set member `bid`, parameter struct of type `Quote` not finalized. Call fastbin_finalize() on struct after creation.");
+        size_t offset = _bid_offset();
+        size_t size = value.fastbin_binary_size();
+        std::memcpy(_aligned_buffer() + offset, value.buffer, size);
+    }
+
+    static constexpr size_t _bid_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _bid_offset() const noexcept
+    {
+        return _bid_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _bid_size_aligned() const noexcept
+    {
+        return 24;
+    }
+
+    // Member: ask [Quote]
+
+    [[nodiscard]] inline Quote ask() const noexcept
+    {
+        auto ptr = _aligned_buffer() + _ask_offset();
+        return Quote(ptr, _ask_size_aligned(), false);
+    }
+
+    inline void ask(const Quote& value) noexcept
+    {
+        assert(value.fastbin_binary_size() > 0 && "Cannot set member `ask`, parameter struct of type `Quote` not finalized. Call fastbin_finalize() on struct after creation.");
+        size_t offset = _ask_offset();
+        size_t size = value.fastbin_binary_size();
+        std::memcpy(_aligned_buffer() + offset, value.buffer, size);
+    }
+
+    static constexpr size_t _ask_offset_v = 32;
+
+    [[nodiscard]] constexpr inline size_t _ask_offset() const noexcept
+    {
+        return _ask_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _ask_size_aligned() const noexcept
+    {
+        return 24;
+    }
+
+    // Member: depth [std::uint8_t]
+
+    [[nodiscard]] inline std::uint8_t depth() const noexcept
+    {
+        std::uint8_t value;
+        std::memcpy(&value, _aligned_buffer() + _depth_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void depth(const std::uint8_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _depth_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _depth_offset_v = 56;
+
+    [[nodiscard]] constexpr inline size_t _depth_offset() const noexcept
+    {
+        return _depth_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _depth_size_aligned() const noexcept
+    {
+        return 1;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    static constexpr size_t fastbin_binary_size_v = 64;
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return fastbin_binary_size_v;
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        return fastbin_binary_size_v;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+    }
+};
+
+static_assert(sizeof(std::uint32_t) == 4, "fastbin: unexpected size of `std::uint32_t`");
+static_assert(alignof(std::uint32_t) <= 8, "fastbin: unexpected alignment of `std::uint32_t`");
+static_assert(sizeof(std::uint8_t) == 1, "fastbin: unexpected size of `std::uint8_t`");
+static_assert(alignof(std::uint8_t) <= 8, "fastbin: unexpected alignment of `std::uint8_t`");
+
+/**
+ * Plain memory layout of `Book` with explicit padding.
+ * The buffer of a `Book` can be copied from/to it using `std::memcpy` or `std::bit_cast`.
+ */
+struct Book_layout
+{
+    std::uint32_t id;
+    std::byte _id_padding[4];
+    Quote_layout bid;
+    Quote_layout ask;
+    std::uint8_t depth;
+    std::byte _depth_padding[7];
+};
+static_assert(sizeof(Book_layout) == 64);
+static_assert(offsetof(Book_layout, id) == 0);
+static_assert(offsetof(Book_layout, bid) == 8);
+static_assert(offsetof(Book_layout, ask) == 32);
+static_assert(offsetof(Book_layout, depth) == 56);
+}; // namespace my_models_packed
+
+inline std::ostream& operator<<(std::ostream& os, const my_models_packed::Book& obj)
+{
+    os << "[my_models_packed::Book size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    id: " << obj.id() << "\n";
+    os << "    bid: " << obj.bid() << "\n";
+    os << "    ask: " << obj.ask() << "\n";
+    os << "    depth: " << obj.depth() << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_packed_Book
+
+#ifndef FASTBIN_TYPE_my_models_packed_Message
+#define FASTBIN_TYPE_my_models_packed_Message
+
+namespace my_models_packed
+{
+/**
+ * Variable-length struct with packed members after variable-length members.
+ *
+ * ------------------------------------------------------------
+ *
+ * Binary serializable data container generated by `fastbin`.
+ * 
+ * This container has variable size.
+ * All setter methods starting from the first variable-sized member and afterwards MUST be called in order.
+ *
+ * Members in order
+ * ================
+ * - `seq` [`std::uint16_t`]  (fixed)
+ * - `symbol` [`std::string_view`] (variable)
+ * - `count` [`std::uint8_t`] (fixed)
+ * - `sizes` [`std::span<std::uint16_t>`] (variable)
+ * - `book` [`Book`]          (fixed)
+ * - `flags` [`std::uint32_t`] (fixed)
+ * - `last` [`std::int8_t`]   (fixed)
+ *
+ * The `finalize()` method MUST be called after all setter methods have been called.
+ * 
+ * It is the responsibility of the caller to ensure that the buffer is
+ * large enough to hold all data, and that it is aligned to 8 bytes.
+ */
+struct Message
+{
+    std::byte* buffer{nullptr};
+    size_t buffer_size{0};
+    bool owns_buffer{false};
+
+    explicit Message(std::byte* buffer, size_t binary_size, bool owns_buffer) noexcept
+        : buffer(buffer), buffer_size(binary_size), owns_buffer(owns_buffer)
+    {
+        // member accessors assume 8-byte alignment, see _aligned_buffer()
+        assert(reinterpret_cast<std::uintptr_t>(buffer) % 8 == 0 && "fastbin: buffer must be aligned to 8 bytes");
+    }
+
+    explicit Message(std::span<std::byte> buffer, bool owns_buffer) noexcept
+        : Message(buffer.data(), buffer.size(), owns_buffer)
+    {
+    }
+
+    ~Message() noexcept
+    {
+        if (owns_buffer && buffer != nullptr)
+        {
+            delete[] buffer;
+            buffer = nullptr;
+        }
+    }
+
+    // disable copy
+    Message(const Message&) = delete;
+    Message& operator=(const Message&) = delete;
+
+    // enable move
+    Message(Message&& other) noexcept
+        : buffer(other.buffer), buffer_size(other.buffer_size), owns_buffer(other.owns_buffer)
+    {
+        other.buffer = nullptr;
+        other.buffer_size = 0;
+    }
+    Message& operator=(Message&& other) noexcept
+    {
+        if (this != &other)
+        {
+            if (owns_buffer && buffer != nullptr)
+               delete[] buffer;
+            buffer = other.buffer;
+            buffer_size = other.buffer_size;
+            owns_buffer = other.owns_buffer;
+            other.buffer = nullptr;
+            other.buffer_size = 0;
+            other.owns_buffer = false;
+        }
+        return *this;
+    }
+
+    // buffer is required to be aligned to 8 bytes (asserted in constructor)
+    [[nodiscard]] constexpr std::byte* _aligned_buffer() const noexcept
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return static_cast<std::byte*>(__builtin_assume_aligned(buffer, 8));
+#else
+        return buffer;
+#endif
+    }
+
+    static constexpr size_t _size_mask_v = 0x00FFFFFFFFFFFFFFULL;
+
+    // Member: seq [std::uint16_t]
+
+    [[nodiscard]] inline std::uint16_t seq() const noexcept
+    {
+        std::uint16_t value;
+        std::memcpy(&value, _aligned_buffer() + _seq_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void seq(const std::uint16_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _seq_offset(), &value, sizeof(value));
+    }
+
+    static constexpr size_t _seq_offset_v = 8;
+
+    [[nodiscard]] constexpr inline size_t _seq_offset() const noexcept
+    {
+        return _seq_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _seq_size_aligned() const noexcept
+    {
+        return 2;
+    }
+
+    // Member: symbol [std::string_view]
+
+    [[nodiscard]] inline std::string_view symbol() const noexcept
+    {
+        size_t n_bytes = _symbol_size_unaligned() - 8;
+        size_t count = n_bytes;
+        auto ptr = reinterpret_cast<const char*>(_aligned_buffer() + _symbol_offset() + 8);
+        return std::string_view(ptr, count);
+    }
+
+    inline void symbol(const std::string_view value) noexcept
+    {
+        size_t offset = _symbol_offset();
+        size_t contents_size = value.size() * 1;
+        size_t unaligned_size = 8 + contents_size;
+        size_t aligned_size = (unaligned_size + 7) & ~7;
+        size_t aligned_diff = aligned_size - unaligned_size;
+        size_t aligned_size_high = aligned_size | (aligned_diff << 56);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    static constexpr size_t _symbol_offset_v = 16;
+
+    [[nodiscard]] constexpr inline size_t _symbol_offset() const noexcept
+    {
+        return _symbol_offset_v;
+    }
+
+    [[nodiscard]] constexpr inline size_t _symbol_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _symbol_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _symbol_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _symbol_offset(), sizeof(stored_size));
+        size_t aligned_diff = stored_size >> 56;
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size - aligned_diff;
+    }
+
+    // Member: count [std::uint8_t]
+
+    [[nodiscard]] inline std::uint8_t count() const noexcept
+    {
+        std::uint8_t value;
+        std::memcpy(&value, _aligned_buffer() + _count_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void count(const std::uint8_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _count_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _count_offset() const noexcept
+    {
+        return _symbol_offset() + _symbol_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _count_size_aligned() const noexcept
+    {
+        return 1;
+    }
+
+    // Member: sizes [std::span<std::uint16_t>]
+
+    [[nodiscard]] inline std::span<std::uint16_t> sizes() const noexcept
+    {
+        size_t n_bytes = _sizes_size_unaligned() - 8;
+        size_t count = n_bytes >> 1;
+        auto ptr = reinterpret_cast<std::uint16_t*>(_aligned_buffer() + _sizes_offset() + 8);
+        return std::span<std::uint16_t>(ptr, count);
+    }
+
+    inline void sizes(const std::span<std::uint16_t> value) noexcept
+    {
+        size_t offset = _sizes_offset();
+        size_t contents_size = value.size() * 2;
+        size_t unaligned_size = 8 + contents_size;
+        size_t aligned_size = (unaligned_size + 7) & ~7;
+        size_t aligned_diff = aligned_size - unaligned_size;
+        size_t aligned_size_high = aligned_size | (aligned_diff << 56);
+        std::memcpy(_aligned_buffer() + offset, &aligned_size_high, sizeof(aligned_size_high));
+        std::memcpy(_aligned_buffer() + offset + 8, value.data(), contents_size);
+    }
+
+    [[nodiscard]] constexpr inline size_t _sizes_offset() const noexcept
+    {
+        return (_count_offset() + _count_size_aligned() + 7) & ~size_t(7);
+    }
+
+    [[nodiscard]] constexpr inline size_t _sizes_size_aligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _sizes_offset(), sizeof(stored_size));
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size;
+    }
+
+    [[nodiscard]] constexpr inline size_t _sizes_size_unaligned() const noexcept
+    {
+        size_t stored_size;
+        std::memcpy(&stored_size, _aligned_buffer() + _sizes_offset(), sizeof(stored_size));
+        size_t aligned_diff = stored_size >> 56;
+        size_t aligned_size = stored_size & _size_mask_v;
+        return aligned_size - aligned_diff;
+    }
+
+    // Member: book [Book]
+
+    [[nodiscard]] inline Book book() const noexcept
+    {
+        auto ptr = _aligned_buffer() + _book_offset();
+        return Book(ptr, _book_size_aligned(), false);
+    }
+
+    inline void book(const Book& value) noexcept
+    {
+        assert(value.fastbin_binary_size() > 0 && "Cannot set member `book`, parameter struct of type `Book` not finalized. Call fastbin_finalize() on struct after creation.");
+        size_t offset = _book_offset();
+        size_t size = value.fastbin_binary_size();
+        std::memcpy(_aligned_buffer() + offset, value.buffer, size);
+    }
+
+    [[nodiscard]] constexpr inline size_t _book_offset() const noexcept
+    {
+        return _sizes_offset() + _sizes_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _book_size_aligned() const noexcept
+    {
+        return 64;
+    }
+
+    // Member: flags [std::uint32_t]
+
+    [[nodiscard]] inline std::uint32_t flags() const noexcept
+    {
+        std::uint32_t value;
+        std::memcpy(&value, _aligned_buffer() + _flags_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void flags(const std::uint32_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _flags_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _flags_offset() const noexcept
+    {
+        return _book_offset() + _book_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _flags_size_aligned() const noexcept
+    {
+        return 4;
+    }
+
+    // Member: last [std::int8_t]
+
+    [[nodiscard]] inline std::int8_t last() const noexcept
+    {
+        std::int8_t value;
+        std::memcpy(&value, _aligned_buffer() + _last_offset(), sizeof(value));
+        return value;
+    }
+
+    inline void last(const std::int8_t value) noexcept
+    {
+        std::memcpy(_aligned_buffer() + _last_offset(), &value, sizeof(value));
+    }
+
+    [[nodiscard]] constexpr inline size_t _last_offset() const noexcept
+    {
+        return _flags_offset() + _flags_size_aligned();
+    }
+
+    [[nodiscard]] constexpr inline size_t _last_size_aligned() const noexcept
+    {
+        return 1;
+    }
+
+    // --------------------------------------------------------------------------------
+
+    [[nodiscard]] constexpr inline size_t fastbin_calc_binary_size() const noexcept
+    {
+        return (_last_offset() + _last_size_aligned() + 7) & ~size_t(7);
+    }
+
+    /**
+     * Returns the stored (aligned) binary size of the object.
+     * This function should only be called after `fastbin_finalize()`.
+     */
+    [[nodiscard]] constexpr inline size_t fastbin_binary_size() const noexcept
+    {
+        size_t binary_size;
+        std::memcpy(&binary_size, _aligned_buffer(), sizeof(binary_size));
+        return binary_size;
+    }
+
+    /**
+     * Finalizes the object by writing the binary size to the beginning of its buffer.
+     * After calling this function, the underlying buffer can be used for serialization.
+     * To get the actual buffer size, call `fastbin_binary_size()`.
+     */
+    inline void fastbin_finalize() const noexcept
+    {
+        size_t binary_size = fastbin_calc_binary_size();
+        std::memcpy(_aligned_buffer(), &binary_size, sizeof(binary_size));
+    }
+};
+
+static_assert(sizeof(std::uint16_t) == 2, "fastbin: unexpected size of `std::uint16_t`");
+static_assert(alignof(std::uint16_t) <= 8, "fastbin: unexpected alignment of `std::uint16_t`");
+static_assert(sizeof(char) == 1, "fastbin: unexpected size of `char`");
+static_assert(alignof(char) <= 8, "fastbin: unexpected alignment of `char`");
+static_assert(sizeof(std::uint8_t) == 1, "fastbin: unexpected size of `std::uint8_t`");
+static_assert(alignof(std::uint8_t) <= 8, "fastbin: unexpected alignment of `std::uint8_t`");
+static_assert(sizeof(std::uint32_t) == 4, "fastbin: unexpected size of `std::uint32_t`");
+static_assert(alignof(std::uint32_t) <= 8, "fastbin: unexpected alignment of `std::uint32_t`");
+static_assert(sizeof(std::int8_t) == 1, "fastbin: unexpected size of `std::int8_t`");
+static_assert(alignof(std::int8_t) <= 8, "fastbin: unexpected alignment of `std::int8_t`");
+}; // namespace my_models_packed
+
+inline std::ostream& operator<<(std::ostream& os, const my_models_packed::Message& obj)
+{
+    os << "[my_models_packed::Message size=" << obj.fastbin_binary_size() << " bytes]\n";
+    os << "    seq: " << obj.seq() << "\n";
+    os << "    symbol: " << std::string(obj.symbol()) << "\n";
+    os << "    count: " << obj.count() << "\n";
+    os << "    sizes: " << "[vector<uint16> count=" << obj.sizes().size() << "]" << "\n";
+    os << "    book: " << obj.book() << "\n";
+    os << "    flags: " << obj.flags() << "\n";
+    os << "    last: " << obj.last() << "\n";
+    return os;
+}
+
+#endif // FASTBIN_TYPE_my_models_packed_Message
@@ -0,0 +1,29 @@
+import os
+import sys
+
+# generator module lives in the parent directory (compiled with mypyc or plain Python),
+# the generator-agnostic checks in the repository root
+CPP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(CPP_DIR))
+sys.path.insert(0, CPP_DIR)
+
+import fastbin_cpp  # noqa: E402
+import generator_tests  # noqa: E402
+
+GENERATOR = (fastbin_cpp, fastbin_cpp.generate_cpp_code, ".hpp")
+
+
+def test_parallel_output_matches_serial():
+    generator_tests.check_parallel_output_matches_serial(*GENERATOR)
+
+
+def test_cache_detects_changed_outputs():
+    generator_tests.check_cache_detects_changed_outputs(*GENERATOR)
+
+
+def test_duplicate_enum_value_rejected():
+    generator_tests.check_duplicate_enum_value_rejected(*GENERATOR)
+
+
+if __name__ == "__main__":
+    generator_tests.run_all(*GENERATOR)
@@ -2,8 +2,10 @@
 #include <string>
 #include <vector>
 #include <cstddef>
+#include <cstring>
 #include <iostream>
 #include "../generated/models.hpp"
+#include "../generated/models_all.hpp" // per-type guards allow including both
 
 using std::vector;
 using std::byte;
@@ -101,6 +103,29 @@ TEST(fastbin, ser_de_Nested)
     EXPECT_EQ(p.str(), "str");
 }
 
+TEST(fastbin, layout_ChildFixed)
+{
+    alignas(8) byte buffer[my_models::ChildFixed::fastbin_binary_size_v]{};
+
+    my_models::ChildFixed c(buffer, sizeof(buffer), false);
+    c.field1(456);
+    c.field2(789);
+    c.fastbin_finalize();
+
+    my_models::ChildFixed_layout layout;
+    std::memcpy(&layout, c.buffer, c.fastbin_binary_size());
+    EXPECT_EQ(layout.field1, 456);
+    EXPECT_EQ(layout.field2, 789);
+}
+
+#ifndef NDEBUG
+TEST(fastbin, misaligned_buffer_asserts)
+{
+    alignas(8) byte buffer[my_models::ChildFixed::fastbin_binary_size_v + 8]{};
+    EXPECT_DEATH(my_models::ChildFixed(buffer + 1, sizeof(buffer) - 1, false), "aligned to 8 bytes");
+}
+#endif
+
 TEST(fastbin, ser_de_UInt32Vector)
 {
     const size_t buffer_size = 1024;
@@ -124,3 +149,38 @@ TEST(fastbin, ser_de_UInt32Vector)
     for (size_t i = 0; i < values.size(); ++i)
         EXPECT_EQ(v.values()[i], values[i]);
 }
+
+TEST(fastbin, ser_de_Float32Vector)
+{
+    const size_t buffer_size = 1024;
+    byte* buffer = new byte[buffer_size]();
+
+    my_models::Float32Vector v(buffer, buffer_size, true); // owns buffer
+    uint32_t count = 23;
+    vector<float> values(count);
+    for (uint32_t i = 0; i < count; ++i)
+        values[i] = 0.5f * i;
+    v.values(std::span<float>(values.data(), values.size()));
+    v.count(count);
+    v.fastbin_finalize();
+
+    // float32 elements take 4 bytes each, the odd count is padded to 8 bytes
+    EXPECT_EQ(v._values_size_unaligned(), 8 + count * sizeof(float));
+    EXPECT_EQ(v._values_size_aligned(), 104);
+    EXPECT_EQ(v.count(), count);
+    EXPECT_EQ(v.fastbin_binary_size(), v.fastbin_calc_binary_size());
+    EXPECT_EQ(v._count_offset() + v._count_size_aligned(), v.fastbin_binary_size());
+
+    EXPECT_EQ(v.values().size(), values.size());
+    for (size_t i = 0; i < values.size(); ++i)
+        EXPECT_EQ(v.values()[i], values[i]);
+}
+
+TEST(fastbin, enum_from_string)
+{
+    EXPECT_EQ(my_models::from_string<my_models::TradeSide>("Buy"), my_models::TradeSide::Buy);
+    EXPECT_EQ(my_models::from_string<my_models::TradeSide>("Sell"), my_models::TradeSide::Sell);
+    EXPECT_EQ(my_models::from_string<my_models::TickDirection>(to_string(my_models::TickDirection::ZeroMinusTick)), my_models::TickDirection::ZeroMinusTick);
+    EXPECT_THROW(my_models::from_string<my_models::TradeSide>("Sel"), std::invalid_argument);
+    static_assert(to_string_view(my_models::TradeSide::Buy) == "Buy");
+}
@@ -0,0 +1,142 @@
+#include <gtest/gtest.h>
+#include <string>
+#include <vector>
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include "../generated_packed/models.hpp"
+
+using std::vector;
+using std::byte;
+using std::string;
+
+// packed schema: primitives and enums take their native size at natural alignment,
+// nested structs start at 8-byte boundaries and struct sizes are rounded up to 8 bytes
+static_assert(my_models_packed::Quote::_flag_offset_v == 0);
+static_assert(my_models_packed::Quote::_price_offset_v == 8);
+static_assert(my_models_packed::Quote::_qty_offset_v == 16);
+static_assert(my_models_packed::Quote::_level_offset_v == 20);
+static_assert(my_models_packed::Quote::_side_offset_v == 22);
+static_assert(my_models_packed::Quote::fastbin_binary_size_v == 24); // 23 rounded up
+static_assert(sizeof(my_models_packed::Quote_layout) == 24);
+
+static_assert(my_models_packed::Book::_id_offset_v == 0);
+static_assert(my_models_packed::Book::_bid_offset_v == 8);
+static_assert(my_models_packed::Book::_ask_offset_v == 32);
+static_assert(my_models_packed::Book::_depth_offset_v == 56);
+static_assert(my_models_packed::Book::fastbin_binary_size_v == 64); // 57 rounded up
+static_assert(sizeof(my_models_packed::Book_layout) == 64);
+
+static_assert(my_models_packed::Message::_seq_offset_v == 8);
+static_assert(my_models_packed::Message::_symbol_offset_v == 16);
+
+static void set_quote(my_models_packed::Quote q, bool flag, double price, float qty, uint16_t level)
+{
+    q.flag(flag);
+    q.price(price);
+    q.qty(qty);
+    q.level(level);
+    q.side(flag ? my_models_packed::Side::Buy : my_models_packed::Side::Sell);
+    q.fastbin_finalize();
+}
+
+TEST(fastbin, packed_ser_de_Quote)
+{
+    alignas(8) byte buffer[my_models_packed::Quote::fastbin_binary_size_v]{};
+
+    my_models_packed::Quote q(buffer, sizeof(buffer), false);
+    set_quote(my_models_packed::Quote(buffer, sizeof(buffer), false), true, 123.45, 0.5f, 65000);
+
+    EXPECT_EQ(q.fastbin_binary_size(), 24);
+    EXPECT_EQ(q.flag(), true);
+    EXPECT_EQ(q.price(), 123.45);
+    EXPECT_EQ(q.qty(), 0.5f);
+    EXPECT_EQ(q.level(), 65000);
+    EXPECT_EQ(q.side(), my_models_packed::Side::Buy);
+
+    my_models_packed::Quote_layout layout;
+    std::memcpy(&layout, q.buffer, q.fastbin_binary_size());
+    EXPECT_EQ(layout.flag, true);
+    EXPECT_EQ(layout.price, 123.45);
+    EXPECT_EQ(layout.qty, 0.5f);
+    EXPECT_EQ(layout.level, 65000);
+    EXPECT_EQ(layout.side, my_models_packed::Side::Buy);
+}
+
+TEST(fastbin, packed_ser_de_Book)
+{
+    alignas(8) byte buffer[my_models_packed::Book::fastbin_binary_size_v]{};
+
+    my_models_packed::Book b(buffer, sizeof(buffer), false);
+    b.id(4000000000u);
+    set_quote(b.bid(), true, 99.5, 1.25f, 1);
+    set_quote(b.ask(), false, 100.5, 2.5f, 2);
+    b.depth(255);
+    b.fastbin_finalize();
+
+    EXPECT_EQ(b.fastbin_binary_size(), 64);
+    EXPECT_EQ(b.id(), 4000000000u);
+    EXPECT_EQ(b.bid().price(), 99.5);
+    EXPECT_EQ(b.bid().qty(), 1.25f);
+    EXPECT_EQ(b.bid().level(), 1);
+    EXPECT_EQ(b.bid().side(), my_models_packed::Side::Buy);
+    EXPECT_EQ(b.ask().price(), 100.5);
+    EXPECT_EQ(b.ask().qty(), 2.5f);
+    EXPECT_EQ(b.ask().level(), 2);
+    EXPECT_EQ(b.ask().side(), my_models_packed::Side::Sell);
+    EXPECT_EQ(b.depth(), 255);
+
+    my_models_packed::Book_layout layout;
+    std::memcpy(&layout, b.buffer, b.fastbin_binary_size());
+    EXPECT_EQ(layout.id, 4000000000u);
+    EXPECT_EQ(layout.bid.price, 99.5);
+    EXPECT_EQ(layout.ask.level, 2);
+    EXPECT_EQ(layout.depth, 255);
+}
+
+TEST(fastbin, packed_ser_de_Message)
+{
+    const size_t buffer_size = 1024;
+    byte* buffer = new byte[buffer_size]();
+
+    string symbol = "BTCUSDT";
+    vector<uint16_t> sizes{1, 2, 3};
+
+    my_models_packed::Message m(buffer, buffer_size, true); // owns buffer
+    m.seq(65535);
+    m.symbol(symbol);
+    m.count(7);
+    m.sizes(std::span<uint16_t>(sizes.data(), sizes.size()));
+    m.book().id(42);
+    set_quote(m.book().bid(), true, 1.5, 3.0f, 10);
+    set_quote(m.book().ask(), false, 2.5, 4.0f, 20);
+    m.book().depth(3);
+    m.book().fastbin_finalize();
+    m.flags(0xDEADBEEF);
+    m.last(-5);
+    m.fastbin_finalize();
+
+    // members after variable-length members are placed at their natural alignment
+    EXPECT_EQ(m._count_offset(), 32);
+    EXPECT_EQ(m._sizes_offset(), 40);
+    EXPECT_EQ(m._book_offset(), 56);
+    EXPECT_EQ(m._flags_offset(), 120);
+    EXPECT_EQ(m._last_offset(), 124);
+
+    // last member ends at byte 125, the binary size is rounded up to 128
+    EXPECT_EQ(m.fastbin_binary_size(), 128);
+    EXPECT_EQ(m.fastbin_binary_size(), m.fastbin_calc_binary_size());
+
+    EXPECT_EQ(m.seq(), 65535);
+    EXPECT_EQ(m.symbol(), symbol);
+    EXPECT_EQ(m.count(), 7);
+    EXPECT_EQ(m.sizes().size(), sizes.size());
+    for (size_t i = 0; i < sizes.size(); ++i)
+        EXPECT_EQ(m.sizes()[i], sizes[i]);
+    EXPECT_EQ(m.book().id(), 42);
+    EXPECT_EQ(m.book().bid().price(), 1.5);
+    EXPECT_EQ(m.book().ask().qty(), 4.0f);
+    EXPECT_EQ(m.book().depth(), 3);
+    EXPECT_EQ(m.flags(), 0xDEADBEEF);
+    EXPECT_EQ(m.last(), -5);
+}
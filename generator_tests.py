@@ -0,0 +1,117 @@
+import filecmp
+import json
+import os
+import sys
+import tempfile
+from types import ModuleType
+from typing import Callable
+
+# generator-agnostic checks shared by cpp/tests/test_fastbin_cpp.py and julia/test_fastbin_jl.py,
+# called with the generator module, its generate function and the extension of its output files
+
+
+def make_large_schema(n_structs: int) -> dict:
+    # one enum per struct, alternating fixed-size structs and variable-length
+    # structs nesting the preceding fixed-size one
+    enums = {}
+    structs = {}
+    for i in range(n_structs):
+        enums[f"Enum{i}"] = {
+            "type": "uint8",
+            "members": {"First": {"value": 0}, "Second": {"value": 1}},
+        }
+        if i % 2 == 0:
+            members = {"a": "int32", "b": "float64", "e": f"enum:Enum{i}"}
+        else:
+            members = {
+                "child": f"struct:Struct{i - 1}",
+                "e": f"enum:Enum{i}",
+                "text": "string",
+                "values": "vector<uint16>",
+            }
+        structs[f"Struct{i}"] = {"members": members}
+    return {"namespace": "large_models", "enums": enums, "structs": structs}
+
+
+def write_schema(directory: str, schema: dict) -> str:
+    schema_file = os.path.join(directory, "schema.json")
+    with open(schema_file, "w") as file:
+        json.dump(schema, file)
+    return schema_file
+
+
+def check_parallel_output_matches_serial(
+    generator: ModuleType, generate: Callable, ext: str
+) -> None:
+    # enough types to use the process pool by default
+    schema = make_large_schema(generator.PARALLEL_MIN_TYPES)
+    with tempfile.TemporaryDirectory() as tmp:
+        schema_file = write_schema(tmp, schema)
+        serial_dir = os.path.join(tmp, "serial")
+        parallel_dir = os.path.join(tmp, "parallel")
+        generate(schema_file, serial_dir, parallel_min_types=sys.maxsize)
+        generate(schema_file, parallel_dir)
+
+        files = sorted(os.listdir(serial_dir))
+        assert f"Struct0{ext}" in files
+        assert files == sorted(os.listdir(parallel_dir))
+        _, mismatch, errors = filecmp.cmpfiles(serial_dir, parallel_dir, files, shallow=False)
+        assert mismatch == [] and errors == [], (mismatch, errors)
+
+
+def check_cache_detects_changed_outputs(
+    generator: ModuleType, generate: Callable, ext: str
+) -> None:
+    schema = make_large_schema(4)
+    with tempfile.TemporaryDirectory() as tmp:
+        schema_file = write_schema(tmp, schema)
+        output_dir = os.path.join(tmp, "generated")
+        generate(schema_file, output_dir)
+        with open(os.path.join(output_dir, f"Struct1{ext}")) as file:
+            expected = file.read()
+        digest = generator.calc_generation_digest(json.dumps(schema).encode())
+        assert generator.is_generation_up_to_date(output_dir, digest)
+
+        # deleted output file
+        os.remove(os.path.join(output_dir, f"Enum0{ext}"))
+        assert not generator.is_generation_up_to_date(output_dir, digest)
+        generate(schema_file, output_dir)
+        assert os.path.exists(os.path.join(output_dir, f"Enum0{ext}"))
+
+        # hand-edited output file
+        with open(os.path.join(output_dir, f"Struct1{ext}"), "a") as file:
+            file.write("\n")
+        assert not generator.is_generation_up_to_date(output_dir, digest)
+        generate(schema_file, output_dir)
+        with open(os.path.join(output_dir, f"Struct1{ext}")) as file:
+            assert file.read() == expected
+
+        # forced regeneration rewrites files even if the cache is valid
+        assert generator.is_generation_up_to_date(output_dir, digest)
+        os.remove(os.path.join(output_dir, f"models{ext}"))
+        with open(os.path.join(output_dir, generator.CACHE_FILE_NAME), "r") as file:
+            cache = file.read()
+        generate(schema_file, output_dir, force=True)
+        assert os.path.exists(os.path.join(output_dir, f"models{ext}"))
+        with open(os.path.join(output_dir, generator.CACHE_FILE_NAME), "r") as file:
+            assert file.read() == cache
+
+
+def check_duplicate_enum_value_rejected(
+    generator: ModuleType, generate: Callable, ext: str
+) -> None:
+    schema = make_large_schema(1)
+    schema["enums"]["Enum0"]["members"]["Third"] = {"value": 1}
+    try:
+        generator.GenContext(schema)
+    except ValueError as e:
+        assert "duplicate value 1" in str(e), e
+    else:
+        raise AssertionError("duplicate enum value not rejected")
+
+
+def run_all(generator: ModuleType, generate: Callable, ext: str) -> None:
+    check_parallel_output_matches_serial(generator, generate, ext)
+    check_cache_detects_changed_outputs(generator, generate, ext)
+    check_duplicate_enum_value_rejected(generator, generate, ext)
+    print("All generator tests passed")
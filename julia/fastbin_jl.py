@@ -1,12 +1,81 @@
-import json
+import filecmp
+import hashlib
 import os
 import sys
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from string import Template
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+try:
+    # optional, considerably faster for large schemas
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
 
 prefix = "_"  # prefix for internally generated functions
 
+# stores the digest of schema and generator used for the generated files
+CACHE_FILE_NAME = ".fastbin.cache"
+
+# schemas with fewer enums/structs are generated serially, process startup would dominate
+PARALLEL_MIN_TYPES = 64
+
+_MEMBER_NAME = "\x00member\x00"  # placeholder for member names in cached code templates
+
+# closing part of every struct's docstring
+_STRUCT_DOCSTRING_FOOTER = '''\
+The `fastbin_finalize!()` method MUST be called after all setter methods have been called.
+
+It is the responsibility of the caller to ensure that the buffer is
+large enough to hold all data.
+"""
+'''
+
+# mutable struct with buffer ownership handling (constructors, finalizer),
+# identical for all structs except for their name and size header initialization
+_STRUCT_SKELETON = Template(
+    """\
+mutable struct ${name}
+    buffer::Ptr{UInt8}
+    buffer_size::UInt64
+    owns_buffer::Bool
+
+    function ${name}(buffer::Ptr{UInt8}, buffer_size::UInt64, owns_buffer::Bool)
+        new(buffer, buffer_size, owns_buffer)
+    end
+
+    function ${name}(buffer_size::Integer)
+        buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
+${init_size_header}        new(buffer, buffer_size, true)
+    end
+end
+
+function Base.finalizer(obj::${name})
+    if obj.owns_buffer && obj.buffer != C_NULL
+        Base.Libc.free(obj.buffer)
+        obj.buffer = C_NULL
+    end
+    nothing
+end
+"""
+)
+
 
 class TypeDef:
+    __slots__ = (
+        "category",
+        "name",
+        "lang_type",
+        "include_stmt",
+        "native_size",
+        "aligned_size",
+        "variable_length",
+        "use_print",
+        "element_type_def",
+        "log2_size",
+    )
+
     category: str  # e = Enum, s = Struct, c = Container/Vector, p = Primitive
     name: str
     lang_type: str
@@ -16,6 +85,7 @@ class TypeDef:
     variable_length: bool
     use_print: bool
     element_type_def: Optional["TypeDef"]
+    log2_size: Optional[int]  # log2(native_size) if native_size is a power of two
 
     def __init__(
         self,
@@ -38,9 +108,14 @@ class TypeDef:
         self.variable_length = variable_length
         self.use_print = use_print
         self.element_type_def = element_type_def
+        self.log2_size = None
+        if native_size > 0 and native_size & (native_size - 1) == 0:
+            self.log2_size = native_size.bit_length() - 1
 
 
 class StructMemberDef:
+    __slots__ = ("name", "type_def")
+
     name: str
     type_def: TypeDef
 
@@ -54,9 +129,13 @@ class StructMemberDef:
 
 
 class StructDef:
+    __slots__ = ("name", "type_def", "members", "member_names", "includes", "docstring")
+
     name: str
     type_def: TypeDef
     members: Dict[str, StructMemberDef]
+    member_names: List[str]
+    includes: Dict[str, None]
     docstring: str
 
     def __init__(
@@ -69,10 +148,18 @@ class StructDef:
         self.name = name
         self.type_def = type_def
         self.members = members
+        self.member_names = list(members.keys())
+        # dict used as insertion-ordered set to remove duplicates
+        self.includes = {}
+        for m in members.values():
+            if m.type_def.include_stmt != "":
+                self.includes[m.type_def.include_stmt] = None
         self.docstring = docstring
 
 
 class EnumMemberDef:
+    __slots__ = ("name", "value", "docstring")
+
     name: str
     value: int
     docstring: List[str]
@@ -84,6 +171,8 @@ class EnumMemberDef:
 
 
 class EnumDef:
+    __slots__ = ("name", "type_def", "storage_type_def", "members", "docstring")
+
     name: str
     type_def: TypeDef
     storage_type_def: TypeDef
@@ -105,19 +194,47 @@ class EnumDef:
         self.docstring = docstring
 
 
+def align_up(value: int, alignment: int) -> int:
+    # round value up to the next multiple of alignment (power of 2)
+    return (value + alignment - 1) & ~(alignment - 1)
+
+
+def member_alignment(type_def: TypeDef) -> int:
+    # primitives and enums are aligned to their (aligned) size, which is 8 bytes unless packed,
+    # containers and structs always start at 8-byte boundaries
+    if type_def.category in ("p", "e"):
+        return type_def.aligned_size
+    return 8
+
+
 class GenContext:
+    __slots__ = (
+        "namespace",
+        "enums",
+        "structs",
+        "enum_types",
+        "struct_types",
+        "built_in_types",
+        "_type_cache",
+        "_body_cache",
+    )
+
     namespace: str
     enums: Dict[str, EnumDef]
     structs: Dict[str, StructDef]
     enum_types: Dict[str, TypeDef]
     struct_types: Dict[str, TypeDef]
     built_in_types: Dict[str, TypeDef]
+    _type_cache: Dict[str, TypeDef]
+    _body_cache: Dict[Tuple[str, int, bool], str]
 
     def __init__(self, schema: dict):
         self.enums = {}
         self.structs = {}
         self.enum_types = {}
         self.struct_types = {}
+        self._type_cache = {}
+        self._body_cache = {}
         self.built_in_types = {
             "int8": TypeDef("p", "int8", "Int8", "", 1, 8, False, True),
             "int16": TypeDef("p", "int16", "Int16", "", 2, 8, False, True),
@@ -129,7 +246,7 @@ class GenContext:
             "uint64": TypeDef("p", "uint64", "UInt64", "", 8, 8, False, True),
             "byte": TypeDef("p", "byte", "UInt8", "", 1, 8, False, True),
             "char": TypeDef("p", "char", "UInt8", "", 1, 8, False, True),
-            "float32": TypeDef("p", "float32", "Float32", "", 8, 8, False, True),
+            "float32": TypeDef("p", "float32", "Float32", "", 4, 8, False, True),
             "float64": TypeDef("p", "float64", "Float64", "", 8, 8, False, True),
             "bool": TypeDef("p", "bool", "Bool", "", 1, 8, False, True),
         }
@@ -150,6 +267,12 @@ class GenContext:
         if self.namespace == "":
             raise ValueError("No namespace defined in schema")
 
+        # packed schemas store primitives (and enums) with their natural size and alignment
+        if schema.get("pack", False):
+            for built_in_type in self.built_in_types.values():
+                if built_in_type.category == "p":
+                    built_in_type.aligned_size = built_in_type.native_size
+
         # parse enums
         for enum_name, enum_content in schema.get("enums", {}).items():
             if not "type" in enum_content:
@@ -173,8 +296,19 @@ class GenContext:
 
             # parse enum members
             members = {}
+            seen_values = set()
             for member_name, member_content in enum_content.get("members", {}).items():
-                value = member_content["value"]
+                try:
+                    value = member_content["value"]
+                except KeyError:
+                    raise ValueError(
+                        f"Enum member '{enum_name}.{member_name}' does not have 'value' defined"
+                    )
+                if value in seen_values:
+                    raise ValueError(
+                        f"Enum '{enum_name}' has duplicate value {value} for member '{member_name}'"
+                    )
+                seen_values.add(value)
                 member_docstring = parse_docstring(
                     member_content.get("docstring", None)
                 )
@@ -192,16 +326,22 @@ class GenContext:
             docstring = parse_docstring(struct_content.get("docstring", None))
 
             # parse struct members
+            # and calculate total size of struct (aligned) in the same pass
             members: Dict[str, StructMemberDef] = {}
+            variable_length = False
+            size = 0
             for member_name, member_type in struct_content.get("members", {}).items():
                 type_def = self.get_type_def(member_type)
                 members[member_name] = StructMemberDef(member_name, type_def)
-
-            # calculate total size of struct (aligned)
-            variable_length = any(m.type_def.variable_length for m in members.values())
-            size = -1
-            if not variable_length:
-                size = sum(x.type_def.aligned_size for x in members.values())
+                if type_def.variable_length:
+                    variable_length = True
+                else:
+                    size = align_up(size, member_alignment(type_def)) + type_def.aligned_size
+            if variable_length:
+                size = -1
+            else:
+                # structs are always a multiple of 8 bytes
+                size = align_up(size, 8)
             type_def = TypeDef(
                 "s",
                 struct_name,
@@ -218,37 +358,50 @@ class GenContext:
             self.struct_types[struct_name] = type_def
 
     def get_struct_def(self, name: str) -> StructDef:
-        if not name in self.structs:
+        struct_def = self.structs.get(name)
+        if struct_def is None:
             raise ValueError(f"Struct '{name}' not found or used before declaration")
-        return self.structs[name]
+        return struct_def
 
     def get_enum_def(self, name: str) -> EnumDef:
-        if not name in self.enums:
+        enum_def = self.enums.get(name)
+        if enum_def is None:
             raise ValueError(f"Enum '{name}' not found")
-        return self.enums[name]
+        return enum_def
 
     def get_type_def(self, type_name: str) -> TypeDef:
+        # identical type names resolve to the same TypeDef instance
+        type_def = self._type_cache.get(type_name)
+        if type_def is None:
+            type_def = self._resolve_type_def(type_name)
+            self._type_cache[type_name] = type_def
+        return type_def
+
+    def _resolve_type_def(self, type_name: str) -> TypeDef:
         # primitive types (int8, double, etc.)
-        if type_name in self.built_in_types:
-            return self.built_in_types[type_name]
+        type_def = self.built_in_types.get(type_name)
+        if type_def is not None:
+            return type_def
 
         # enum:MyEnum
         if type_name.startswith("enum:"):
-            enum_type_name = type_name.split(":")[1]
-            if enum_type_name not in self.enum_types:
+            enum_type_name = type_name[5:]
+            type_def = self.enum_types.get(enum_type_name)
+            if type_def is None:
                 raise ValueError(f"Enum '{enum_type_name}' not found")
-            return self.enum_types[enum_type_name]
+            return type_def
 
         # struct:MyStruct
         if type_name.startswith("struct:"):
-            struct_type_name = type_name.split(":")[1]
-            if struct_type_name not in self.struct_types:
+            struct_type_name = type_name[7:]
+            type_def = self.struct_types.get(struct_type_name)
+            if type_def is None:
                 raise ValueError(f"Struct '{struct_type_name}' not found")
-            return self.struct_types[struct_type_name]
+            return type_def
 
         # vector<T> -> Vector{T}
-        if type_name.startswith("vector<"):
-            el_type = type_name.split("<")[1].split(">")[0]
+        if type_name.startswith("vector<") and type_name.endswith(">"):
+            el_type = type_name[7:-1]
             el_type_def = self.get_type_def(el_type)
             if el_type_def.variable_length:
                 # TODO Support variable length vectors?
@@ -256,7 +409,7 @@ class GenContext:
             return TypeDef(
                 "c",
                 type_name,
-                f"Vector{{{self.get_type_def(el_type).lang_type}}}",
+                f"Vector{{{el_type_def.lang_type}}}",
                 "",
                 -1,
                 -1,
@@ -269,237 +422,334 @@ class GenContext:
 
 
 def parse_docstring(docstring: str | List[str] | None):
-    if docstring == None or docstring == "" or docstring == []:
+    # None, "" and [] (no list is allocated for the comparison)
+    if not docstring:
         return None
     if isinstance(docstring, str):
         return [docstring]
     return docstring
 
 
-def generate_docstring(docstring: List[str], indent: int):
+def generate_docstring(code: List[str], docstring: List[str], indent: int):
     indent_str = " " * indent
-    code = ""
-    code += indent_str + '"""\n'
-    for line in docstring:
-        code += f"{indent_str}{line}\n"
-    code += indent_str + '"""\n'
-    return code
+    lines = f"\n{indent_str}".join(docstring)
+    code.append(f'{indent_str}"""\n{indent_str}{lines}\n{indent_str}"""\n')
 
 
-def generate_enum(ctx: GenContext, enum_def: EnumDef):
+def generate_enum(ctx: GenContext, enum_def: EnumDef) -> List[str]:
     print(f"Generating enum {ctx.namespace}::{enum_def.name}")
 
-    code_body = ""
+    code: List[str] = ["using EnumX\n"]
+    code.append("\n")
+    if enum_def.docstring:
+        generate_docstring(code, enum_def.docstring, 0)
+    code.append(f"@enumx {enum_def.name}::{enum_def.storage_type_def.lang_type} begin\n")
     for i, (name, member_def) in enumerate(enum_def.members.items()):
         # docstring
         if member_def.docstring:
             if i > 0:
-                code_body += "\n"
-            code_body += generate_docstring(member_def.docstring, 4)
+                code.append("\n")
+            generate_docstring(code, member_def.docstring, 4)
 
         # member
-        code_body += f"    {name} = {member_def.value}\n"
-
-    code = "using EnumX\n"
-    code += "\n"
-    if enum_def.docstring:
-        code += generate_docstring(enum_def.docstring, 0)
-    code += f"@enumx {enum_def.name}::{enum_def.storage_type_def.lang_type} begin\n"
-    code += code_body
-    code += "end\n"
-    code += "\n"
-    code += f"function from_string(::Type{{{enum_def.name}.T}}, str::T) where T <: AbstractString\n"
-    for i, (name, member_def) in enumerate(enum_def.members.items()):
-        code += f"    str == \"{name}\" && return {enum_def.name}.{name}\n"
-    code += f"    throw(ArgumentError(\"Invalid string value for enum {ctx.namespace}.{enum_def.name}: $str\"))\n"
-    code += "end\n"
+        code.append(f"    {name} = {member_def.value}\n")
+    code.append("end\n")
+    code.append("\n")
+    # hash lookup instead of comparing against every member name
+    lookup_name = f"{prefix}{enum_def.name}_from_string"
+    code.append(f"const {lookup_name} = Dict{{String, {enum_def.name}.T}}(\n")
+    for name in enum_def.members.keys():
+        code.append(f"    \"{name}\" => {enum_def.name}.{name},\n")
+    code.append(")\n")
+    code.append("\n")
+    code.append(f"function from_string(::Type{{{enum_def.name}.T}}, str::T) where T <: AbstractString\n")
+    code.append(f"    get({lookup_name}, str) do\n")
+    code.append(f"        throw(ArgumentError(\"Invalid string value for enum {ctx.namespace}.{enum_def.name}: $str\"))\n")
+    code.append("    end\n")
+    code.append("end\n")
 
     return code
 
 
-def generate_get_member_body(ctx: GenContext, member_def: StructMemberDef):
+def _get_primitive(code: List[str], ctx: GenContext, member_def: StructMemberDef):
+    # primitive, enum
+    lang_type = member_def.type_def.lang_type
+    code.append(f"    return unsafe_load(reinterpret(Ptr{{{lang_type}}}, obj.buffer + {prefix}{member_def.name}_offset(obj)))\n")
+
+
+def _get_struct(code: List[str], ctx: GenContext, member_def: StructMemberDef):
+    # struct
+    name = member_def.name
+    code.append(
+        f"    ptr::Ptr{{UInt8}} = obj.buffer + {prefix}{name}_offset(obj)\n"
+        f"    return {member_def.type_def.lang_type}(ptr, {prefix}{name}_size_aligned(obj), false)\n"
+    )
+
+
+def _get_container(code: List[str], ctx: GenContext, member_def: StructMemberDef):
+    # container with variable length (string, vector<T>)
     type_def = member_def.type_def
-    lang_type = type_def.lang_type
-
-    if type_def.category in ["e", "p"]:
-        # primitive, enum
-        code = f"    return unsafe_load(reinterpret(Ptr{{{lang_type}}}, obj.buffer + {prefix}{member_def.name}_offset(obj)))\n"
-    elif type_def.category == "s":
-        # struct
-        code = f"    ptr::Ptr{{UInt8}} = obj.buffer + {prefix}{member_def.name}_offset(obj)\n"
-        code += (
-            f"    return {lang_type}(ptr, {prefix}{member_def.name}_size_aligned(obj), false)\n"
-        )
-    elif type_def.category == "c":
-        # container with variable length (string, vector<T>)
-        el_type_def = type_def.element_type_def
-        el_type_jl = el_type_def.lang_type
-        code = f"    ptr::Ptr{{{el_type_jl}}} = reinterpret(Ptr{{{el_type_jl}}}, obj.buffer + {prefix}{member_def.name}_offset(obj))\n"
-        code += f"    unaligned_size::UInt64 = {prefix}{member_def.name}_size_unaligned(obj)\n"
-        code += f"    n_bytes::UInt64 = unaligned_size - 8\n"  # -8 to skip the size
-        if el_type_def.native_size == 1:
-            code += f"    count::UInt64 = n_bytes\n"
-        elif el_type_def.native_size == 2:
-            # >> 1 is equal to dividing by 2
-            code += f"    count::UInt64 = n_bytes >> 1\n"
-        elif el_type_def.native_size == 4:
-            # >> 2 is equal to dividing by 4
-            code += f"    count::UInt64 = n_bytes >> 2\n"
-        elif el_type_def.native_size == 8:
-            # >> 3 is equal to dividing by 8
-            code += f"    count::UInt64 = n_bytes >> 3\n"
-        else:
-            code += f"    count::UInt64 = n_bytes / {el_type_def.native_size}\n"
-        if type_def.name == "string":
-            # StringView
-            code += f"    return StringView(unsafe_wrap(Vector{{UInt8}}, ptr + 8, count, own=false))\n"  # +8 to skip the size
-        else:
-            # Vector{T}
-            code += f"    return unsafe_wrap(Vector{{{el_type_def.lang_type}}}, ptr + 8, count, own=false)\n"  # +8 to skip the size
+    name = member_def.name
+    el_type_def = type_def.element_type_def
+    el_type_jl = el_type_def.lang_type
+    code.append(
+        f"    ptr::Ptr{{{el_type_jl}}} = reinterpret(Ptr{{{el_type_jl}}}, obj.buffer + {prefix}{name}_offset(obj))\n"
+        f"    unaligned_size::UInt64 = {prefix}{name}_size_unaligned(obj)\n"
+        "    n_bytes::UInt64 = unaligned_size - 8\n"  # -8 to skip the size
+    )
+    if el_type_def.log2_size == 0:
+        code.append("    count::UInt64 = n_bytes\n")
+    elif el_type_def.log2_size is not None:
+        # >> log2(n) is equal to dividing by n
+        code.append(f"    count::UInt64 = n_bytes >> {el_type_def.log2_size}\n")
     else:
-        raise ValueError(f"Unknown type category: {type_def.category}")
+        code.append(f"    count::UInt64 = div(n_bytes, {el_type_def.native_size})\n")
+    if type_def.name == "string":
+        # StringView
+        code.append("    return StringView(unsafe_wrap(Vector{UInt8}, ptr + 8, count, own=false))\n")  # +8 to skip the size
+    else:
+        # Vector{T}
+        code.append(f"    return unsafe_wrap(Vector{{{el_type_jl}}}, ptr + 8, count, own=false)\n")  # +8 to skip the size
 
-    return code
 
+def _calc_size_aligned_primitive(code: List[str], ctx: GenContext, member_def: StructMemberDef):
+    # primitive, enum
+    code.append(f"    return {member_def.type_def.aligned_size}\n")
 
-def generate_calc_size_aligned_member_body(ctx: GenContext, struct_def: StructDef, member_def: StructMemberDef):
-    # NOTE: Must match implementation in `generate_size_member_body`
-    type_def = member_def.type_def
-    lang_type = type_def.lang_type
-
-    if type_def.category in ["p", "e"]:
-        # primitive, enum
-        code = f"    return {type_def.aligned_size}\n"
-    elif type_def.category == "c":
-        # container with variable length (string, vector<T>) and fixed element size
-        el_type_def = member_def.type_def.element_type_def
-        el_size_bytes = el_type_def.native_size
-        code = f"    contents_size::UInt64 = length(value) * {el_size_bytes}\n"
-        maybe_unaligned = el_type_def.native_size % 8 != 0
-        if maybe_unaligned:
-            # string or vector<T> with size of T not divisible of 8
-            code += f"    unaligned_size::UInt64 = 8 + contents_size\n"
-            code += f"    return (unaligned_size + 7) & ~7\n"
-        else:
-            # element size is divisible by 8, no alignment adjustment needed
-            code += f"    return 8 + contents_size\n"
-    elif type_def.category == "s":
-        # struct
-        code = f'    return binary_size(value)\n'
+
+def _contents_size_expr(el_type_def: TypeDef) -> str:
+    # number of bytes of the elements in `value`, shift instead of multiplication for powers of 2
+    if el_type_def.log2_size == 0:
+        return "length(value)"
+    if el_type_def.log2_size is not None:
+        return f"length(value) << {el_type_def.log2_size}"
+    return f"length(value) * {el_type_def.native_size}"
+
+
+def _calc_size_aligned_container(code: List[str], ctx: GenContext, member_def: StructMemberDef):
+    # container with variable length (string, vector<T>) and fixed element size
+    el_type_def = member_def.type_def.element_type_def
+    code.append(f"    contents_size::UInt64 = {_contents_size_expr(el_type_def)}\n")
+    maybe_unaligned = el_type_def.native_size % 8 != 0
+    if maybe_unaligned:
+        # string or vector<T> with size of T not divisible of 8,
+        # 8 bytes size header + 7 to round up to the next multiple of 8
+        code.append("    return (contents_size + 15) & ~7\n")
     else:
-        raise ValueError(f"Unknown type category: {type_def.category}")
+        # element size is divisible by 8, no alignment adjustment needed
+        code.append("    return 8 + contents_size\n")
 
-    return code
 
+def _calc_size_aligned_struct(code: List[str], ctx: GenContext, member_def: StructMemberDef):
+    # struct
+    code.append("    return binary_size(value)\n")
 
-def generate_set_member_body(ctx: GenContext, member_def: StructMemberDef):
-    # NOTE: Must match implementation in `generate_calc_size_aligned_member_body`
-    type_def = member_def.type_def
-    lang_type = type_def.lang_type
-
-    if type_def.category in ["p", "e"]:
-        # primitive, enum
-        code = f"    unsafe_store!(reinterpret(Ptr{{{lang_type}}}, obj.buffer + {prefix}{member_def.name}_offset(obj)), value)\n"
-    elif type_def.category == "c":
-        # container with variable length (string, vector<T>) and fixed element size
-        el_type_def = member_def.type_def.element_type_def
-        el_size_bytes = el_type_def.native_size
-        code = f"    offset::UInt64 = {prefix}{member_def.name}_offset(obj)\n"
-        code += f"    contents_size::UInt64 = length(value) * {el_size_bytes}\n"
-        maybe_unaligned = el_type_def.native_size % 8 != 0
-        if maybe_unaligned:
-            # string or vector<T> with size of T not divisible of 8
-            code += f"    unaligned_size::UInt64 = 8 + contents_size\n"
-            code += f"    aligned_size::UInt64 = (unaligned_size + 7) & ~7\n"
-            code += f"    aligned_diff::UInt64 = aligned_size - unaligned_size\n"
-            # add diff to high-bits of aligned_size
-            code += (
-                f"    aligned_size_high::UInt64 = aligned_size | (aligned_diff << 56)\n"
-            )
-            code += f"    unsafe_store!(reinterpret(Ptr{{UInt64}}, obj.buffer + offset), aligned_size_high)\n"
-        else:
-            # element size is divisible by 8, no alignment adjustment needed
-            code += f"    unsafe_store!(reinterpret(Ptr{{UInt64}}, obj.buffer + offset), 8 + contents_size)\n"
-        code += f"    dest_ptr::Ptr{{UInt8}} = obj.buffer + offset + 8\n"
-        code += f"    src_ptr::Ptr{{UInt8}} = reinterpret(Ptr{{UInt8}}, pointer(value))\n"
-        code += f"    unsafe_copyto!(dest_ptr, src_ptr, contents_size)\n"
-    elif type_def.category == "s":
-        # struct
-        code = f'    @assert binary_size(value) > 0 "Cannot set member `{member_def.name}`, parameter struct of type `{lang_type}` not finalized. Call fastbin_finalize!(obj) on struct after creation."\n'
-        code += f"    offset::UInt64 = {prefix}{member_def.name}_offset(obj)\n"
-        code += f"    size::UInt64 = binary_size(value)\n"
-        code += f"    unsafe_copyto!(obj.buffer + offset, value.buffer, size)\n"
+
+def _set_primitive(code: List[str], ctx: GenContext, member_def: StructMemberDef):
+    # primitive, enum
+    lang_type = member_def.type_def.lang_type
+    code.append(f"    unsafe_store!(reinterpret(Ptr{{{lang_type}}}, obj.buffer + {prefix}{member_def.name}_offset(obj)), value)\n")
+
+
+def _set_container(code: List[str], ctx: GenContext, member_def: StructMemberDef):
+    # container with variable length (string, vector<T>) and fixed element size
+    el_type_def = member_def.type_def.element_type_def
+    code.append(
+        f"    offset::UInt64 = {prefix}{member_def.name}_offset(obj)\n"
+        f"    contents_size::UInt64 = {_contents_size_expr(el_type_def)}\n"
+    )
+    maybe_unaligned = el_type_def.native_size % 8 != 0
+    if maybe_unaligned:
+        # string or vector<T> with size of T not divisible of 8,
+        # 8 bytes size header + 7 to round up to the next multiple of 8,
+        # add diff to high-bits of aligned_size
+        code.append(
+            "    aligned_size::UInt64 = (contents_size + 15) & ~7\n"
+            "    aligned_diff::UInt64 = aligned_size - 8 - contents_size\n"
+            "    aligned_size_high::UInt64 = aligned_size | (aligned_diff << 56)\n"
+            "    unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), aligned_size_high)\n"
+        )
     else:
-        raise ValueError(f"Unknown type category: {type_def.category}")
+        # element size is divisible by 8, no alignment adjustment needed
+        code.append("    unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), 8 + contents_size)\n")
+    code.append(
+        "    dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8\n"
+        "    src_ptr::Ptr{UInt8} = reinterpret(Ptr{UInt8}, pointer(value))\n"
+        "    unsafe_copyto!(dest_ptr, src_ptr, contents_size)\n"
+    )
 
-    return code
 
+def _set_struct(code: List[str], ctx: GenContext, member_def: StructMemberDef):
+    # struct
+    name = member_def.name
+    code.append(
+        f'    @assert binary_size(value) > 0 "Cannot set member `{name}`, parameter struct of type `{member_def.type_def.lang_type}` not finalized. Call fastbin_finalize!(obj) on struct after creation."\n'
+        f"    offset::UInt64 = {prefix}{name}_offset(obj)\n"
+        "    size::UInt64 = binary_size(value)\n"
+        "    unsafe_copyto!(obj.buffer + offset, value.buffer, size)\n"
+    )
 
-def generate_size_member_body(
-    ctx: GenContext, member_def: StructMemberDef, unaligned_size: bool
-):
-    type_def = member_def.type_def
 
-    if type_def.category in ["p", "e"]:
-        # primitives, enum
-        code = f"    return {type_def.aligned_size}\n"
-    elif type_def.category == "c":
-        # container with variable length (string, vector<T>)
-        el_type_def = type_def.element_type_def
-        code = f"    stored_size::UInt64 = unsafe_load(reinterpret(Ptr{{UInt64}}, obj.buffer + {prefix}{member_def.name}_offset(obj)))\n"
-        maybe_unaligned = el_type_def.native_size % 8 != 0
-        if maybe_unaligned:
-            # string or vector<T> with size of T not divisible of 8
-            if unaligned_size:
-                code += f"    aligned_diff::UInt64 = stored_size >> 56\n"
-                code += f"    aligned_size::UInt64 = stored_size & 0x00FFFFFFFFFFFFFF\n"  # remove 8 high-bits
-                code += f"    return aligned_size - aligned_diff\n"
-            else:
-                code += f"    aligned_size::UInt64 = stored_size & 0x00FFFFFFFFFFFFFF\n"  # remove 8 high-bits
-                code += f"    return aligned_size\n"
-        else:
-            # element size is divisible by 8, no alignment adjustment needed
-            code += f"    return stored_size\n"
-    elif type_def.category == "s":
-        # structs are always aligned to 8 bytes
-        if type_def.variable_length:
-            code = f"    return unsafe_load(reinterpret(Ptr{{UInt64}}, obj.buffer + {prefix}{member_def.name}_offset(obj)))\n"
+def _size_primitive(code: List[str], ctx: GenContext, member_def: StructMemberDef, unaligned_size: bool):
+    # primitives, enum
+    code.append(f"    return {member_def.type_def.aligned_size}\n")
+
+
+def _size_container(code: List[str], ctx: GenContext, member_def: StructMemberDef, unaligned_size: bool):
+    # container with variable length (string, vector<T>)
+    el_type_def = member_def.type_def.element_type_def
+    code.append(f"    stored_size::UInt64 = unsafe_load(reinterpret(Ptr{{UInt64}}, obj.buffer + {prefix}{member_def.name}_offset(obj)))\n")
+    maybe_unaligned = el_type_def.native_size % 8 != 0
+    if maybe_unaligned:
+        # string or vector<T> with size of T not divisible of 8,
+        # remove 8 high-bits holding the alignment diff
+        if unaligned_size:
+            code.append(
+                "    aligned_diff::UInt64 = stored_size >> 56\n"
+                "    aligned_size::UInt64 = stored_size & 0x00FFFFFFFFFFFFFF\n"
+                "    return aligned_size - aligned_diff\n"
+            )
         else:
-            code = f"    return {type_def.aligned_size}\n"
+            code.append(
+                "    aligned_size::UInt64 = stored_size & 0x00FFFFFFFFFFFFFF\n"
+                "    return aligned_size\n"
+            )
     else:
-        raise ValueError(f"Unknown type category: {type_def.category}")
+        # element size is divisible by 8, no alignment adjustment needed
+        code.append("    return stored_size\n")
 
-    return code
+
+def _size_struct(code: List[str], ctx: GenContext, member_def: StructMemberDef, unaligned_size: bool):
+    # structs are always aligned to 8 bytes
+    type_def = member_def.type_def
+    if type_def.variable_length:
+        code.append(f"    return unsafe_load(reinterpret(Ptr{{UInt64}}, obj.buffer + {prefix}{member_def.name}_offset(obj)))\n")
+    else:
+        code.append(f"    return {type_def.aligned_size}\n")
+
+
+# member body generators by type category
+_GET_HANDLERS: Dict[str, Callable[[List[str], GenContext, StructMemberDef], None]] = {
+    "e": _get_primitive,
+    "p": _get_primitive,
+    "s": _get_struct,
+    "c": _get_container,
+}
+_CALC_SIZE_ALIGNED_HANDLERS: Dict[str, Callable[[List[str], GenContext, StructMemberDef], None]] = {
+    "e": _calc_size_aligned_primitive,
+    "p": _calc_size_aligned_primitive,
+    "s": _calc_size_aligned_struct,
+    "c": _calc_size_aligned_container,
+}
+_SET_HANDLERS: Dict[str, Callable[[List[str], GenContext, StructMemberDef], None]] = {
+    "e": _set_primitive,
+    "p": _set_primitive,
+    "s": _set_struct,
+    "c": _set_container,
+}
+_SIZE_HANDLERS: Dict[str, Callable[[List[str], GenContext, StructMemberDef, bool], None]] = {
+    "e": _size_primitive,
+    "p": _size_primitive,
+    "s": _size_struct,
+    "c": _size_container,
+}
+
+
+def _cached_member_body(
+    code: List[str],
+    ctx: GenContext,
+    cache_key: Tuple[str, int, bool],
+    member_def: StructMemberDef,
+    generate: Callable[[List[str], StructMemberDef], None],
+):
+    # member bodies only depend on the type and the member name, so they are generated
+    # once per type with a placeholder name, which is then replaced by the actual name
+    template = ctx._body_cache.get(cache_key)
+    if template is None:
+        parts: List[str] = []
+        generate(parts, StructMemberDef(_MEMBER_NAME, member_def.type_def))
+        template = "".join(parts)
+        ctx._body_cache[cache_key] = template
+    code.append(template.replace(_MEMBER_NAME, member_def.name))
+
+
+def generate_get_member_body(code: List[str], ctx: GenContext, member_def: StructMemberDef):
+    handler = _GET_HANDLERS.get(member_def.type_def.category)
+    if handler is None:
+        raise ValueError(f"Unknown type category: {member_def.type_def.category}")
+    cache_key = ("get", id(member_def.type_def), False)
+    _cached_member_body(code, ctx, cache_key, member_def, lambda c, m: handler(c, ctx, m))
+
+
+def generate_calc_size_aligned_member_body(code: List[str], ctx: GenContext, struct_def: StructDef, member_def: StructMemberDef):
+    # NOTE: Must match implementation in `generate_size_member_body`
+    handler = _CALC_SIZE_ALIGNED_HANDLERS.get(member_def.type_def.category)
+    if handler is None:
+        raise ValueError(f"Unknown type category: {member_def.type_def.category}")
+    cache_key = ("calc_size_aligned", id(member_def.type_def), False)
+    _cached_member_body(code, ctx, cache_key, member_def, lambda c, m: handler(c, ctx, m))
 
 
-def generate_offset_member_body(
-    ctx: GenContext, index: int, struct_def: StructDef, member_def: StructMemberDef
+def generate_set_member_body(code: List[str], ctx: GenContext, member_def: StructMemberDef):
+    # NOTE: Must match implementation in `generate_calc_size_aligned_member_body`
+    handler = _SET_HANDLERS.get(member_def.type_def.category)
+    if handler is None:
+        raise ValueError(f"Unknown type category: {member_def.type_def.category}")
+    cache_key = ("set", id(member_def.type_def), False)
+    _cached_member_body(code, ctx, cache_key, member_def, lambda c, m: handler(c, ctx, m))
+
+
+def generate_size_member_body(
+    code: List[str], ctx: GenContext, member_def: StructMemberDef, unaligned_size: bool
 ):
-    member_names = list(struct_def.members.keys())
+    handler = _SIZE_HANDLERS.get(member_def.type_def.category)
+    if handler is None:
+        raise ValueError(f"Unknown type category: {member_def.type_def.category}")
+    cache_key = ("size", id(member_def.type_def), unaligned_size)
+    _cached_member_body(
+        code, ctx, cache_key, member_def, lambda c, m: handler(c, ctx, m, unaligned_size)
+    )
+
+
+def calc_member_offsets(struct_def: StructDef) -> List[Optional[int]]:
+    # byte offset of each member, None if located after a variable-length member
+    offsets: List[Optional[int]] = []
     if struct_def.type_def.variable_length:
         # first 8 bytes are reserved for the size of the variable-length struct
-        offset = 8
+        offset: Optional[int] = 8
     else:
         # fixed-length struct
         offset = 0
-    for (i, prev_member) in enumerate(struct_def.members.values()):
-        if i < index:
-            if prev_member.type_def.variable_length:
-                # cannot precompute fixed offset, variable length member found
-                offset = -1
-                break
+    for member_def in struct_def.members.values():
+        if offset is not None:
+            offset = align_up(offset, member_alignment(member_def.type_def))
+        offsets.append(offset)
+        if offset is not None:
+            if member_def.type_def.variable_length:
+                # cannot precompute fixed offsets after a variable length member
+                offset = None
             else:
                 # fixed-length members only take up their aligned size space
-                offset += prev_member.type_def.aligned_size
-    if offset == -1:
+                offset += member_def.type_def.aligned_size
+    return offsets
+
+
+def generate_offset_member_body(
+    code: List[str], ctx: GenContext, offset: Optional[int], prev_member_name: Optional[str], alignment: int = 1
+):
+    if offset is None:
         # variable length member found, cannot precompute offset
-        code_body = f"    return {prefix}{member_names[index-1]}_offset(obj) + {prefix}{member_names[index-1]}_size_aligned(obj)\n"
+        end = f"{prefix}{prev_member_name}_offset(obj) + {prefix}{prev_member_name}_size_aligned(obj)"
+        if alignment > 1:
+            # previous (packed) member may end before the required alignment of this member
+            code.append(f"    return ({end} + {alignment - 1}) & ~UInt64({alignment - 1})\n")
+        else:
+            code.append(f"    return {end}\n")
     else:
-        code_body = f"    return {offset}\n"
-    return code_body
+        code.append(f"    return {offset}\n")
 
 
-def generate_struct(ctx: GenContext, struct_def: StructDef):
+def generate_struct(ctx: GenContext, struct_def: StructDef) -> List[str]:
     print(f"Generating struct {ctx.namespace}::{struct_def.name}", end=" ")
     if struct_def.type_def.variable_length:
         print(f"[size=variable]")
@@ -508,7 +758,7 @@ def generate_struct(ctx: GenContext, struct_def: StructDef):
     for name, member_def in struct_def.members.items():
         print(f"- {name}: {member_def.type_def.lang_type}")
     
-    member_names = list(name for name, _ in struct_def.members.items())
+    member_names = struct_def.member_names
 
     if len(member_names) == 0:
         raise ValueError(
@@ -516,272 +766,379 @@ def generate_struct(ctx: GenContext, struct_def: StructDef):
         )
 
     # generate member functions (get, set, size, offset)
-    code_body = ""
+    offsets = calc_member_offsets(struct_def)
+    code_body: List[str] = []
     for i, (name, member_def) in enumerate(struct_def.members.items()):
-        code_body += f"\n# Member: {name}::{member_def.type_def.lang_type}\n"
+        code_body.append(f"\n# Member: {name}::{member_def.type_def.lang_type}\n")
         type_def = member_def.type_def
         
         # getter
-        code_body += (
+        code_body.append(
             f"\n@inline function {name}(obj::{struct_def.name})::{type_def.lang_type}\n"
         )
-        code_body += generate_get_member_body(ctx, member_def)
-        code_body += "end\n"
-        code_body += "\n"
+        generate_get_member_body(code_body, ctx, member_def)
+        code_body.append("end\n")
+        code_body.append("\n")
         
         # setter
         if type_def.lang_type == "StringView":
-            code_body += f"@inline function {name}!(obj::{struct_def.name}, value::T) where {{T<:AbstractString}}\n"
+            code_body.append(f"@inline function {name}!(obj::{struct_def.name}, value::T) where {{T<:AbstractString}}\n")
         else:
-            code_body += f"@inline function {name}!(obj::{struct_def.name}, value::{type_def.lang_type})\n"
-        code_body += generate_set_member_body(ctx, member_def)
-        code_body += "end\n"
-        code_body += "\n"
+            code_body.append(f"@inline function {name}!(obj::{struct_def.name}, value::{type_def.lang_type})\n")
+        generate_set_member_body(code_body, ctx, member_def)
+        code_body.append("end\n")
+        code_body.append("\n")
         
         # offset
-        code_body += (
+        code_body.append(
             f"@inline function {prefix}{name}_offset(obj::{struct_def.name})::UInt64\n"
         )
-        code_body += generate_offset_member_body(ctx, i, struct_def, member_def)
-        code_body += "end\n"
-        code_body += "\n"
+        prev_member_name = member_names[i - 1] if i > 0 else None
+        alignment = 1
+        if prev_member_name is not None:
+            alignment = member_alignment(type_def)
+            if alignment <= member_alignment(struct_def.members[prev_member_name].type_def):
+                alignment = 1
+        generate_offset_member_body(code_body, ctx, offsets[i], prev_member_name, alignment)
+        code_body.append("end\n")
+        code_body.append("\n")
         
         # size aligned
-        code_body += (
+        code_body.append(
             f"@inline function {prefix}{name}_size_aligned(obj::{struct_def.name})::UInt64\n"
         )
-        code_body += generate_size_member_body(ctx, member_def, False)
-        code_body += "end\n"
-        code_body += "\n"
+        generate_size_member_body(code_body, ctx, member_def, False)
+        code_body.append("end\n")
+        code_body.append("\n")
             
         # calc size aligned
         if type_def.lang_type == "StringView":
-            code_body += f"@inline function {prefix}{name}_calc_size_aligned(::Type{{{struct_def.name}}}, value::T)::UInt64 where {{T<:AbstractString}}\n"
+            code_body.append(f"@inline function {prefix}{name}_calc_size_aligned(::Type{{{struct_def.name}}}, value::T)::UInt64 where {{T<:AbstractString}}\n")
         else:
-            code_body += f"@inline function {prefix}{name}_calc_size_aligned(::Type{{{struct_def.name}}}, value::{type_def.lang_type})::UInt64\n"
-        code_body += generate_calc_size_aligned_member_body(ctx, struct_def, member_def)
-        code_body += "end\n"
-        code_body += "\n"
+            code_body.append(f"@inline function {prefix}{name}_calc_size_aligned(::Type{{{struct_def.name}}}, value::{type_def.lang_type})::UInt64\n")
+        generate_calc_size_aligned_member_body(code_body, ctx, struct_def, member_def)
+        code_body.append("end\n")
+        code_body.append("\n")
         
         # size unaligned
         if type_def.category == "c":
-            code_body += f"@inline function {prefix}{name}_size_unaligned(obj::{struct_def.name})::UInt64\n"
-            code_body += generate_size_member_body(ctx, member_def, True)
-            code_body += "end\n"
+            code_body.append(f"@inline function {prefix}{name}_size_unaligned(obj::{struct_def.name})::UInt64\n")
+            generate_size_member_body(code_body, ctx, member_def, True)
+            code_body.append("end\n")
         
-    code_body += "\n# --------------------------------------------------------------------\n"
+    code_body.append("\n# --------------------------------------------------------------------\n")
     
-    code = "import Base.show\n"
-    code += "import Base.finalizer\n"
-    includes = [
-        m.type_def.include_stmt
-        for m in struct_def.members.values()
-        if m.type_def.include_stmt != ""
-    ]
-    for include in list(dict.fromkeys(includes)):  # remove duplicates
-        code += f"{include}\n"
-    code += "\n"
-    code += '"""\n'
+    code: List[str] = ["import Base.show\n"]
+    code.append("import Base.finalizer\n")
+    for include in struct_def.includes:
+        code.append(f"{include}\n")
+    code.append("\n")
+    code.append('"""\n')
     if struct_def.docstring:
         for line in struct_def.docstring:
-            code += f"{line}\n"
-        code += f"\n"
-        code += f"{'-'*60}\n"
-        code += f"\n"
+            code.append(f"{line}\n")
+        code.append(f"\n")
+        code.append(f"{'-'*60}\n")
+        code.append(f"\n")
 
-    code += "Binary serializable data container generated by `fastbin`.\n"
-    code += "\n"
+    code.append("Binary serializable data container generated by `fastbin`.\n")
+    code.append("\n")
     if struct_def.type_def.variable_length:
-        code += "This container has variable size.\n"
-        code += "All setter methods starting from the first variable-sized member and afterwards MUST be called in order.\n\n"
-        code += "Members in order\n"
-        code += "================\n"
+        code.append("This container has variable size.\n")
+        code.append("All setter methods starting from the first variable-sized member and afterwards MUST be called in order.\n\n")
+        code.append("Members in order\n")
+        code.append("================\n")
         for i, (name, member_def) in enumerate(struct_def.members.items()):
             name_type = '`' + name + "::" + member_def.type_def.lang_type + '`'
-            code += f"- {name_type.ljust(24)} ({'variable' if member_def.type_def.variable_length else 'fixed'})\n"
-        code += "\n"
+            code.append(f"- {name_type.ljust(24)} ({'variable' if member_def.type_def.variable_length else 'fixed'})\n")
+        code.append("\n")
     else:
-        code += f"This container has fixed size of {struct_def.type_def.aligned_size} bytes.\n"
-        code += "\n"
-    code += "The `fastbin_finalize!()` method MUST be called after all setter methods have been called.\n"
-    code += "\n"
-    code += "It is the responsibility of the caller to ensure that the buffer is\n"
-    code += "large enough to hold all data.\n"
-    code += '"""\n'
-    code += f"mutable struct {struct_def.name}\n"
-    code += "    buffer::Ptr{UInt8}\n"
-    code += "    buffer_size::UInt64\n"
-    code += "    owns_buffer::Bool\n"
-
-    # constructor
-    code += "\n"
-    code += f"    function {struct_def.name}(buffer::Ptr{{UInt8}}, buffer_size::UInt64, owns_buffer::Bool)\n"
-    code += "        new(buffer, buffer_size, owns_buffer)\n"
-    code += "    end\n"
-    code += "\n"
-    code += f"    function {struct_def.name}(buffer_size::Integer)\n"
-    code += "        buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))\n"
-    code += "        new(buffer, buffer_size, true)\n"
-    code += "    end\n"
-
-    code += "end\n"
-
-    # finalizer (called by garbage collector)
-    code += "\n"
-    code += f"function Base.finalizer(obj::{struct_def.name})\n"
-    code += "    if obj.owns_buffer && obj.buffer != C_NULL\n"
-    code += "        Base.Libc.free(obj.buffer)\n"
-    code += "        obj.buffer = C_NULL\n"
-    code += "    end\n"
-    code += "    nothing\n"
-    code += "end\n"
+        code.append(f"This container has fixed size of {struct_def.type_def.aligned_size} bytes.\n")
+        code.append("\n")
+    code.append(_STRUCT_DOCSTRING_FOOTER)
+    # only the size header must be defined before finalizing, setters write everything else
+    init_size_header = ""
+    if struct_def.type_def.variable_length:
+        init_size_header = "        unsafe_store!(reinterpret(Ptr{UInt64}, buffer), UInt64(0))\n"
+    code.append(
+        _STRUCT_SKELETON.substitute(name=struct_def.name, init_size_header=init_size_header)
+    )
 
     # member functions
-    code += code_body
+    code.extend(code_body)
 
     # binary size calculated
-    code += "\n"
-    code += f"@inline function fastbin_calc_binary_size(obj::{struct_def.name})::UInt64\n"
+    code.append("\n")
+    code.append(f"@inline function fastbin_calc_binary_size(obj::{struct_def.name})::UInt64\n")
     if struct_def.type_def.variable_length:
-        code += f"    return {prefix}{member_names[-1]}_offset(obj) + {prefix}{member_names[-1]}_size_aligned(obj)\n"
+        end = f"{prefix}{member_names[-1]}_offset(obj) + {prefix}{member_names[-1]}_size_aligned(obj)"
+        if member_alignment(struct_def.members[member_names[-1]].type_def) < 8:
+            # structs are always a multiple of 8 bytes, last (packed) member may end before
+            code.append(f"    return ({end} + 7) & ~UInt64(7)\n")
+        else:
+            code.append(f"    return {end}\n")
     else:
-        code += f"    return {struct_def.type_def.aligned_size}\n"
-    code += "end\n"
+        code.append(f"    return {struct_def.type_def.aligned_size}\n")
+    code.append("end\n")
 
     # binary size estimation helper
     if not struct_def.type_def.variable_length:
         # fixed size
-        code += "\n"
-        code += f"@inline function fastbin_calc_binary_size(::Type{{{struct_def.name}}})\n"
-        code += f"    {struct_def.type_def.aligned_size}\n"
-        code += "end\n"
+        code.append("\n")
+        code.append(f"@inline function fastbin_calc_binary_size(::Type{{{struct_def.name}}})\n")
+        code.append(f"    {struct_def.type_def.aligned_size}\n")
+        code.append("end\n")
     else:
         # variable length.
         # calculate size based on the fixed size + the size of all variable-length members
-        var_members = [(k,v) for (k,v) in struct_def.members.items() if v.type_def.variable_length]
-        fixed_members = [(k,v) for (k,v) in struct_def.members.items() if not v.type_def.variable_length]
-        code += "\n"
-        code += f"@inline function fastbin_calc_binary_size(::Type{{{struct_def.name}}}"
-        fixed_size = 8 + sum([v.type_def.aligned_size for (_,v) in fixed_members])
+        # (these start at and span multiples of 8 bytes, so padding does not depend on their size)
+        var_members: List[Tuple[str, StructMemberDef]] = []
+        fixed_size = 8
+        for (k, v) in struct_def.members.items():
+            fixed_size = align_up(fixed_size, member_alignment(v.type_def))
+            if v.type_def.variable_length:
+                var_members.append((k, v))
+            else:
+                fixed_size += v.type_def.aligned_size
+        fixed_size = align_up(fixed_size, 8)
+        code.append("\n")
+        code.append(f"@inline function fastbin_calc_binary_size(::Type{{{struct_def.name}}}")
         for (name, member_def) in var_members:
-            code += f",\n    {member_def.name}::{member_def.type_def.lang_type}"
-        code += "\n)\n"
-        code += f"    return {fixed_size} +\n"
-        code += "        " + ' +\n        '.join([f'{prefix}{name}_calc_size_aligned({struct_def.name}, {name})' for name, _ in var_members])
-        code += "\n"
-        code += "end\n"
+            code.append(f",\n    {member_def.name}::{member_def.type_def.lang_type}")
+        code.append("\n)\n")
+        code.append(f"    return {fixed_size} +\n")
+        code.append("        " + ' +\n        '.join([f'{prefix}{name}_calc_size_aligned({struct_def.name}, {name})' for name, _ in var_members]))
+        code.append("\n")
+        code.append("end\n")
 
     # binary size
-    code += "\n"
-    code += '"""\n'
-    code += 'Returns the stored (aligned) binary size of the object.\n'
-    code += 'This function should only be called after `fastbin_finalize!(obj)`.\n'
-    code += '"""\n'
-    code += f"@inline function fastbin_binary_size(obj::{struct_def.name})::UInt64\n"
+    code.append("\n")
+    code.append('"""\n')
+    code.append('Returns the stored (aligned) binary size of the object.\n')
+    code.append('This function should only be called after `fastbin_finalize!(obj)`.\n')
+    code.append('"""\n')
+    code.append(f"@inline function fastbin_binary_size(obj::{struct_def.name})::UInt64\n")
     if struct_def.type_def.variable_length:
-        code += f"    return unsafe_load(reinterpret(Ptr{{UInt64}}, obj.buffer))\n"
+        code.append(f"    return unsafe_load(reinterpret(Ptr{{UInt64}}, obj.buffer))\n")
     else:
-        code += f"    return {struct_def.type_def.aligned_size}\n"
-    code += "end\n"
+        code.append(f"    return {struct_def.type_def.aligned_size}\n")
+    code.append("end\n")
 
     # finalize (write the struct's binary size to the first 8 bytes)
-    code += "\n"
-    code += '"""\n'
-    code += 'Finalizes the object by writing the binary size to the beginning of its buffer.\n'
-    code += 'After calling this function, the underlying buffer can be used for serialization.\n'
-    code += 'To get the actual buffer size, call `fastbin_binary_size(obj)`.\n'
-    code += '"""\n'
-    code += f"@inline function fastbin_finalize!(obj::{struct_def.name})\n"
+    code.append("\n")
+    code.append('"""\n')
+    code.append('Finalizes the object by writing the binary size to the beginning of its buffer.\n')
+    code.append('After calling this function, the underlying buffer can be used for serialization.\n')
+    code.append('To get the actual buffer size, call `fastbin_binary_size(obj)`.\n')
+    code.append('"""\n')
+    code.append(f"@inline function fastbin_finalize!(obj::{struct_def.name})\n")
     if struct_def.type_def.variable_length:
-        code += "    unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer), fastbin_calc_binary_size(obj))\n"
-        code += "    nothing\n"
-    code += "end\n"
+        code.append("    unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer), fastbin_calc_binary_size(obj))\n")
+        code.append("    nothing\n")
+    code.append("end\n")
 
     # override Base.show
-    code += "\n"
-    code += f"function show(io::IO, obj::{struct_def.name})\n"
-    code += f'    print(io, "[{ctx.namespace}::{struct_def.name}]")\n'
-    for i, (name, member_def) in enumerate(struct_def.members.items()):
-        code += f'    print(io, "\\n    {name}: ")\n'
+    code.append("\n")
+    code.append(f"function show(io::IO, obj::{struct_def.name})\n")
+    # literal text is written directly, merged with the header/previous line break
+    literal = f"[{ctx.namespace}::{struct_def.name}]"
+    for name, member_def in struct_def.members.items():
+        code.append(f'    write(io, "{literal}\\n    {name}: ")\n')
+        literal = ""
         if member_def.type_def.use_print:
-            code += f"    print(io, {member_def.name}(obj))\n"
+            code.append(f"    print(io, {member_def.name}(obj))\n")
         else:
-            code += f"    show(io, {member_def.name}(obj))\n"
-    code += f"    println(io)\n"
-    code += "end\n"
+            code.append(f"    show(io, {member_def.name}(obj))\n")
+    code.append('    write(io, "\\n")\n')
+    code.append("    nothing\n")
+    code.append("end\n")
 
     return code
 
 
+@contextmanager
+def open_output(path: str, buffering: int = -1) -> Iterator[TextIO]:
+    # written to a temporary file first and moved into place once complete,
+    # so readers (and interrupted runs) never see partially written files
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", buffering=buffering) as file:
+            yield file
+        if os.path.exists(path) and filecmp.cmp(tmp_path, path, shallow=False):
+            # keep unchanged files untouched, so their mtime does not trigger rebuilds
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def generate_single_include_file(output_dir: str, ctx: GenContext):
-    code = f"module {ctx.namespace}\n\n"
+    code: List[str] = [f"module {ctx.namespace}\n\n"]
 
     for enum_name in ctx.enums.keys():
-        code += f'include("{enum_name}.jl")\n'
+        code.append(f'include("{enum_name}.jl")\n')
 
-    code += "\n"
+    code.append("\n")
 
     for struct_name in ctx.structs.keys():
-        code += f'include("{struct_name}.jl")\n'
+        code.append(f'include("{struct_name}.jl")\n')
 
-    code += "\n"
+    code.append("\n")
 
     # export all
-    code += f"# export all types and functions\n"
-    code += f"for n in names(@__MODULE__; all=true)\n"
-    code += (
+    code.append(f"# export all types and functions\n")
+    code.append(f"for n in names(@__MODULE__; all=true)\n")
+    code.append(
         f"    if Base.isidentifier(n) && n ∉ (Symbol(@__MODULE__), :eval, :include)\n"
     )
-    # code += f'        println("Exporting: $n")\n'
-    code += f"        @eval export $n\n"
-    code += f"    end\n"
-    code += f"end\n\n"
+    # code.append(f'        println("Exporting: $n")\n')
+    code.append(f"        @eval export $n\n")
+    code.append(f"    end\n")
+    code.append(f"end\n\n")
 
     # # export all enums
     # if len(ctx.enums) > 0:
-    #     code += f'export {", ".join(ctx.enums.keys())}\n\n'
+    #     code.append(f'export {", ".join(ctx.enums.keys())}\n\n')
 
     # # export all structs
     # if len(ctx.structs) > 0:
-    #     code += f'export {", ".join(ctx.structs.keys())}\n\n'
+    #     code.append(f'export {", ".join(ctx.structs.keys())}\n\n')
 
-    code += "end\n"
+    code.append("end\n")
 
-    with open(f"{output_dir}/models.jl", "w") as file:
-        file.write(code)
+    with open_output(f"{output_dir}/models.jl") as file:
+        file.write("".join(code))
 
 
-def generate_jl_code(schema_file, output_dir: str):
-    with open(schema_file, "r") as file:
-        schema = json.load(file)
+def generate_type_file(ctx: GenContext, category: str, name: str, path: str):
+    if category == "e":
+        fragments = generate_enum(ctx, ctx.enums[name])
+    else:
+        fragments = generate_struct(ctx, ctx.structs[name])
 
-    ctx = GenContext(schema)
+    # write fragments to file without joining them first
+    with open_output(path, buffering=1 << 16) as file:
+        file.writelines(fragments)
 
-    os.makedirs(output_dir, exist_ok=True)
 
-    for enum_name, enum_def in ctx.enums.items():
-        jl_code = generate_enum(ctx, enum_def)
+# generation context of a pool worker process, built once per process by init_worker
+_worker_ctx: Optional[GenContext] = None
+
+
+def init_worker(schema: dict):
+    # workers rebuild the context from the plain schema instead of receiving it pickled with every job
+    global _worker_ctx
+    _worker_ctx = GenContext(schema)
+
+
+def generate_type_file_in_worker(category: str, name: str, path: str):
+    assert _worker_ctx is not None
+    generate_type_file(_worker_ctx, category, name, path)
+
+
+def calc_generation_digest(schema_bytes: bytes) -> str:
+    # output depends on the schema and the generator itself
+    digest = hashlib.sha256(schema_bytes)
+    with open(__file__, "rb") as file:
+        digest.update(file.read())
+    return digest.hexdigest()
+
+
+def calc_file_hash(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
 
-        # write to file
-        with open(f"{output_dir}/{enum_name}.jl", "w") as file:
-            file.write(jl_code)
+def is_generation_up_to_date(output_dir: str, digest: str) -> bool:
+    # cache file holds the generation digest followed by "<sha256> <file>" of every output
+    # file, so deleted or hand-edited outputs are regenerated even if the digest matches
+    try:
+        with open(f"{output_dir}/{CACHE_FILE_NAME}", "r") as file:
+            lines = file.read().splitlines()
+    except FileNotFoundError:
+        return False
+    if len(lines) < 2 or lines[0] != digest:
+        return False
+    for line in lines[1:]:
+        file_hash, _, file_name = line.partition(" ")
+        path = f"{output_dir}/{file_name}"
+        if not os.path.exists(path) or calc_file_hash(path) != file_hash:
+            return False
+    return True
 
-    for struct_name, struct_def in ctx.structs.items():
-        jl_code = generate_struct(ctx, struct_def)
 
-        # write to file
-        with open(f"{output_dir}/{struct_name}.jl", "w") as file:
-            file.write(jl_code)
+def write_generation_cache(output_dir: str, digest: str, file_names: List[str]) -> None:
+    lines = [digest]
+    for file_name in file_names:
+        lines.append(f"{calc_file_hash(f'{output_dir}/{file_name}')} {file_name}")
+    with open_output(f"{output_dir}/{CACHE_FILE_NAME}") as file:
+        file.write("\n".join(lines) + "\n")
+
+
+def generate_jl_code(
+    schema_file,
+    output_dir: str,
+    parallel_min_types: int = PARALLEL_MIN_TYPES,
+    force: bool = False,
+):
+    with open(schema_file, "rb") as file:
+        schema_bytes = file.read()
+
+    # skip generation if neither schema, generator nor generated files changed since the last run
+    digest = calc_generation_digest(schema_bytes)
+    if not force and is_generation_up_to_date(output_dir, digest):
+        print(f"Generated code in {output_dir} is up to date")
+        return
+
+    schema = json_loads(schema_bytes)
+
+    ctx = GenContext(schema)
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    # every enum/struct is written to its own file, independent of all others
+    jobs = [("e", name, f"{output_dir}/{name}.jl") for name in ctx.enums.keys()]
+    jobs += [("s", name, f"{output_dir}/{name}.jl") for name in ctx.structs.keys()]
+
+    if len(jobs) < parallel_min_types:
+        for category, name, path in jobs:
+            generate_type_file(ctx, category, name, path)
+    else:
+        n_workers = os.cpu_count() or 1
+        chunksize = max(1, len(jobs) // (4 * n_workers))
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=init_worker, initargs=(schema,)
+        ) as executor:
+            categories, names, paths = zip(*jobs)
+            results = executor.map(
+                generate_type_file_in_worker,
+                categories,
+                names,
+                paths,
+                chunksize=chunksize,
+            )
+            list(results)  # propagate exceptions of workers
 
     # single include header file
     generate_single_include_file(output_dir, ctx)
 
+    # written last, so an interrupted run is not considered up to date
+    file_names = [os.path.basename(path) for _, _, path in jobs]
+    file_names.append("models.jl")
+    write_generation_cache(output_dir, digest, file_names)
+
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python fastbin_jl.py <schema.json> <output_dir>")
+    # --force regenerates all files, even if the generated code is up to date
+    force = "--force" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--force"]
+    if len(args) != 2:
+        print("Usage: python fastbin_jl.py [--force] <schema.json> <output_dir>")
         sys.exit(1)
 
-    schema_file = sys.argv[1]
-    output_dir = sys.argv[2]
-    generate_jl_code(schema_file, output_dir)
+    schema_file = args[0]
+    output_dir = args[1]
+    generate_jl_code(schema_file, output_dir, force=force)
@@ -1,3 +1,4 @@
 #!/bin/sh
 
 python3 fastbin_jl.py ../schema.json generated
+python3 fastbin_jl.py ../schema_packed.json generated_packed
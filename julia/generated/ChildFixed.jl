@@ -107,10 +107,10 @@ To get the actual buffer size, call `fastbin_binary_size(obj)`.
 end
 
 function show(io::IO, obj::ChildFixed)
-    print(io, "[my_models::ChildFixed]")
-    print(io, "\n    field1: ")
+    write(io, "[my_models::ChildFixed]\n    field1: ")
     print(io, field1(obj))
-    print(io, "\n    field2: ")
+    write(io, "\n    field2: ")
     print(io, field2(obj))
-    println(io)
+    write(io, "\n")
+    nothing
 end
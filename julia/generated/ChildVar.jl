@@ -29,6 +29,7 @@ mutable struct ChildVar
 
     function ChildVar(buffer_size::Integer)
         buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
+        unsafe_store!(reinterpret(Ptr{UInt64}, buffer), UInt64(0))
         new(buffer, buffer_size, true)
     end
 end
@@ -76,10 +77,9 @@ end
 
 @inline function field2!(obj::ChildVar, value::T) where {T<:AbstractString}
     offset::UInt64 = _field2_offset(obj)
-    contents_size::UInt64 = length(value) * 1
-    unaligned_size::UInt64 = 8 + contents_size
-    aligned_size::UInt64 = (unaligned_size + 7) & ~7
-    aligned_diff::UInt64 = aligned_size - unaligned_size
+    contents_size::UInt64 = length(value)
+    aligned_size::UInt64 = (contents_size + 15) & ~7
+    aligned_diff::UInt64 = aligned_size - 8 - contents_size
     aligned_size_high::UInt64 = aligned_size | (aligned_diff << 56)
     unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), aligned_size_high)
     dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
@@ -98,9 +98,8 @@ end
 end
 
 @inline function _field2_calc_size_aligned(::Type{ChildVar}, value::T)::UInt64 where {T<:AbstractString}
-    contents_size::UInt64 = length(value) * 1
-    unaligned_size::UInt64 = 8 + contents_size
-    return (unaligned_size + 7) & ~7
+    contents_size::UInt64 = length(value)
+    return (contents_size + 15) & ~7
 end
 
 @inline function _field2_size_unaligned(obj::ChildVar)::UInt64
@@ -142,10 +141,10 @@ To get the actual buffer size, call `fastbin_binary_size(obj)`.
 end
 
 function show(io::IO, obj::ChildVar)
-    print(io, "[my_models::ChildVar]")
-    print(io, "\n    field1: ")
+    write(io, "[my_models::ChildVar]\n    field1: ")
     print(io, field1(obj))
-    print(io, "\n    field2: ")
+    write(io, "\n    field2: ")
     print(io, field2(obj))
-    println(io)
+    write(io, "\n")
+    nothing
 end
@@ -0,0 +1,149 @@
+import Base.show
+import Base.finalizer
+
+"""
+Binary serializable data container generated by `fastbin`.
+
+This container has variable size.
+All setter methods starting from the first variable-sized member and afterwards MUST be called in order.
+
+Members in order
+================
+- `values::Vector{Float32}` (variable)
+- `count::UInt32`          (fixed)
+
+The `fastbin_finalize!()` method MUST be called after all setter methods have been called.
+
+It is the responsibility of the caller to ensure that the buffer is
+large enough to hold all data.
+"""
+mutable struct Float32Vector
+    buffer::Ptr{UInt8}
+    buffer_size::UInt64
+    owns_buffer::Bool
+
+    function Float32Vector(buffer::Ptr{UInt8}, buffer_size::UInt64, owns_buffer::Bool)
+        new(buffer, buffer_size, owns_buffer)
+    end
+
+    function Float32Vector(buffer_size::Integer)
+        buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
+        unsafe_store!(reinterpret(Ptr{UInt64}, buffer), UInt64(0))
+        new(buffer, buffer_size, true)
+    end
+end
+
+function Base.finalizer(obj::Float32Vector)
+    if obj.owns_buffer && obj.buffer != C_NULL
+        Base.Libc.free(obj.buffer)
+        obj.buffer = C_NULL
+    end
+    nothing
+end
+
+# Member: values::Vector{Float32}
+
+@inline function values(obj::Float32Vector)::Vector{Float32}
+    ptr::Ptr{Float32} = reinterpret(Ptr{Float32}, obj.buffer + _values_offset(obj))
+    unaligned_size::UInt64 = _values_size_unaligned(obj)
+    n_bytes::UInt64 = unaligned_size - 8
+    count::UInt64 = n_bytes >> 2
+    return unsafe_wrap(Vector{Float32}, ptr + 8, count, own=false)
+end
+
+@inline function values!(obj::Float32Vector, value::Vector{Float32})
+    offset::UInt64 = _values_offset(obj)
+    contents_size::UInt64 = length(value) << 2
+    aligned_size::UInt64 = (contents_size + 15) & ~7
+    aligned_diff::UInt64 = aligned_size - 8 - contents_size
+    aligned_size_high::UInt64 = aligned_size | (aligned_diff << 56)
+    unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), aligned_size_high)
+    dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
+    src_ptr::Ptr{UInt8} = reinterpret(Ptr{UInt8}, pointer(value))
+    unsafe_copyto!(dest_ptr, src_ptr, contents_size)
+end
+
+@inline function _values_offset(obj::Float32Vector)::UInt64
+    return 8
+end
+
+@inline function _values_size_aligned(obj::Float32Vector)::UInt64
+    stored_size::UInt64 = unsafe_load(reinterpret(Ptr{UInt64}, obj.buffer + _values_offset(obj)))
+    aligned_size::UInt64 = stored_size & 0x00FFFFFFFFFFFFFF
+    return aligned_size
+end
+
+@inline function _values_calc_size_aligned(::Type{Float32Vector}, value::Vector{Float32})::UInt64
+    contents_size::UInt64 = length(value) << 2
+    return (contents_size + 15) & ~7
+end
+
+@inline function _values_size_unaligned(obj::Float32Vector)::UInt64
+    stored_size::UInt64 = unsafe_load(reinterpret(Ptr{UInt64}, obj.buffer + _values_offset(obj)))
+    aligned_diff::UInt64 = stored_size >> 56
+    aligned_size::UInt64 = stored_size & 0x00FFFFFFFFFFFFFF
+    return aligned_size - aligned_diff
+end
+
+# Member: count::UInt32
+
+@inline function count(obj::Float32Vector)::UInt32
+    return unsafe_load(reinterpret(Ptr{UInt32}, obj.buffer + _count_offset(obj)))
+end
+
+@inline function count!(obj::Float32Vector, value::UInt32)
+    unsafe_store!(reinterpret(Ptr{UInt32}, obj.buffer + _count_offset(obj)), value)
+end
+
+@inline function _count_offset(obj::Float32Vector)::UInt64
+    return _values_offset(obj) + _values_size_aligned(obj)
+end
+
+@inline function _count_size_aligned(obj::Float32Vector)::UInt64
+    return 8
+end
+
+@inline function _count_calc_size_aligned(::Type{Float32Vector}, value::UInt32)::UInt64
+    return 8
+end
+
+
+# --------------------------------------------------------------------
+
+@inline function fastbin_calc_binary_size(obj::Float32Vector)::UInt64
+    return _count_offset(obj) + _count_size_aligned(obj)
+end
+
+@inline function fastbin_calc_binary_size(::Type{Float32Vector},
+    values::Vector{Float32}
+)
+    return 16 +
+        _values_calc_size_aligned(Float32Vector, values)
+end
+
+"""
+Returns the stored (aligned) binary size of the object.
+This function should only be called after `fastbin_finalize!(obj)`.
+"""
+@inline function fastbin_binary_size(obj::Float32Vector)::UInt64
+    return unsafe_load(reinterpret(Ptr{UInt64}, obj.buffer))
+end
+
+"""
+Finalizes the object by writing the binary size to the beginning of its buffer.
+After calling this function, the underlying buffer can be used for serialization.
+To get the actual buffer size, call `fastbin_binary_size(obj)`.
+"""
+@inline function fastbin_finalize!(obj::Float32Vector)
+    unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer), fastbin_calc_binary_size(obj))
+    nothing
+end
+
+function show(io::IO, obj::Float32Vector)
+    write(io, "[my_models::Float32Vector]\n    values: ")
+    show(io, values(obj))
+    write(io, "\n    count: ")
+    print(io, count(obj))
+    write(io, "\n")
+    nothing
+end
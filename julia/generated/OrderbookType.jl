@@ -5,8 +5,13 @@ using EnumX
     Delta = 2
 end
 
+const _OrderbookType_from_string = Dict{String, OrderbookType.T}(
+    "Snapshot" => OrderbookType.Snapshot,
+    "Delta" => OrderbookType.Delta,
+)
+
 function from_string(::Type{OrderbookType.T}, str::T) where T <: AbstractString
-    str == "Snapshot" && return OrderbookType.Snapshot
-    str == "Delta" && return OrderbookType.Delta
-    throw(ArgumentError("Invalid string value for enum my_models.OrderbookType: $str"))
+    get(_OrderbookType_from_string, str) do
+        throw(ArgumentError("Invalid string value for enum my_models.OrderbookType: $str"))
+    end
 end
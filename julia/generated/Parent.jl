@@ -31,6 +31,7 @@ mutable struct Parent
 
     function Parent(buffer_size::Integer)
         buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
+        unsafe_store!(reinterpret(Ptr{UInt64}, buffer), UInt64(0))
         new(buffer, buffer_size, true)
     end
 end
@@ -132,10 +133,9 @@ end
 
 @inline function str!(obj::Parent, value::T) where {T<:AbstractString}
     offset::UInt64 = _str_offset(obj)
-    contents_size::UInt64 = length(value) * 1
-    unaligned_size::UInt64 = 8 + contents_size
-    aligned_size::UInt64 = (unaligned_size + 7) & ~7
-    aligned_diff::UInt64 = aligned_size - unaligned_size
+    contents_size::UInt64 = length(value)
+    aligned_size::UInt64 = (contents_size + 15) & ~7
+    aligned_diff::UInt64 = aligned_size - 8 - contents_size
     aligned_size_high::UInt64 = aligned_size | (aligned_diff << 56)
     unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), aligned_size_high)
     dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
@@ -154,9 +154,8 @@ end
 end
 
 @inline function _str_calc_size_aligned(::Type{Parent}, value::T)::UInt64 where {T<:AbstractString}
-    contents_size::UInt64 = length(value) * 1
-    unaligned_size::UInt64 = 8 + contents_size
-    return (unaligned_size + 7) & ~7
+    contents_size::UInt64 = length(value)
+    return (contents_size + 15) & ~7
 end
 
 @inline function _str_size_unaligned(obj::Parent)::UInt64
@@ -200,14 +199,14 @@ To get the actual buffer size, call `fastbin_binary_size(obj)`.
 end
 
 function show(io::IO, obj::Parent)
-    print(io, "[my_models::Parent]")
-    print(io, "\n    field1: ")
+    write(io, "[my_models::Parent]\n    field1: ")
     print(io, field1(obj))
-    print(io, "\n    child1: ")
+    write(io, "\n    child1: ")
     show(io, child1(obj))
-    print(io, "\n    child2: ")
+    write(io, "\n    child2: ")
     show(io, child2(obj))
-    print(io, "\n    str: ")
+    write(io, "\n    str: ")
     print(io, str(obj))
-    println(io)
+    write(io, "\n")
+    nothing
 end
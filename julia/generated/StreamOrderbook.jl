@@ -43,6 +43,7 @@ mutable struct StreamOrderbook
 
     function StreamOrderbook(buffer_size::Integer)
         buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
+        unsafe_store!(reinterpret(Ptr{UInt64}, buffer), UInt64(0))
         new(buffer, buffer_size, true)
     end
 end
@@ -182,10 +183,9 @@ end
 
 @inline function symbol!(obj::StreamOrderbook, value::T) where {T<:AbstractString}
     offset::UInt64 = _symbol_offset(obj)
-    contents_size::UInt64 = length(value) * 1
-    unaligned_size::UInt64 = 8 + contents_size
-    aligned_size::UInt64 = (unaligned_size + 7) & ~7
-    aligned_diff::UInt64 = aligned_size - unaligned_size
+    contents_size::UInt64 = length(value)
+    aligned_size::UInt64 = (contents_size + 15) & ~7
+    aligned_diff::UInt64 = aligned_size - 8 - contents_size
     aligned_size_high::UInt64 = aligned_size | (aligned_diff << 56)
     unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), aligned_size_high)
     dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
@@ -204,9 +204,8 @@ end
 end
 
 @inline function _symbol_calc_size_aligned(::Type{StreamOrderbook}, value::T)::UInt64 where {T<:AbstractString}
-    contents_size::UInt64 = length(value) * 1
-    unaligned_size::UInt64 = 8 + contents_size
-    return (unaligned_size + 7) & ~7
+    contents_size::UInt64 = length(value)
+    return (contents_size + 15) & ~7
 end
 
 @inline function _symbol_size_unaligned(obj::StreamOrderbook)::UInt64
@@ -274,7 +273,7 @@ end
 
 @inline function bid_prices!(obj::StreamOrderbook, value::Vector{Float64})
     offset::UInt64 = _bid_prices_offset(obj)
-    contents_size::UInt64 = length(value) * 8
+    contents_size::UInt64 = length(value) << 3
     unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), 8 + contents_size)
     dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
     src_ptr::Ptr{UInt8} = reinterpret(Ptr{UInt8}, pointer(value))
@@ -291,7 +290,7 @@ end
 end
 
 @inline function _bid_prices_calc_size_aligned(::Type{StreamOrderbook}, value::Vector{Float64})::UInt64
-    contents_size::UInt64 = length(value) * 8
+    contents_size::UInt64 = length(value) << 3
     return 8 + contents_size
 end
 
@@ -312,7 +311,7 @@ end
 
 @inline function bid_quantities!(obj::StreamOrderbook, value::Vector{Float64})
     offset::UInt64 = _bid_quantities_offset(obj)
-    contents_size::UInt64 = length(value) * 8
+    contents_size::UInt64 = length(value) << 3
     unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), 8 + contents_size)
     dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
     src_ptr::Ptr{UInt8} = reinterpret(Ptr{UInt8}, pointer(value))
@@ -329,7 +328,7 @@ end
 end
 
 @inline function _bid_quantities_calc_size_aligned(::Type{StreamOrderbook}, value::Vector{Float64})::UInt64
-    contents_size::UInt64 = length(value) * 8
+    contents_size::UInt64 = length(value) << 3
     return 8 + contents_size
 end
 
@@ -350,7 +349,7 @@ end
 
 @inline function ask_prices!(obj::StreamOrderbook, value::Vector{Float64})
     offset::UInt64 = _ask_prices_offset(obj)
-    contents_size::UInt64 = length(value) * 8
+    contents_size::UInt64 = length(value) << 3
     unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), 8 + contents_size)
     dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
     src_ptr::Ptr{UInt8} = reinterpret(Ptr{UInt8}, pointer(value))
@@ -367,7 +366,7 @@ end
 end
 
 @inline function _ask_prices_calc_size_aligned(::Type{StreamOrderbook}, value::Vector{Float64})::UInt64
-    contents_size::UInt64 = length(value) * 8
+    contents_size::UInt64 = length(value) << 3
     return 8 + contents_size
 end
 
@@ -388,7 +387,7 @@ end
 
 @inline function ask_quantities!(obj::StreamOrderbook, value::Vector{Float64})
     offset::UInt64 = _ask_quantities_offset(obj)
-    contents_size::UInt64 = length(value) * 8
+    contents_size::UInt64 = length(value) << 3
     unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), 8 + contents_size)
     dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
     src_ptr::Ptr{UInt8} = reinterpret(Ptr{UInt8}, pointer(value))
@@ -405,7 +404,7 @@ end
 end
 
 @inline function _ask_quantities_calc_size_aligned(::Type{StreamOrderbook}, value::Vector{Float64})::UInt64
-    contents_size::UInt64 = length(value) * 8
+    contents_size::UInt64 = length(value) << 3
     return 8 + contents_size
 end
 
@@ -454,30 +453,30 @@ To get the actual buffer size, call `fastbin_binary_size(obj)`.
 end
 
 function show(io::IO, obj::StreamOrderbook)
-    print(io, "[my_models::StreamOrderbook]")
-    print(io, "\n    server_time: ")
+    write(io, "[my_models::StreamOrderbook]\n    server_time: ")
     print(io, server_time(obj))
-    print(io, "\n    recv_time: ")
+    write(io, "\n    recv_time: ")
     print(io, recv_time(obj))
-    print(io, "\n    cts: ")
+    write(io, "\n    cts: ")
     print(io, cts(obj))
-    print(io, "\n    type: ")
+    write(io, "\n    type: ")
     print(io, type(obj))
-    print(io, "\n    depth: ")
+    write(io, "\n    depth: ")
     print(io, depth(obj))
-    print(io, "\n    symbol: ")
+    write(io, "\n    symbol: ")
     print(io, symbol(obj))
-    print(io, "\n    update_id: ")
+    write(io, "\n    update_id: ")
     print(io, update_id(obj))
-    print(io, "\n    seq_num: ")
+    write(io, "\n    seq_num: ")
     print(io, seq_num(obj))
-    print(io, "\n    bid_prices: ")
+    write(io, "\n    bid_prices: ")
     show(io, bid_prices(obj))
-    print(io, "\n    bid_quantities: ")
+    write(io, "\n    bid_quantities: ")
     show(io, bid_quantities(obj))
-    print(io, "\n    ask_prices: ")
+    write(io, "\n    ask_prices: ")
     show(io, ask_prices(obj))
-    print(io, "\n    ask_quantities: ")
+    write(io, "\n    ask_quantities: ")
     show(io, ask_quantities(obj))
-    println(io)
+    write(io, "\n")
+    nothing
 end
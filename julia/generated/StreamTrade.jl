@@ -41,6 +41,7 @@ mutable struct StreamTrade
 
     function StreamTrade(buffer_size::Integer)
         buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
+        unsafe_store!(reinterpret(Ptr{UInt64}, buffer), UInt64(0))
         new(buffer, buffer_size, true)
     end
 end
@@ -111,10 +112,9 @@ end
 
 @inline function symbol!(obj::StreamTrade, value::T) where {T<:AbstractString}
     offset::UInt64 = _symbol_offset(obj)
-    contents_size::UInt64 = length(value) * 1
-    unaligned_size::UInt64 = 8 + contents_size
-    aligned_size::UInt64 = (unaligned_size + 7) & ~7
-    aligned_diff::UInt64 = aligned_size - unaligned_size
+    contents_size::UInt64 = length(value)
+    aligned_size::UInt64 = (contents_size + 15) & ~7
+    aligned_diff::UInt64 = aligned_size - 8 - contents_size
     aligned_size_high::UInt64 = aligned_size | (aligned_diff << 56)
     unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), aligned_size_high)
     dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
@@ -133,9 +133,8 @@ end
 end
 
 @inline function _symbol_calc_size_aligned(::Type{StreamTrade}, value::T)::UInt64 where {T<:AbstractString}
-    contents_size::UInt64 = length(value) * 1
-    unaligned_size::UInt64 = 8 + contents_size
-    return (unaligned_size + 7) & ~7
+    contents_size::UInt64 = length(value)
+    return (contents_size + 15) & ~7
 end
 
 @inline function _symbol_size_unaligned(obj::StreamTrade)::UInt64
@@ -272,10 +271,9 @@ end
 
 @inline function trade_id!(obj::StreamTrade, value::T) where {T<:AbstractString}
     offset::UInt64 = _trade_id_offset(obj)
-    contents_size::UInt64 = length(value) * 1
-    unaligned_size::UInt64 = 8 + contents_size
-    aligned_size::UInt64 = (unaligned_size + 7) & ~7
-    aligned_diff::UInt64 = aligned_size - unaligned_size
+    contents_size::UInt64 = length(value)
+    aligned_size::UInt64 = (contents_size + 15) & ~7
+    aligned_diff::UInt64 = aligned_size - 8 - contents_size
     aligned_size_high::UInt64 = aligned_size | (aligned_diff << 56)
     unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), aligned_size_high)
     dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
@@ -294,9 +292,8 @@ end
 end
 
 @inline function _trade_id_calc_size_aligned(::Type{StreamTrade}, value::T)::UInt64 where {T<:AbstractString}
-    contents_size::UInt64 = length(value) * 1
-    unaligned_size::UInt64 = 8 + contents_size
-    return (unaligned_size + 7) & ~7
+    contents_size::UInt64 = length(value)
+    return (contents_size + 15) & ~7
 end
 
 @inline function _trade_id_size_unaligned(obj::StreamTrade)::UInt64
@@ -363,26 +360,26 @@ To get the actual buffer size, call `fastbin_binary_size(obj)`.
 end
 
 function show(io::IO, obj::StreamTrade)
-    print(io, "[my_models::StreamTrade]")
-    print(io, "\n    server_time: ")
+    write(io, "[my_models::StreamTrade]\n    server_time: ")
     print(io, server_time(obj))
-    print(io, "\n    recv_time: ")
+    write(io, "\n    recv_time: ")
     print(io, recv_time(obj))
-    print(io, "\n    symbol: ")
+    write(io, "\n    symbol: ")
     print(io, symbol(obj))
-    print(io, "\n    fill_time: ")
+    write(io, "\n    fill_time: ")
     print(io, fill_time(obj))
-    print(io, "\n    side: ")
+    write(io, "\n    side: ")
     print(io, side(obj))
-    print(io, "\n    price: ")
+    write(io, "\n    price: ")
     print(io, price(obj))
-    print(io, "\n    price_chg_dir: ")
+    write(io, "\n    price_chg_dir: ")
     print(io, price_chg_dir(obj))
-    print(io, "\n    size: ")
+    write(io, "\n    size: ")
     print(io, size(obj))
-    print(io, "\n    trade_id: ")
+    write(io, "\n    trade_id: ")
     print(io, trade_id(obj))
-    print(io, "\n    block_trade: ")
+    write(io, "\n    block_trade: ")
     print(io, block_trade(obj))
-    println(io)
+    write(io, "\n")
+    nothing
 end
@@ -28,6 +28,7 @@ mutable struct StructVector
 
     function StructVector(buffer_size::Integer)
         buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
+        unsafe_store!(reinterpret(Ptr{UInt64}, buffer), UInt64(0))
         new(buffer, buffer_size, true)
     end
 end
@@ -46,13 +47,13 @@ end
     ptr::Ptr{ChildFixed} = reinterpret(Ptr{ChildFixed}, obj.buffer + _values_offset(obj))
     unaligned_size::UInt64 = _values_size_unaligned(obj)
     n_bytes::UInt64 = unaligned_size - 8
-    count::UInt64 = n_bytes / 16
+    count::UInt64 = n_bytes >> 4
     return unsafe_wrap(Vector{ChildFixed}, ptr + 8, count, own=false)
 end
 
 @inline function values!(obj::StructVector, value::Vector{ChildFixed})
     offset::UInt64 = _values_offset(obj)
-    contents_size::UInt64 = length(value) * 16
+    contents_size::UInt64 = length(value) << 4
     unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), 8 + contents_size)
     dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
     src_ptr::Ptr{UInt8} = reinterpret(Ptr{UInt8}, pointer(value))
@@ -69,7 +70,7 @@ end
 end
 
 @inline function _values_calc_size_aligned(::Type{StructVector}, value::Vector{ChildFixed})::UInt64
-    contents_size::UInt64 = length(value) * 16
+    contents_size::UInt64 = length(value) << 4
     return 8 + contents_size
 end
 
@@ -133,10 +134,10 @@ To get the actual buffer size, call `fastbin_binary_size(obj)`.
 end
 
 function show(io::IO, obj::StructVector)
-    print(io, "[my_models::StructVector]")
-    print(io, "\n    values: ")
+    write(io, "[my_models::StructVector]\n    values: ")
     show(io, values(obj))
-    print(io, "\n    count: ")
+    write(io, "\n    count: ")
     print(io, count(obj))
-    println(io)
+    write(io, "\n")
+    nothing
 end
@@ -33,11 +33,16 @@ https://bybit-exchange.github.io/docs/v5/enum#tickdirection
     ZeroMinusTick = 4
 end
 
+const _TickDirection_from_string = Dict{String, TickDirection.T}(
+    "Unknown" => TickDirection.Unknown,
+    "PlusTick" => TickDirection.PlusTick,
+    "ZeroPlusTick" => TickDirection.ZeroPlusTick,
+    "MinusTick" => TickDirection.MinusTick,
+    "ZeroMinusTick" => TickDirection.ZeroMinusTick,
+)
+
 function from_string(::Type{TickDirection.T}, str::T) where T <: AbstractString
-    str == "Unknown" && return TickDirection.Unknown
-    str == "PlusTick" && return TickDirection.PlusTick
-    str == "ZeroPlusTick" && return TickDirection.ZeroPlusTick
-    str == "MinusTick" && return TickDirection.MinusTick
-    str == "ZeroMinusTick" && return TickDirection.ZeroMinusTick
-    throw(ArgumentError("Invalid string value for enum my_models.TickDirection: $str"))
+    get(_TickDirection_from_string, str) do
+        throw(ArgumentError("Invalid string value for enum my_models.TickDirection: $str"))
+    end
 end
@@ -5,8 +5,13 @@ using EnumX
     Buy = 1
 end
 
+const _TradeSide_from_string = Dict{String, TradeSide.T}(
+    "Sell" => TradeSide.Sell,
+    "Buy" => TradeSide.Buy,
+)
+
 function from_string(::Type{TradeSide.T}, str::T) where T <: AbstractString
-    str == "Sell" && return TradeSide.Sell
-    str == "Buy" && return TradeSide.Buy
-    throw(ArgumentError("Invalid string value for enum my_models.TradeSide: $str"))
+    get(_TradeSide_from_string, str) do
+        throw(ArgumentError("Invalid string value for enum my_models.TradeSide: $str"))
+    end
 end
@@ -28,6 +28,7 @@ mutable struct UInt32Vector
 
     function UInt32Vector(buffer_size::Integer)
         buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
+        unsafe_store!(reinterpret(Ptr{UInt64}, buffer), UInt64(0))
         new(buffer, buffer_size, true)
     end
 end
@@ -52,10 +53,9 @@ end
 
 @inline function values!(obj::UInt32Vector, value::Vector{UInt32})
     offset::UInt64 = _values_offset(obj)
-    contents_size::UInt64 = length(value) * 4
-    unaligned_size::UInt64 = 8 + contents_size
-    aligned_size::UInt64 = (unaligned_size + 7) & ~7
-    aligned_diff::UInt64 = aligned_size - unaligned_size
+    contents_size::UInt64 = length(value) << 2
+    aligned_size::UInt64 = (contents_size + 15) & ~7
+    aligned_diff::UInt64 = aligned_size - 8 - contents_size
     aligned_size_high::UInt64 = aligned_size | (aligned_diff << 56)
     unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), aligned_size_high)
     dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
@@ -74,9 +74,8 @@ end
 end
 
 @inline function _values_calc_size_aligned(::Type{UInt32Vector}, value::Vector{UInt32})::UInt64
-    contents_size::UInt64 = length(value) * 4
-    unaligned_size::UInt64 = 8 + contents_size
-    return (unaligned_size + 7) & ~7
+    contents_size::UInt64 = length(value) << 2
+    return (contents_size + 15) & ~7
 end
 
 @inline function _values_size_unaligned(obj::UInt32Vector)::UInt64
@@ -141,10 +140,10 @@ To get the actual buffer size, call `fastbin_binary_size(obj)`.
 end
 
 function show(io::IO, obj::UInt32Vector)
-    print(io, "[my_models::UInt32Vector]")
-    print(io, "\n    values: ")
+    write(io, "[my_models::UInt32Vector]\n    values: ")
     show(io, values(obj))
-    print(io, "\n    count: ")
+    write(io, "\n    count: ")
     print(io, count(obj))
-    println(io)
+    write(io, "\n")
+    nothing
 end
@@ -10,6 +10,7 @@ include("ChildVar.jl")
 include("ChildFixed.jl")
 include("Parent.jl")
 include("UInt32Vector.jl")
+include("Float32Vector.jl")
 include("StructVector.jl")
 
 # export all types and functions
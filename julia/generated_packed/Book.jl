@@ -0,0 +1,178 @@
+import Base.show
+import Base.finalizer
+
+"""
+Fixed-size struct with nested fixed-size structs, which start at 8-byte boundaries.
+
+------------------------------------------------------------
+
+Binary serializable data container generated by `fastbin`.
+
+This container has fixed size of 64 bytes.
+
+The `fastbin_finalize!()` method MUST be called after all setter methods have been called.
+
+It is the responsibility of the caller to ensure that the buffer is
+large enough to hold all data.
+"""
+mutable struct Book
+    buffer::Ptr{UInt8}
+    buffer_size::UInt64
+    owns_buffer::Bool
+
+    function Book(buffer::Ptr{UInt8}, buffer_size::UInt64, owns_buffer::Bool)
+        new(buffer, buffer_size, owns_buffer)
+    end
+
+    function Book(buffer_size::Integer)
+        buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
+        new(buffer, buffer_size, true)
+    end
+end
+
+function Base.finalizer(obj::Book)
+    if obj.owns_buffer && obj.buffer != C_NULL
+        Base.Libc.free(obj.buffer)
+        obj.buffer = C_NULL
+    end
+    nothing
+end
+
+# Member: id::UInt32
+
+@inline function id(obj::Book)::UInt32
+    return unsafe_load(reinterpret(Ptr{UInt32}, obj.buffer + _id_offset(obj)))
+end
+
+@inline function id!(obj::Book, value::UInt32)
+    unsafe_store!(reinterpret(Ptr{UInt32}, obj.buffer + _id_offset(obj)), value)
+end
+
+@inline function _id_offset(obj::Book)::UInt64
+    return 0
+end
+
+@inline function _id_size_aligned(obj::Book)::UInt64
+    return 4
+end
+
+@inline function _id_calc_size_aligned(::Type{Book}, value::UInt32)::UInt64
+    return 4
+end
+
+
+# Member: bid::Quote
+
+@inline function bid(obj::Book)::Quote
+    ptr::Ptr{UInt8} = obj.buffer + _bid_offset(obj)
+    return Quote(ptr, _bid_size_aligned(obj), false)
+end
+
+@inline function bid!(obj::Book, value::Quote)
+    @assert binary_size(value) > 0 "Cannot set member `bid`, parameter struct of type `Quote` not finalized. Call fastbin_finalize!(obj) on struct after creation."
+    offset::UInt64 = _bid_offset(obj)
+    size::UInt64 = binary_size(value)
+    unsafe_copyto!(obj.buffer + offset, value.buffer, size)
+end
+
+@inline function _bid_offset(obj::Book)::UInt64
+    return 8
+end
+
+@inline function _bid_size_aligned(obj::Book)::UInt64
+    return 24
+end
+
+@inline function _bid_calc_size_aligned(::Type{Book}, value::Quote)::UInt64
+    return binary_size(value)
+end
+
+
+# Member: ask::Quote
+
+@inline function ask(obj::Book)::Quote
+    ptr::Ptr{UInt8} = obj.buffer + _ask_offset(obj)
+    return Quote(ptr, _ask_size_aligned(obj), false)
+end
+
+@inline function ask!(obj::Book, value::Quote)
+    @assert binary_size(value) > 0 "Cannot set member `ask`, parameter struct of type `Quote` not finalized. Call fastbin_finalize!(obj) on struct after creation."
+    offset::UInt64 = _ask_offset(obj)
+    size::UInt64 = binary_size(value)
+    unsafe_copyto!(obj.buffer + offset, value.buffer, size)
+end
+
+@inline function _ask_offset(obj::Book)::UInt64
+    return 32
+end
+
+@inline function _ask_size_aligned(obj::Book)::UInt64
+    return 24
+end
+
+@inline function _ask_calc_size_aligned(::Type{Book}, value::Quote)::UInt64
+    return binary_size(value)
+end
+
+
+# Member: depth::UInt8
+
+@inline function depth(obj::Book)::UInt8
+    return unsafe_load(reinterpret(Ptr{UInt8}, obj.buffer + _depth_offset(obj)))
+end
+
+@inline function depth!(obj::Book, value::UInt8)
+    unsafe_store!(reinterpret(Ptr{UInt8}, obj.buffer + _depth_offset(obj)), value)
+end
+
+@inline function _depth_offset(obj::Book)::UInt64
+    return 56
+end
+
+@inline function _depth_size_aligned(obj::Book)::UInt64
+    return 1
+end
+
+@inline function _depth_calc_size_aligned(::Type{Book}, value::UInt8)::UInt64
+    return 1
+end
+
+
+# --------------------------------------------------------------------
+
+@inline function fastbin_calc_binary_size(obj::Book)::UInt64
+    return 64
+end
+
+@inline function fastbin_calc_binary_size(::Type{Book})
+    64
+end
+
+"""
+Returns the stored (aligned) binary size of the object.
+This function should only be called after `fastbin_finalize!(obj)`.
+"""
+@inline function fastbin_binary_size(obj::Book)::UInt64
+    return 64
+end
+
+"""
+Finalizes the object by writing the binary size to the beginning of its buffer.
+After calling this function, the underlying buffer can be used for serialization.
+To get the actual buffer size, call `fastbin_binary_size(obj)`.
+"""
+@inline function fastbin_finalize!(obj::Book)
+end
+
+function show(io::IO, obj::Book)
+    write(io, "[my_models_packed::Book]\n    id: ")
+    print(io, id(obj))
+    write(io, "\n    bid: ")
+    show(io, bid(obj))
+    write(io, "\n    ask: ")
+    show(io, ask(obj))
+    write(io, "\n    depth: ")
+    print(io, depth(obj))
+    write(io, "\n")
+    nothing
+end
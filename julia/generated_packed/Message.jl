@@ -0,0 +1,311 @@
+import Base.show
+import Base.finalizer
+using StringViews
+
+"""
+Variable-length struct with packed members after variable-length members.
+
+------------------------------------------------------------
+
+Binary serializable data container generated by `fastbin`.
+
+This container has variable size.
+All setter methods starting from the first variable-sized member and afterwards MUST be called in order.
+
+Members in order
+================
+- `seq::UInt16`            (fixed)
+- `symbol::StringView`     (variable)
+- `count::UInt8`           (fixed)
+- `sizes::Vector{UInt16}`  (variable)
+- `book::Book`             (fixed)
+- `flags::UInt32`          (fixed)
+- `last::Int8`             (fixed)
+
+The `fastbin_finalize!()` method MUST be called after all setter methods have been called.
+
+It is the responsibility of the caller to ensure that the buffer is
+large enough to hold all data.
+"""
+mutable struct Message
+    buffer::Ptr{UInt8}
+    buffer_size::UInt64
+    owns_buffer::Bool
+
+    function Message(buffer::Ptr{UInt8}, buffer_size::UInt64, owns_buffer::Bool)
+        new(buffer, buffer_size, owns_buffer)
+    end
+
+    function Message(buffer_size::Integer)
+        buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
+        unsafe_store!(reinterpret(Ptr{UInt64}, buffer), UInt64(0))
+        new(buffer, buffer_size, true)
+    end
+end
+
+function Base.finalizer(obj::Message)
+    if obj.owns_buffer && obj.buffer != C_NULL
+        Base.Libc.free(obj.buffer)
+        obj.buffer = C_NULL
+    end
+    nothing
+end
+
+# Member: seq::UInt16
+
+@inline function seq(obj::Message)::UInt16
+    return unsafe_load(reinterpret(Ptr{UInt16}, obj.buffer + _seq_offset(obj)))
+end
+
+@inline function seq!(obj::Message, value::UInt16)
+    unsafe_store!(reinterpret(Ptr{UInt16}, obj.buffer + _seq_offset(obj)), value)
+end
+
+@inline function _seq_offset(obj::Message)::UInt64
+    return 8
+end
+
+@inline function _seq_size_aligned(obj::Message)::UInt64
+    return 2
+end
+
+@inline function _seq_calc_size_aligned(::Type{Message}, value::UInt16)::UInt64
+    return 2
+end
+
+
+# Member: symbol::StringView
+
+@inline function symbol(obj::Message)::StringView
+    ptr::Ptr{UInt8} = reinterpret(Ptr{UInt8}, obj.buffer + _symbol_offset(obj))
+    unaligned_size::UInt64 = _symbol_size_unaligned(obj)
+    n_bytes::UInt64 = unaligned_size - 8
+    count::UInt64 = n_bytes
+    return StringView(unsafe_wrap(Vector{UInt8}, ptr + 8, count, own=false))
+end
+
+@inline function symbol!(obj::Message, value::T) where {T<:AbstractString}
+    offset::UInt64 = _symbol_offset(obj)
+    contents_size::UInt64 = length(value)
+    aligned_size::UInt64 = (contents_size + 15) & ~7
+    aligned_diff::UInt64 = aligned_size - 8 - contents_size
+    aligned_size_high::UInt64 = aligned_size | (aligned_diff << 56)
+    unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), aligned_size_high)
+    dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
+    src_ptr::Ptr{UInt8} = reinterpret(Ptr{UInt8}, pointer(value))
+    unsafe_copyto!(dest_ptr, src_ptr, contents_size)
+end
+
+@inline function _symbol_offset(obj::Message)::UInt64
+    return 16
+end
+
+@inline function _symbol_size_aligned(obj::Message)::UInt64
+    stored_size::UInt64 = unsafe_load(reinterpret(Ptr{UInt64}, obj.buffer + _symbol_offset(obj)))
+    aligned_size::UInt64 = stored_size & 0x00FFFFFFFFFFFFFF
+    return aligned_size
+end
+
+@inline function _symbol_calc_size_aligned(::Type{Message}, value::T)::UInt64 where {T<:AbstractString}
+    contents_size::UInt64 = length(value)
+    return (contents_size + 15) & ~7
+end
+
+@inline function _symbol_size_unaligned(obj::Message)::UInt64
+    stored_size::UInt64 = unsafe_load(reinterpret(Ptr{UInt64}, obj.buffer + _symbol_offset(obj)))
+    aligned_diff::UInt64 = stored_size >> 56
+    aligned_size::UInt64 = stored_size & 0x00FFFFFFFFFFFFFF
+    return aligned_size - aligned_diff
+end
+
+# Member: count::UInt8
+
+@inline function count(obj::Message)::UInt8
+    return unsafe_load(reinterpret(Ptr{UInt8}, obj.buffer + _count_offset(obj)))
+end
+
+@inline function count!(obj::Message, value::UInt8)
+    unsafe_store!(reinterpret(Ptr{UInt8}, obj.buffer + _count_offset(obj)), value)
+end
+
+@inline function _count_offset(obj::Message)::UInt64
+    return _symbol_offset(obj) + _symbol_size_aligned(obj)
+end
+
+@inline function _count_size_aligned(obj::Message)::UInt64
+    return 1
+end
+
+@inline function _count_calc_size_aligned(::Type{Message}, value::UInt8)::UInt64
+    return 1
+end
+
+
+# Member: sizes::Vector{UInt16}
+
+@inline function sizes(obj::Message)::Vector{UInt16}
+    ptr::Ptr{UInt16} = reinterpret(Ptr{UInt16}, obj.buffer + _sizes_offset(obj))
+    unaligned_size::UInt64 = _sizes_size_unaligned(obj)
+    n_bytes::UInt64 = unaligned_size - 8
+    count::UInt64 = n_bytes >> 1
+    return unsafe_wrap(Vector{UInt16}, ptr + 8, count, own=false)
+end
+
+@inline function sizes!(obj::Message, value::Vector{UInt16})
+    offset::UInt64 = _sizes_offset(obj)
+    contents_size::UInt64 = length(value) << 1
+    aligned_size::UInt64 = (contents_size + 15) & ~7
+    aligned_diff::UInt64 = aligned_size - 8 - contents_size
+    aligned_size_high::UInt64 = aligned_size | (aligned_diff << 56)
+    unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer + offset), aligned_size_high)
+    dest_ptr::Ptr{UInt8} = obj.buffer + offset + 8
+    src_ptr::Ptr{UInt8} = reinterpret(Ptr{UInt8}, pointer(value))
+    unsafe_copyto!(dest_ptr, src_ptr, contents_size)
+end
+
+@inline function _sizes_offset(obj::Message)::UInt64
+    return (_count_offset(obj) + _count_size_aligned(obj) + 7) & ~UInt64(7)
+end
+
+@inline function _sizes_size_aligned(obj::Message)::UInt64
+    stored_size::UInt64 = unsafe_load(reinterpret(Ptr{UInt64}, obj.buffer + _sizes_offset(obj)))
+    aligned_size::UInt64 = stored_size & 0x00FFFFFFFFFFFFFF
+    return aligned_size
+end
+
+@inline function _sizes_calc_size_aligned(::Type{Message}, value::Vector{UInt16})::UInt64
+    contents_size::UInt64 = length(value) << 1
+    return (contents_size + 15) & ~7
+end
+
+@inline function _sizes_size_unaligned(obj::Message)::UInt64
+    stored_size::UInt64 = unsafe_load(reinterpret(Ptr{UInt64}, obj.buffer + _sizes_offset(obj)))
+    aligned_diff::UInt64 = stored_size >> 56
+    aligned_size::UInt64 = stored_size & 0x00FFFFFFFFFFFFFF
+    return aligned_size - aligned_diff
+end
+
+# Member: book::Book
+
+@inline function book(obj::Message)::Book
+    ptr::Ptr{UInt8} = obj.buffer + _book_offset(obj)
+    return Book(ptr, _book_size_aligned(obj), false)
+end
+
+@inline function book!(obj::Message, value::Book)
+    @assert binary_size(value) > 0 "Cannot set member `book`, parameter struct of type `Book` not finalized. Call fastbin_finalize!(obj) on struct after creation."
+    offset::UInt64 = _book_offset(obj)
+    size::UInt64 = binary_size(value)
+    unsafe_copyto!(obj.buffer + offset, value.buffer, size)
+end
+
+@inline function _book_offset(obj::Message)::UInt64
+    return _sizes_offset(obj) + _sizes_size_aligned(obj)
+end
+
+@inline function _book_size_aligned(obj::Message)::UInt64
+    return 64
+end
+
+@inline function _book_calc_size_aligned(::Type{Message}, value::Book)::UInt64
+    return binary_size(value)
+end
+
+
+# Member: flags::UInt32
+
+@inline function flags(obj::Message)::UInt32
+    return unsafe_load(reinterpret(Ptr{UInt32}, obj.buffer + _flags_offset(obj)))
+end
+
+@inline function flags!(obj::Message, value::UInt32)
+    unsafe_store!(reinterpret(Ptr{UInt32}, obj.buffer + _flags_offset(obj)), value)
+end
+
+@inline function _flags_offset(obj::Message)::UInt64
+    return _book_offset(obj) + _book_size_aligned(obj)
+end
+
+@inline function _flags_size_aligned(obj::Message)::UInt64
+    return 4
+end
+
+@inline function _flags_calc_size_aligned(::Type{Message}, value::UInt32)::UInt64
+    return 4
+end
+
+
+# Member: last::Int8
+
+@inline function last(obj::Message)::Int8
+    return unsafe_load(reinterpret(Ptr{Int8}, obj.buffer + _last_offset(obj)))
+end
+
+@inline function last!(obj::Message, value::Int8)
+    unsafe_store!(reinterpret(Ptr{Int8}, obj.buffer + _last_offset(obj)), value)
+end
+
+@inline function _last_offset(obj::Message)::UInt64
+    return _flags_offset(obj) + _flags_size_aligned(obj)
+end
+
+@inline function _last_size_aligned(obj::Message)::UInt64
+    return 1
+end
+
+@inline function _last_calc_size_aligned(::Type{Message}, value::Int8)::UInt64
+    return 1
+end
+
+
+# --------------------------------------------------------------------
+
+@inline function fastbin_calc_binary_size(obj::Message)::UInt64
+    return (_last_offset(obj) + _last_size_aligned(obj) + 7) & ~UInt64(7)
+end
+
+@inline function fastbin_calc_binary_size(::Type{Message},
+    symbol::StringView,
+    sizes::Vector{UInt16}
+)
+    return 96 +
+        _symbol_calc_size_aligned(Message, symbol) +
+        _sizes_calc_size_aligned(Message, sizes)
+end
+
+"""
+Returns the stored (aligned) binary size of the object.
+This function should only be called after `fastbin_finalize!(obj)`.
+"""
+@inline function fastbin_binary_size(obj::Message)::UInt64
+    return unsafe_load(reinterpret(Ptr{UInt64}, obj.buffer))
+end
+
+"""
+Finalizes the object by writing the binary size to the beginning of its buffer.
+After calling this function, the underlying buffer can be used for serialization.
+To get the actual buffer size, call `fastbin_binary_size(obj)`.
+"""
+@inline function fastbin_finalize!(obj::Message)
+    unsafe_store!(reinterpret(Ptr{UInt64}, obj.buffer), fastbin_calc_binary_size(obj))
+    nothing
+end
+
+function show(io::IO, obj::Message)
+    write(io, "[my_models_packed::Message]\n    seq: ")
+    print(io, seq(obj))
+    write(io, "\n    symbol: ")
+    print(io, symbol(obj))
+    write(io, "\n    count: ")
+    print(io, count(obj))
+    write(io, "\n    sizes: ")
+    show(io, sizes(obj))
+    write(io, "\n    book: ")
+    show(io, book(obj))
+    write(io, "\n    flags: ")
+    print(io, flags(obj))
+    write(io, "\n    last: ")
+    print(io, last(obj))
+    write(io, "\n")
+    nothing
+end
@@ -0,0 +1,195 @@
+import Base.show
+import Base.finalizer
+
+"""
+Fixed-size struct, members end at byte 23 and the size is rounded up to 24 bytes.
+
+------------------------------------------------------------
+
+Binary serializable data container generated by `fastbin`.
+
+This container has fixed size of 24 bytes.
+
+The `fastbin_finalize!()` method MUST be called after all setter methods have been called.
+
+It is the responsibility of the caller to ensure that the buffer is
+large enough to hold all data.
+"""
+mutable struct Quote
+    buffer::Ptr{UInt8}
+    buffer_size::UInt64
+    owns_buffer::Bool
+
+    function Quote(buffer::Ptr{UInt8}, buffer_size::UInt64, owns_buffer::Bool)
+        new(buffer, buffer_size, owns_buffer)
+    end
+
+    function Quote(buffer_size::Integer)
+        buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
+        new(buffer, buffer_size, true)
+    end
+end
+
+function Base.finalizer(obj::Quote)
+    if obj.owns_buffer && obj.buffer != C_NULL
+        Base.Libc.free(obj.buffer)
+        obj.buffer = C_NULL
+    end
+    nothing
+end
+
+# Member: flag::Bool
+
+@inline function flag(obj::Quote)::Bool
+    return unsafe_load(reinterpret(Ptr{Bool}, obj.buffer + _flag_offset(obj)))
+end
+
+@inline function flag!(obj::Quote, value::Bool)
+    unsafe_store!(reinterpret(Ptr{Bool}, obj.buffer + _flag_offset(obj)), value)
+end
+
+@inline function _flag_offset(obj::Quote)::UInt64
+    return 0
+end
+
+@inline function _flag_size_aligned(obj::Quote)::UInt64
+    return 1
+end
+
+@inline function _flag_calc_size_aligned(::Type{Quote}, value::Bool)::UInt64
+    return 1
+end
+
+
+# Member: price::Float64
+
+@inline function price(obj::Quote)::Float64
+    return unsafe_load(reinterpret(Ptr{Float64}, obj.buffer + _price_offset(obj)))
+end
+
+@inline function price!(obj::Quote, value::Float64)
+    unsafe_store!(reinterpret(Ptr{Float64}, obj.buffer + _price_offset(obj)), value)
+end
+
+@inline function _price_offset(obj::Quote)::UInt64
+    return 8
+end
+
+@inline function _price_size_aligned(obj::Quote)::UInt64
+    return 8
+end
+
+@inline function _price_calc_size_aligned(::Type{Quote}, value::Float64)::UInt64
+    return 8
+end
+
+
+# Member: qty::Float32
+
+@inline function qty(obj::Quote)::Float32
+    return unsafe_load(reinterpret(Ptr{Float32}, obj.buffer + _qty_offset(obj)))
+end
+
+@inline function qty!(obj::Quote, value::Float32)
+    unsafe_store!(reinterpret(Ptr{Float32}, obj.buffer + _qty_offset(obj)), value)
+end
+
+@inline function _qty_offset(obj::Quote)::UInt64
+    return 16
+end
+
+@inline function _qty_size_aligned(obj::Quote)::UInt64
+    return 4
+end
+
+@inline function _qty_calc_size_aligned(::Type{Quote}, value::Float32)::UInt64
+    return 4
+end
+
+
+# Member: level::UInt16
+
+@inline function level(obj::Quote)::UInt16
+    return unsafe_load(reinterpret(Ptr{UInt16}, obj.buffer + _level_offset(obj)))
+end
+
+@inline function level!(obj::Quote, value::UInt16)
+    unsafe_store!(reinterpret(Ptr{UInt16}, obj.buffer + _level_offset(obj)), value)
+end
+
+@inline function _level_offset(obj::Quote)::UInt64
+    return 20
+end
+
+@inline function _level_size_aligned(obj::Quote)::UInt64
+    return 2
+end
+
+@inline function _level_calc_size_aligned(::Type{Quote}, value::UInt16)::UInt64
+    return 2
+end
+
+
+# Member: side::Side.T
+
+@inline function side(obj::Quote)::Side.T
+    return unsafe_load(reinterpret(Ptr{Side.T}, obj.buffer + _side_offset(obj)))
+end
+
+@inline function side!(obj::Quote, value::Side.T)
+    unsafe_store!(reinterpret(Ptr{Side.T}, obj.buffer + _side_offset(obj)), value)
+end
+
+@inline function _side_offset(obj::Quote)::UInt64
+    return 22
+end
+
+@inline function _side_size_aligned(obj::Quote)::UInt64
+    return 1
+end
+
+@inline function _side_calc_size_aligned(::Type{Quote}, value::Side.T)::UInt64
+    return 1
+end
+
+
+# --------------------------------------------------------------------
+
+@inline function fastbin_calc_binary_size(obj::Quote)::UInt64
+    return 24
+end
+
+@inline function fastbin_calc_binary_size(::Type{Quote})
+    24
+end
+
+"""
+Returns the stored (aligned) binary size of the object.
+This function should only be called after `fastbin_finalize!(obj)`.
+"""
+@inline function fastbin_binary_size(obj::Quote)::UInt64
+    return 24
+end
+
+"""
+Finalizes the object by writing the binary size to the beginning of its buffer.
+After calling this function, the underlying buffer can be used for serialization.
+To get the actual buffer size, call `fastbin_binary_size(obj)`.
+"""
+@inline function fastbin_finalize!(obj::Quote)
+end
+
+function show(io::IO, obj::Quote)
+    write(io, "[my_models_packed::Quote]\n    flag: ")
+    print(io, flag(obj))
+    write(io, "\n    price: ")
+    print(io, price(obj))
+    write(io, "\n    qty: ")
+    print(io, qty(obj))
+    write(io, "\n    level: ")
+    print(io, level(obj))
+    write(io, "\n    side: ")
+    print(io, side(obj))
+    write(io, "\n")
+    nothing
+end
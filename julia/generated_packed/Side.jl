@@ -0,0 +1,17 @@
+using EnumX
+
+@enumx Side::UInt8 begin
+    Buy = 0
+    Sell = 1
+end
+
+const _Side_from_string = Dict{String, Side.T}(
+    "Buy" => Side.Buy,
+    "Sell" => Side.Sell,
+)
+
+function from_string(::Type{Side.T}, str::T) where T <: AbstractString
+    get(_Side_from_string, str) do
+        throw(ArgumentError("Invalid string value for enum my_models_packed.Side: $str"))
+    end
+end
@@ -0,0 +1,16 @@
+module my_models_packed
+
+include("Side.jl")
+
+include("Quote.jl")
+include("Book.jl")
+include("Message.jl")
+
+# export all types and functions
+for n in names(@__MODULE__; all=true)
+    if Base.isidentifier(n) && n ∉ (Symbol(@__MODULE__), :eval, :include)
+        @eval export $n
+    end
+end
+
+end
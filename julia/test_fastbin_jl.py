@@ -0,0 +1,28 @@
+import os
+import sys
+
+# generator module lives next to this file, the generator-agnostic checks in the repository root
+JULIA_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(JULIA_DIR))
+sys.path.insert(0, JULIA_DIR)
+
+import fastbin_jl  # noqa: E402
+import generator_tests  # noqa: E402
+
+GENERATOR = (fastbin_jl, fastbin_jl.generate_jl_code, ".jl")
+
+
+def test_parallel_output_matches_serial():
+    generator_tests.check_parallel_output_matches_serial(*GENERATOR)
+
+
+def test_cache_detects_changed_outputs():
+    generator_tests.check_cache_detects_changed_outputs(*GENERATOR)
+
+
+def test_duplicate_enum_value_rejected():
+    generator_tests.check_duplicate_enum_value_rejected(*GENERATOR)
+
+
+if __name__ == "__main__":
+    generator_tests.run_all(*GENERATOR)
@@ -90,6 +90,32 @@ function test_UInt32Vector()
 end
 test_UInt32Vector()
 
+function test_Float32Vector()
+    buffer_size::UInt64 = 1024
+    buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
+
+    v = Float32Vector(buffer, buffer_size, true)
+    n_items::UInt32 = 23
+    vals::Vector{Float32} = [0.5f0 * i for i in 0:n_items-1]
+    values!(v, vals)
+    my_models.count!(v, n_items)
+
+    fastbin_finalize!(v)
+
+    # float32 elements take 4 bytes each, the odd count is padded to 8 bytes
+    @assert _values_size_unaligned(v) == 8 + n_items * 4
+    @assert _values_size_aligned(v) == 104
+    @assert my_models.count(v) == n_items
+    @assert all(my_models.values(v) .== vals)
+    @assert fastbin_binary_size(v) == fastbin_calc_binary_size(v)
+    @assert _count_offset(v) + _count_size_aligned(v) == fastbin_binary_size(v)
+
+    @assert fastbin_calc_binary_size(Float32Vector, vals) == fastbin_binary_size(v)
+
+    show(v)
+end
+test_Float32Vector()
+
 function test_StructVector()
     buffer_size::UInt64 = 1024
     buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
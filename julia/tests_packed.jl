@@ -0,0 +1,114 @@
+occursin("julia", pwd()) || cd("julia")
+
+include("generated_packed/models.jl");
+
+using StringViews
+using .my_models_packed
+
+function set_quote!(q::Quote, flag::Bool, price::Float64, qty::Float32, level::UInt16)
+    flag!(q, flag)
+    price!(q, price)
+    qty!(q, qty)
+    level!(q, level)
+    side!(q, flag ? Side.Buy : Side.Sell)
+    fastbin_finalize!(q)
+end
+
+function test_Quote()
+    q = Quote(24)
+
+    set_quote!(q, true, 123.45, 0.5f0, UInt16(65000))
+
+    # members end at byte 23, size is rounded up to 24
+    @assert _qty_offset(q) == 16
+    @assert _side_offset(q) == 22
+    @assert fastbin_binary_size(q) == 24
+    @assert fastbin_calc_binary_size(Quote) == 24
+
+    @assert flag(q) == true
+    @assert price(q) == 123.45
+    @assert qty(q) == 0.5f0
+    @assert level(q) == 65000
+    @assert side(q) == Side.Buy
+
+    show(q)
+end
+test_Quote()
+
+function test_Book()
+    b = Book(64)
+
+    id!(b, UInt32(4000000000))
+    set_quote!(bid(b), true, 99.5, 1.25f0, UInt16(1))
+    set_quote!(ask(b), false, 100.5, 2.5f0, UInt16(2))
+    depth!(b, UInt8(255))
+    fastbin_finalize!(b)
+
+    # nested structs start at 8-byte boundaries
+    @assert _bid_offset(b) == 8
+    @assert _ask_offset(b) == 32
+    @assert _depth_offset(b) == 56
+    @assert fastbin_binary_size(b) == 64
+
+    @assert id(b) == 4000000000
+    @assert price(bid(b)) == 99.5
+    @assert qty(bid(b)) == 1.25f0
+    @assert side(bid(b)) == Side.Buy
+    @assert price(ask(b)) == 100.5
+    @assert level(ask(b)) == 2
+    @assert side(ask(b)) == Side.Sell
+    @assert depth(b) == 255
+
+    show(b)
+end
+test_Book()
+
+function test_Message()
+    buffer_size::UInt64 = 1024
+    buffer = reinterpret(Ptr{UInt8}, Base.Libc.malloc(buffer_size))
+
+    m = Message(buffer, buffer_size, true)
+    vals::Vector{UInt16} = [1, 2, 3]
+
+    seq!(m, UInt16(65535))
+    symbol!(m, "BTCUSDT")
+    my_models_packed.count!(m, UInt8(7))
+    sizes!(m, vals)
+    id!(book(m), UInt32(42))
+    set_quote!(bid(book(m)), true, 1.5, 3.0f0, UInt16(10))
+    set_quote!(ask(book(m)), false, 2.5, 4.0f0, UInt16(20))
+    depth!(book(m), UInt8(3))
+    fastbin_finalize!(book(m))
+    flags!(m, UInt32(0xDEADBEEF))
+    my_models_packed.last!(m, Int8(-5))
+
+    fastbin_finalize!(m)
+
+    # members after variable-length members are placed at their natural alignment
+    @assert _seq_offset(m) == 8
+    @assert _symbol_offset(m) == 16
+    @assert _count_offset(m) == 32
+    @assert _sizes_offset(m) == 40
+    @assert _book_offset(m) == 56
+    @assert _flags_offset(m) == 120
+    @assert _last_offset(m) == 124
+
+    # last member ends at byte 125, the binary size is rounded up to 128
+    @assert fastbin_binary_size(m) == 128
+    @assert fastbin_binary_size(m) == fastbin_calc_binary_size(m)
+    @assert fastbin_calc_binary_size(Message, StringView("BTCUSDT"), vals) == fastbin_binary_size(m)
+
+    @assert seq(m) == 65535
+    @assert symbol(m) == "BTCUSDT"
+    @assert my_models_packed.count(m) == 7
+    @assert all(sizes(m) .== vals)
+    @assert id(book(m)) == 42
+    @assert price(bid(book(m))) == 1.5
+    @assert qty(ask(book(m))) == 4.0f0
+    @assert depth(book(m)) == 3
+    @assert flags(m) == 0xDEADBEEF
+    @assert my_models_packed.last(m) == -5
+
+    show(m)
+end
+test_Message()